@@ -295,11 +295,13 @@ def main() -> None:
         print(f"  Cargo demand: {args.cargo_demand:,.0f} tonnes")
         print(f"{'=' * 60}")
 
+        cost_matrix = build_scenario_cost_matrix(df, DEFAULT_ROBUST_SCENARIOS)
         robust_ids, z_value = select_fleet_minmax_milp(
             df,
             scenarios=DEFAULT_ROBUST_SCENARIOS,
             cargo_demand=args.cargo_demand,
             require_all_fuel_types=True,
+            cost_matrix=cost_matrix,
         )
 
         if not robust_ids:
@@ -318,7 +320,7 @@ def main() -> None:
                 print(f"  - {err}")
 
         cost_by_scenario = fleet_costs_by_scenario(
-            df, DEFAULT_ROBUST_SCENARIOS, robust_ids
+            df, DEFAULT_ROBUST_SCENARIOS, robust_ids, cost_matrix=cost_matrix
         )
         worst_cost = max(cost_by_scenario.values())
         if z_value is not None and abs(worst_cost - z_value) > 1.0:
@@ -329,7 +331,6 @@ def main() -> None:
             print(f"\n  Worst-case cost Z = ${z_value:,.2f}")
 
         # Base-scenario metrics for reporting and submission
-        cost_matrix = build_scenario_cost_matrix(df, DEFAULT_ROBUST_SCENARIOS)
         df_base = df.copy()
         df_base = df_base.assign(final_cost=cost_matrix["base"])
         robust_metrics = total_cost_and_metrics(df_base, robust_ids)
@@ -7,6 +7,8 @@ Outputs results to outputs/sensitivity/ and generates charts including sensitivi
 """
 
 import argparse
+import copy
+import functools
 import json
 import sys
 from pathlib import Path
@@ -15,6 +17,11 @@ from datetime import datetime
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 # Add project root for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -33,10 +40,19 @@ from src.sensitivity import (
 from src.visualize_sensitivity import generate_all_visualizations
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config(resolved_path: str, mtime_ns: int) -> dict:
+    """Parse one YAML file; cached per (path, mtime) so edits invalidate it."""
+    with open(resolved_path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 def load_config(config_path: Path) -> dict:
     """Load YAML config (cargo_demand_tonnes, constraints, etc.)."""
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    config_path = Path(config_path).resolve()
+    parsed = _parse_config(str(config_path), config_path.stat().st_mtime_ns)
+    # Callers may mutate the returned dict; keep the cached copy pristine
+    return copy.deepcopy(parsed)
 
 
 def run_sensitivity_using_milp(
@@ -63,15 +79,16 @@ def run_sensitivity_using_milp(
 
     # 1. Base case: standard MILP or min-max robust
     if use_minmax:
+        cost_matrix = build_scenario_cost_matrix(df, DEFAULT_ROBUST_SCENARIOS)
         selected_base, z_value = select_fleet_minmax_milp(
             df,
             scenarios=DEFAULT_ROBUST_SCENARIOS,
             cargo_demand=cargo_demand,
             require_all_fuel_types=True,
+            cost_matrix=cost_matrix,
         )
         if selected_base:
             # Report metrics in base scenario (cost matrix "base")
-            cost_matrix = build_scenario_cost_matrix(df, DEFAULT_ROBUST_SCENARIOS)
             df_base = df.copy()
             df_base = df_base.assign(final_cost=cost_matrix["base"])
             results["base_case"] = {
@@ -311,6 +328,17 @@ def main() -> None:
         default="",
         help="Suffix for plot filenames (e.g. _milp or _minmax)",
     )
+    parser.add_argument(
+        "--plot-format",
+        choices=["png", "svg", "pdf"],
+        default="png",
+        help="Chart file format (svg/pdf write vector charts without rasterising)",
+    )
+    parser.add_argument(
+        "--force-plots",
+        action="store_true",
+        help="Redraw every chart, even those whose inputs and plotting code are unchanged",
+    )
     args = parser.parse_args()
 
     root = Path(__file__).resolve().parent
@@ -365,6 +393,8 @@ def main() -> None:
             results_dir=str(output_dir),
             output_dir=str(output_dir / "plots"),
             suffix=args.suffix,
+            fmt=args.plot_format,
+            force=args.force_plots,
         )
 
         json_file = output_dir / f"sensitivity_results_{timestamp}.json"
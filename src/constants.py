@@ -5,6 +5,13 @@ Single source of truth for all values from the SOP (Nickolas.md) and
 calculation_factors.xlsx. Every constant references its SOP section.
 """
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 # ---------------------------------------------------------------------------
 # 1. Monthly cargo demand (SOP Step 7.1)
 #    54,920,000 tonnes annual / 12 months
@@ -133,6 +140,13 @@ CAPEX_BASE_COST_M: list[tuple[int, float, int]] = [
     (120_000, float("inf"),  90),
 ]
 
+# Bracket upper bounds and costs as arrays for np.searchsorted lookups.
+# side="left" makes each upper bound inclusive, matching the brackets above;
+# the inclusive 10,000 lower bound is checked separately.
+_CAPEX_MIN_DWT: int = CAPEX_BASE_COST_M[0][0]
+_CAPEX_UPPERS: np.ndarray = np.array([upper for _, upper, _ in CAPEX_BASE_COST_M])
+_CAPEX_COSTS: np.ndarray = np.array([cost for _, _, cost in CAPEX_BASE_COST_M], dtype=float)
+
 # ---------------------------------------------------------------------------
 # 14. CAPEX fuel-type multiplier (SOP Step 6c.2)
 # ---------------------------------------------------------------------------
@@ -159,6 +173,12 @@ SAFETY_ADJUSTMENT_RATES: dict[int, float] = {
     5: -0.05,
 }
 
+# Same rates as a flat array indexed directly by safety score (index 0 is NaN,
+# not a rate), for column-wise lookups via get_safety_adjustment_rates
+SAFETY_ADJUSTMENT_RATE_BY_SCORE: np.ndarray = np.array(
+    [np.nan] + [SAFETY_ADJUSTMENT_RATES[s] for s in range(1, 6)]
+)
+
 # ---------------------------------------------------------------------------
 # 16. Global Warming Potentials (SOP Step 5c)
 #     CH4 = 28 (NOT 25), N2O = 265 (NOT 298)
@@ -206,15 +226,35 @@ def get_base_capex_millions(dwt: int) -> float:
     Others: lower < DWT <= upper.
     Last bracket: DWT > 120,000.
     """
-    for i, (lower, upper, cost) in enumerate(CAPEX_BASE_COST_M):
-        if i == 0:
-            # First bracket: inclusive both ends
-            if lower <= dwt <= upper:
-                return float(cost)
-        else:
-            if lower < dwt <= upper:
-                return float(cost)
-    raise ValueError(f"DWT {dwt} out of range for CAPEX brackets")
+    if not dwt >= _CAPEX_MIN_DWT:  # also rejects NaN
+        raise ValueError(f"DWT {dwt} out of range for CAPEX brackets")
+    return float(_CAPEX_COSTS[np.searchsorted(_CAPEX_UPPERS, dwt, side="left")])
+
+
+def get_base_capex_millions_array(dwt: np.ndarray) -> np.ndarray:
+    """
+    Vectorised ``get_base_capex_millions`` over an array of DWT values.
+
+    Raises ValueError if any DWT is NaN or below the first bracket.
+    """
+    dwt = np.asarray(dwt)
+    bad = ~(dwt >= _CAPEX_MIN_DWT)  # NaN compares False
+    if bad.any():
+        raise ValueError(f"DWT {dwt[bad][0]} out of range for CAPEX brackets")
+    return _CAPEX_COSTS[np.searchsorted(_CAPEX_UPPERS, dwt, side="left")]
+
+
+def get_safety_adjustment_rates(scores: np.ndarray) -> np.ndarray:
+    """
+    Vectorised ``SAFETY_ADJUSTMENT_RATES`` lookup (SOP Step 6d).
+
+    Raises ValueError if any score is not one of 1-5 (including NaN).
+    """
+    scores = np.asarray(scores)
+    valid = np.isin(scores, list(SAFETY_ADJUSTMENT_RATES))
+    if not valid.all():
+        raise ValueError(f"Safety scores must be 1-5, got {sorted(set(scores[~valid].tolist()))}")
+    return SAFETY_ADJUSTMENT_RATE_BY_SCORE[scores.astype(np.intp)]
 
 
 def get_capex_multiplier(fuel_type_csv: str) -> float:
@@ -241,3 +281,17 @@ def get_monthly_capex(dwt: int, fuel_type_csv: str) -> float:
     s = SALVAGE_RATE * ship_cost
     annual = ((ship_cost - s) * CRF) + (DISCOUNT_RATE * s)
     return annual / 12
+
+
+def get_monthly_capex_array(dwt: np.ndarray, fuel_type_csv: "pd.Series") -> np.ndarray:
+    """
+    Vectorised ``get_monthly_capex`` for a whole fleet (SOP Step 6c).
+
+    Same arithmetic, in the same order, as the scalar version so the
+    results are bit-identical.
+    """
+    multiplier = fuel_type_csv.map(get_capex_multiplier).to_numpy(dtype=float)
+    ship_cost = get_base_capex_millions_array(dwt) * multiplier * 1_000_000
+    s = SALVAGE_RATE * ship_cost
+    annual = ((ship_cost - s) * CRF) + (DISCOUNT_RATE * s)
+    return annual / 12
@@ -19,8 +19,8 @@ from src.constants import (
     FUEL_PRICE_USD_PER_TONNE,
     FUEL_TYPE_MAP,
     GWP,
-    SAFETY_ADJUSTMENT_RATES,
-    get_monthly_capex,
+    get_monthly_capex_array,
+    get_safety_adjustment_rates,
 )
 from src.utils import data_path, project_root
 
@@ -45,6 +45,21 @@ REQUIRED_COLUMNS: list[str] = [
     "risk_premium",
     "final_cost",
 ]
+_REQUIRED_SET: frozenset[str] = frozenset(REQUIRED_COLUMNS)
+
+# Columns read from df_active.csv by aggregate_df_active, with compact dtypes
+_DF_ACTIVE_DTYPES: dict[str, str] = {
+    "vessel_id": "int32",
+    "dwt": "int32",
+    "safety_score": "int8",
+    "main_engine_fuel_type": "category",
+    "FC_me": "float64",
+    "FC_ae": "float64",
+    "FC_ab": "float64",
+    "E_CO2_total": "float64",
+    "E_CH4_total": "float64",
+    "E_N2O_total": "float64",
+}
 
 # Production expectations
 _EXPECTED_ROWS = 108
@@ -94,15 +109,22 @@ def load_per_vessel(path: str | Path | None = None) -> pd.DataFrame:
                 f"No per_vessel.csv at {csv_path} and no fixture fallback at {fixture_path}"
             )
 
-    df = pd.read_csv(csv_path)
+    # Parse only the contract columns; anything else in the file is dropped.
+    # Fuel type is low-cardinality, so it is held as a categorical.
+    df = pd.read_csv(
+        csv_path,
+        usecols=lambda c: c in _REQUIRED_SET,
+        dtype={"main_engine_fuel_type": "category"},
+    )
 
     # --- Validate columns ---------------------------------------------------
-    missing = set(REQUIRED_COLUMNS) - set(df.columns)
+    missing = _REQUIRED_SET.difference(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {sorted(missing)}")
 
     # --- Validate no NaN in required columns --------------------------------
-    nan_cols = [c for c in REQUIRED_COLUMNS if df[c].isna().any()]
+    nan_mask = df[REQUIRED_COLUMNS].isna().any()
+    nan_cols = nan_mask.index[nan_mask].tolist()
     if nan_cols:
         raise ValueError(f"NaN values found in columns: {nan_cols}")
 
@@ -152,65 +174,83 @@ def aggregate_df_active(
         output_path = data_path("processed", "per_vessel.csv")
     output_path = Path(output_path)
 
-    df = pd.read_csv(input_path)
+    # Only the columns Steps 5c-6f read; ints and the fuel label are stored
+    # narrow, fuel/emission sums stay float64 so costs are not perturbed.
+    df = pd.read_csv(
+        input_path,
+        usecols=list(_DF_ACTIVE_DTYPES),
+        dtype=_DF_ACTIVE_DTYPES,
+    )
 
-    # --- Step 5c: Aggregate per vessel ---
-    agg = df.groupby("vessel_id").agg(
+    # --- Step 5c: Aggregate per vessel (static vessel info rides along) ---
+    pv = df.groupby("vessel_id").agg(
         FC_me_total=("FC_me", "sum"),
         FC_ae_total=("FC_ae", "sum"),
         FC_ab_total=("FC_ab", "sum"),
         E_CO2_total=("E_CO2_total", "sum"),
         E_CH4_total=("E_CH4_total", "sum"),
         E_N2O_total=("E_N2O_total", "sum"),
+        dwt=("dwt", "first"),
+        safety_score=("safety_score", "first"),
+        main_engine_fuel_type=("main_engine_fuel_type", "first"),
     ).reset_index()
 
-    agg["FC_total"] = agg["FC_me_total"] + agg["FC_ae_total"] + agg["FC_ab_total"]
-    agg["CO2eq"] = (
-        1 * agg["E_CO2_total"]
-        + GWP["CH4"] * agg["E_CH4_total"]
-        + GWP["N2O"] * agg["E_N2O_total"]
+    pv["FC_total"] = pv["FC_me_total"] + pv["FC_ae_total"] + pv["FC_ab_total"]
+    pv["CO2eq"] = (
+        1 * pv["E_CO2_total"]
+        + GWP["CH4"] * pv["E_CH4_total"]
+        + GWP["N2O"] * pv["E_N2O_total"]
     )
 
-    # --- Merge static vessel info ---
-    static_cols = ["vessel_id", "dwt", "safety_score", "main_engine_fuel_type"]
-    vessel_static = df[static_cols].drop_duplicates("vessel_id")
-    pv = agg.merge(vessel_static, on="vessel_id")
+    # Steps 6a-6f are computed on plain arrays and assigned back in one block,
+    # so no intermediate Series is materialised per step.
+    fc_me = pv["FC_me_total"].to_numpy()
+    fc_aux = pv["FC_ae_total"].to_numpy() + pv["FC_ab_total"].to_numpy()
+    co2eq = pv["CO2eq"].to_numpy()
 
     # --- Step 6a: Fuel cost ---
     # ME fuel priced at ME fuel type; AE/AB always Distillate
     price_distillate = FUEL_PRICE_USD_PER_TONNE["Distillate fuel"]
-    pv["price_me"] = pv["main_engine_fuel_type"].map(
+    price_me = pv["main_engine_fuel_type"].map(
         lambda ft: FUEL_PRICE_USD_PER_TONNE[FUEL_TYPE_MAP.get(ft, ft)]
-    )
-    pv["fuel_cost"] = (
-        pv["FC_me_total"] * pv["price_me"]
-        + (pv["FC_ae_total"] + pv["FC_ab_total"]) * price_distillate
-    )
+    ).to_numpy()
+    fuel_cost = fc_me * price_me + fc_aux * price_distillate
 
     # --- Step 6b: Carbon cost ---
-    pv["carbon_cost"] = pv["CO2eq"] * CARBON_PRICE
+    carbon_cost = co2eq * CARBON_PRICE
 
     # --- Step 6c: Monthly CAPEX ---
-    pv["monthly_capex"] = pv.apply(
-        lambda r: get_monthly_capex(r["dwt"], r["main_engine_fuel_type"]),
-        axis=1,
+    monthly_capex = get_monthly_capex_array(
+        pv["dwt"].to_numpy(), pv["main_engine_fuel_type"]
     )
 
     # --- Step 6d: Total monthly cost ---
-    pv["total_monthly"] = pv["fuel_cost"] + pv["carbon_cost"] + pv["monthly_capex"]
+    total_monthly = fuel_cost + carbon_cost + monthly_capex
 
     # --- Step 6e: Risk premium ---
-    pv["adj_rate"] = pv["safety_score"].map(SAFETY_ADJUSTMENT_RATES)
-    pv["risk_premium"] = pv["total_monthly"] * pv["adj_rate"]
+    adj_rate = get_safety_adjustment_rates(pv["safety_score"].to_numpy())
+    risk_premium = total_monthly * adj_rate
 
     # --- Step 6f: Final cost ---
-    pv["final_cost"] = pv["total_monthly"] + pv["risk_premium"]
+    final_cost = total_monthly + risk_premium
+
+    pv = pv.assign(
+        fuel_cost=fuel_cost,
+        carbon_cost=carbon_cost,
+        monthly_capex=monthly_capex,
+        total_monthly=total_monthly,
+        adj_rate=adj_rate,
+        risk_premium=risk_premium,
+        final_cost=final_cost,
+    )
 
     # --- Select and order output columns ---
     out_cols = REQUIRED_COLUMNS
     pv = pv[out_cols]
 
     # --- Write ---
+    # Stays on pandas' CSV writer: 108 rows is not I/O-bound, pyarrow is not a
+    # project dependency, and its float formatting would change the file.
     output_path.parent.mkdir(parents=True, exist_ok=True)
     pv.to_csv(output_path, index=False)
     print(f"Wrote {len(pv)} vessels to {output_path}")
@@ -260,7 +300,9 @@ def validate_per_vessel(df: pd.DataFrame) -> tuple[bool, list[str]]:
         )
 
     # 6. No NaN in required columns
-    nan_cols = [c for c in REQUIRED_COLUMNS if c in df.columns and df[c].isna().any()]
+    present = [c for c in REQUIRED_COLUMNS if c in df.columns]
+    nan_mask = df[present].isna().any()
+    nan_cols = nan_mask.index[nan_mask].tolist()
     if nan_cols:
         errors.append(f"NaN values in columns: {nan_cols}")
 
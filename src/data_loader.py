@@ -1 +1,9 @@
-"""Data loading — replaced by per_vessel.csv adapter. See src/data_adapter.py."""
+"""Data loading — replaced by per_vessel.csv adapter. See src/data_adapter.py.
+
+Kept as a thin re-export so older ``src.data_loader`` imports resolve to the
+single implementation in ``src.data_adapter`` instead of a drifting copy.
+"""
+
+from src.data_adapter import REQUIRED_COLUMNS, load_per_vessel, validate_per_vessel
+
+__all__ = ["REQUIRED_COLUMNS", "load_per_vessel", "validate_per_vessel"]
@@ -7,10 +7,22 @@ Objective: minimize total cost subject to:
 - Each ship at most once (no repeat trips)
 """
 
+import functools
+import os
+import warnings
 from typing import Any
 
+import numpy as np
 import pandas as pd
-from pulp import LpBinary, LpMinimize, LpProblem, LpVariable, PULP_CBC_CMD, lpSum
+from pulp import (
+    HiGHS,
+    LpAffineExpression,
+    LpBinary,
+    LpMinimize,
+    LpProblem,
+    LpVariable,
+    PULP_CBC_CMD,
+)
 
 from src.constants import CARBON_PRICE, MONTHLY_DEMAND, SAFETY_THRESHOLD
 
@@ -25,6 +37,98 @@ DEFAULT_ROBUST_SCENARIOS: dict[str, dict[str, float]] = {
 }
 
 
+# In-process HiGHS (highspy) avoids CBC's subprocess spawn and LP-file round
+# trip; checked once at import so solver_name="highs" can fall back to CBC.
+_HIGHS_AVAILABLE: bool = bool(HiGHS(msg=False).available())
+_SOLVER_THREADS: int = os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=32)
+def default_solver(
+    warm_start: bool = False,
+    threads: int | None = None,
+    gap_rel: float | None = None,
+    time_limit: float | None = None,
+    solver_name: str | None = None,
+):
+    """
+    PuLP solver used for every fleet MILP: CBC unless HiGHS is asked for.
+
+    solver_name ("highs" or "cbc", default CBC) selects the backend; asking
+    for HiGHS without highspy installed warns and falls back to CBC. The
+    choice never depends on the other arguments, so every solve in a sweep
+    runs on the same backend.
+
+    HiGHS runs with presolve and parallel search forced on across all cores
+    and, like CBC, proves optimality (gap 0) unless gap_rel says otherwise.
+    With warm_start=True CBC is handed the variables' initial values (set via
+    ``LpVariable.setInitialValue``) as a MIP start; PuLP's HiGHS interface has
+    no MIP start, so HiGHS ignores it.
+
+    threads, gap_rel and time_limit (seconds) override the solver defaults when
+    given. CBC defaults to one thread and a proven optimum; a gap or time limit
+    trades that guarantee for speed, and multi-threaded CBC may break ties
+    between equal-cost fleets differently from run to run.
+
+    Solver objects hold only their options, so one instance per distinct
+    setting is built and shared by every solve; callers must not mutate it.
+    """
+    if solver_name not in (None, "highs", "cbc"):
+        raise ValueError(f"Unknown solver_name {solver_name!r}; expected 'highs' or 'cbc'")
+    use_highs = solver_name == "highs" and _HIGHS_AVAILABLE
+    if solver_name == "highs" and not _HIGHS_AVAILABLE:
+        warnings.warn("HiGHS requested but highspy is not installed; using CBC", stacklevel=2)
+    if use_highs:
+        return HiGHS(
+            msg=False,
+            threads=threads or _SOLVER_THREADS,
+            gapRel=gap_rel if gap_rel is not None else 0.0,
+            timeLimit=time_limit,
+            presolve="on",
+            parallel="on",
+        )
+    return PULP_CBC_CMD(
+        msg=0,
+        warmStart=warm_start,
+        threads=threads,
+        gapRel=gap_rel,
+        timeLimit=time_limit,
+    )
+
+
+def _linear_expr(x: dict, coeffs) -> LpAffineExpression:
+    """sum_i coeffs[i] * x[i] built in one shot (x and coeffs share positional order)."""
+    return LpAffineExpression(zip(x.values(), coeffs))
+
+
+def solution_values(x: dict) -> np.ndarray:
+    """Solved values of x in positional order, read once into one float array."""
+    return np.fromiter((v.varValue for v in x.values()), dtype=float, count=len(x))
+
+
+def fuel_type_groups(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Positional row indices per main_engine_fuel_type, in order of first appearance."""
+    return df.groupby("main_engine_fuel_type", sort=False, observed=True).indices
+
+
+def add_fuel_diversity_rows(
+    prob: LpProblem,
+    xs: list[LpVariable],
+    fuel_groups: dict[str, np.ndarray],
+) -> None:
+    """
+    At least one vessel per fuel type in fuel_groups.
+
+    A fuel type with a single vessel fixes that vessel's lower bound to 1
+    instead of adding a row, so presolve drops it from branching.
+    """
+    for ft, rows in fuel_groups.items():
+        if len(rows) == 1:
+            xs[rows[0]].lowBound = 1
+        else:
+            prob += LpAffineExpression((xs[j], 1) for j in rows) >= 1, f"Fuel_{ft}"
+
+
 def build_scenario_cost_matrix(
     df: pd.DataFrame,
     scenarios: dict[str, dict[str, float]],
@@ -36,32 +140,48 @@ def build_scenario_cost_matrix(
     final_cost_s = final_cost - carbon_cost + CO2eq * scenario_carbon_price.
     Returns DataFrame with index = df.index, columns = scenario names.
     """
+    co2eq = df["CO2eq"].to_numpy(dtype=float)
     if "carbon_cost" in df.columns:
-        original_carbon = df["carbon_cost"]
+        original_carbon = df["carbon_cost"].to_numpy(dtype=float)
     else:
-        original_carbon = df["CO2eq"] * CARBON_PRICE
-    base_final = df["final_cost"]
-    co2eq = df["CO2eq"]
+        original_carbon = co2eq * CARBON_PRICE
+    non_carbon = df["final_cost"].to_numpy(dtype=float) - original_carbon
+    prices = np.array([float(p["carbon_price"]) for p in scenarios.values()])
 
-    out = pd.DataFrame(index=df.index)
-    for name, params in scenarios.items():
-        cp = float(params["carbon_price"])
-        out[name] = base_final - original_carbon + co2eq * cp
-    return out
+    # (vessels, 1) + (vessels, 1) * (1, scenarios) -> (vessels, scenarios)
+    matrix = non_carbon[:, None] + co2eq[:, None] * prices[None, :]
+    return pd.DataFrame(matrix, index=df.index, columns=list(scenarios))
+
+
+def selected_rows(df: pd.DataFrame, selected_ids) -> np.ndarray:
+    """
+    Ascending row positions of df whose vessel_id is in selected_ids.
+
+    Unknown ids are ignored, as with isin. Positions are computed from the
+    frame on every call, so in-place edits (e.g. sort_values(inplace=True))
+    are always seen.
+    """
+    return np.flatnonzero(df["vessel_id"].isin(list(selected_ids)).to_numpy())
 
 
 def fleet_costs_by_scenario(
     df: pd.DataFrame,
     scenarios: dict[str, dict[str, float]],
     selected_ids: list[int],
+    cost_matrix: pd.DataFrame | None = None,
 ) -> dict[str, float]:
-    """Total cost of the selected fleet under each scenario (for validation/reporting)."""
-    cost_matrix = build_scenario_cost_matrix(df, scenarios)
-    mask = df["vessel_id"].isin(selected_ids)
-    return {
-        sname: float(cost_matrix.loc[mask, sname].sum())
-        for sname in scenarios
-    }
+    """
+    Total cost of the selected fleet under each scenario (for validation/reporting).
+
+    Pass the ``cost_matrix`` already built for ``select_fleet_minmax_milp`` to
+    skip recomputing it; otherwise only the selected rows are priced.
+    """
+    rows = selected_rows(df, selected_ids)
+    if cost_matrix is None:
+        totals = build_scenario_cost_matrix(df.iloc[rows], scenarios).sum()
+    else:
+        totals = cost_matrix[list(scenarios)].iloc[rows].sum()
+    return {sname: float(totals[sname]) for sname in scenarios}
 
 
 def validate_fleet(
@@ -70,22 +190,36 @@ def validate_fleet(
     cargo_demand_tonnes: float,
     min_avg_safety: float,
     require_all_fuel_types: bool,
+    fail_fast: bool = False,
 ) -> tuple[bool, list[str]]:
-    """Check constraints. Returns (ok, list of error messages)."""
-    subset = df[df["vessel_id"].isin(selected_ids)]
+    """
+    Check constraints. Returns (ok, list of error messages).
+
+    With fail_fast=True, returns after the first failing check (for internal
+    sanity checks that only need ok); user-facing callers keep the full list.
+    """
+    rows = selected_rows(df, selected_ids)
     errors = []
 
-    if subset["dwt"].sum() < cargo_demand_tonnes:
+    total_dwt = df["dwt"].to_numpy()[rows].sum()
+    if total_dwt < cargo_demand_tonnes:
         errors.append(
-            f"Combined DWT {subset['dwt'].sum()} < demand {cargo_demand_tonnes}"
+            f"Combined DWT {total_dwt} < demand {cargo_demand_tonnes}"
         )
-    if subset["safety_score"].mean() < min_avg_safety:
+        if fail_fast:
+            return False, errors
+    safety = df["safety_score"].to_numpy()[rows]
+    avg_safety = safety.mean() if safety.size else float("nan")
+    if avg_safety < min_avg_safety:
         errors.append(
-            f"Average safety score {subset['safety_score'].mean():.2f} < {min_avg_safety}"
+            f"Average safety score {avg_safety:.2f} < {min_avg_safety}"
         )
+        if fail_fast:
+            return False, errors
     if require_all_fuel_types:
-        all_types = set(df["main_engine_fuel_type"].dropna().unique())
-        selected_types = set(subset["main_engine_fuel_type"].dropna().unique())
+        fuel = df["main_engine_fuel_type"]
+        all_types = set(fuel.dropna().unique())
+        selected_types = set(fuel.iloc[rows].dropna().unique())
         missing = all_types - selected_types
         if missing:
             errors.append(f"Missing main_engine_fuel_type: {missing}")
@@ -101,15 +235,16 @@ def total_cost_and_metrics(
     co2e_col: str = "CO2eq",
 ) -> dict[str, Any]:
     """Aggregate total DWT, cost, fuel, CO2e, avg safety, unique fuel types, fleet size."""
-    subset = df[df["vessel_id"].isin(selected_ids)]
+    rows = selected_rows(df, selected_ids)
+    safety = df["safety_score"].to_numpy()[rows]
     return {
-        "total_dwt": subset["dwt"].sum(),
-        "total_cost_usd": subset[cost_col].sum(),
-        "avg_safety_score": subset["safety_score"].mean(),
-        "num_unique_main_engine_fuel_types": subset["main_engine_fuel_type"].nunique(),
+        "total_dwt": df["dwt"].to_numpy()[rows].sum(),
+        "total_cost_usd": df[cost_col].to_numpy()[rows].sum(),
+        "avg_safety_score": safety.mean() if safety.size else float("nan"),
+        "num_unique_main_engine_fuel_types": df["main_engine_fuel_type"].iloc[rows].nunique(),
         "fleet_size": len(selected_ids),
-        "total_fuel_tonnes": subset[fuel_col].sum(),
-        "total_co2e_tonnes": subset[co2e_col].sum(),
+        "total_fuel_tonnes": df[fuel_col].to_numpy()[rows].sum(),
+        "total_co2e_tonnes": df[co2e_col].to_numpy()[rows].sum(),
     }
 
 
@@ -119,6 +254,10 @@ def select_fleet_milp(
     min_avg_safety: float = SAFETY_THRESHOLD,
     require_all_fuel_types: bool = True,
     co2_cap: float | None = None,
+    threads: int | None = None,
+    gap_rel: float | None = None,
+    time_limit: float | None = None,
+    solver_name: str | None = None,
 ) -> list[int]:
     """
     Select minimum-cost fleet via binary MILP.
@@ -131,48 +270,123 @@ def select_fleet_milp(
         3. For each fuel type f: sum(x_i where fuel==f) >= 1  (if require_all_fuel_types)
         4. sum(x_i * co2eq_i) <= co2_cap  (if co2_cap is not None)
 
+    threads, gap_rel, time_limit and solver_name are passed to
+    ``default_solver`` for every solve made here. Left at None, the solve runs
+    single-threaded on CBC to a proven optimum; solver_name="highs" switches
+    to HiGHS on all cores, still to a zero gap.
+
     Returns sorted list of selected vessel_id integers, or empty list if infeasible.
     """
     indices = list(df.index)
-    vessel_ids = df["vessel_id"].tolist()
-    costs = df["final_cost"].tolist()
-    dwts = df["dwt"].tolist()
-    safety_deltas = (df["safety_score"] - min_avg_safety).tolist()
+    vessel_ids = df["vessel_id"].to_numpy()
+    costs = df["final_cost"].to_numpy(dtype=float)
+    dwts = df["dwt"].to_numpy(dtype=float)
+    safety_deltas = df["safety_score"].to_numpy(dtype=float) - min_avg_safety
 
     prob = LpProblem("fleet_selection", LpMinimize)
     x = LpVariable.dicts("x", indices, 0, 1, LpBinary)
 
     # Objective: minimize total cost
-    prob += lpSum([costs[i] * x[i] for i in indices])
+    prob += _linear_expr(x, costs)
 
     # Constraint 1: DWT >= cargo demand
-    prob += lpSum([dwts[i] * x[i] for i in indices]) >= cargo_demand, "DWT"
+    prob += _linear_expr(x, dwts) >= cargo_demand, "DWT"
 
     # Constraint 2: linearized average safety >= threshold
-    prob += lpSum([safety_deltas[i] * x[i] for i in indices]) >= 0, "Safety"
+    prob += _linear_expr(x, safety_deltas) >= 0, "Safety"
 
     # Constraint 3: fuel diversity — at least one vessel per fuel type
+    xs = list(x.values())
+    fuel_groups = fuel_type_groups(df) if require_all_fuel_types else {}
     if require_all_fuel_types:
-        fuel_types = df["main_engine_fuel_type"].unique()
-        for ft in fuel_types:
-            ft_indices = df.index[df["main_engine_fuel_type"] == ft].tolist()
-            prob += lpSum([x[i] for i in ft_indices]) >= 1, f"Fuel_{ft}"
+        add_fuel_diversity_rows(prob, xs, fuel_groups)
 
     # Constraint 4 (optional): CO2eq emissions cap
     if co2_cap is not None:
-        co2eqs = df["CO2eq"].tolist()
-        prob += lpSum([co2eqs[i] * x[i] for i in indices]) <= co2_cap, "CO2_cap"
-
-    prob.solve(PULP_CBC_CMD(msg=0))
+        co2eqs = df["CO2eq"].to_numpy(dtype=float)
+        prob += _linear_expr(x, co2eqs) <= co2_cap, "CO2_cap"
+
+    solver = default_solver(
+        threads=threads,
+        gap_rel=gap_rel,
+        time_limit=time_limit,
+        solver_name=solver_name,
+    )
+    prob.solve(solver)
 
     # Status 1 = Optimal
     if prob.status != 1:
         return []
 
-    selected = sorted(
-        [int(vessel_ids[i]) for i in indices if x[i].varValue > 0.5]
-    )
-    return selected
+    chosen = solution_values(x) > 0.5
+    return sorted(vessel_ids[chosen].astype(int).tolist())
+
+
+def build_fleet_model(
+    df: pd.DataFrame,
+    require_all_fuel_types: bool = True,
+) -> dict[str, Any]:
+    """
+    Build the select_fleet_milp model once, for repeated solves via solve_fleet_model.
+
+    Sensitivity sweeps re-solve the same fleet with a different demand, safety
+    threshold or cost vector; keeping the model avoids rebuilding every row in
+    Python and lets each solve warm-start from the previous optimum. The
+    DWT right-hand side and safety coefficients are set per solve.
+    """
+    indices = list(df.index)
+    prob = LpProblem("fleet_selection", LpMinimize)
+    x = LpVariable.dicts("x", indices, 0, 1, LpBinary)
+    xs = list(x.values())
+
+    prob += _linear_expr(x, df["final_cost"].to_numpy(dtype=float))
+    prob += _linear_expr(x, df["dwt"].to_numpy(dtype=float)) >= 0, "DWT"
+    prob += _linear_expr(x, np.zeros(len(xs))) >= 0, "Safety"
+    if require_all_fuel_types:
+        add_fuel_diversity_rows(prob, xs, fuel_type_groups(df))
+
+    return {
+        "prob": prob,
+        "x": x,
+        "vessel_ids": df["vessel_id"].to_numpy(),
+        "safety": df["safety_score"].to_numpy(dtype=float),
+        "solved": False,
+    }
+
+
+def solve_fleet_model(
+    model: dict[str, Any],
+    cargo_demand: float = MONTHLY_DEMAND,
+    min_avg_safety: float = SAFETY_THRESHOLD,
+    costs=None,
+    warm_start: bool = False,
+) -> list[int]:
+    """
+    Re-solve a model from build_fleet_model with new parameters.
+
+    Updates the DWT right-hand side, the linearised safety coefficients and,
+    if costs is given (one per vessel, in row order), the objective. With
+    warm_start=True the previous solution is passed to CBC as a MIP start;
+    worth it when it stays feasible (e.g. cost-only changes), not across
+    thresholds.
+
+    Returns sorted list of selected vessel_id integers, or empty list if infeasible.
+    """
+    prob, x = model["prob"], model["x"]
+    if costs is not None:
+        prob.setObjective(_linear_expr(x, np.asarray(costs, dtype=float)))
+    prob.constraints["DWT"].changeRHS(cargo_demand)
+    safety_row = prob.constraints["Safety"].expr
+    for v, delta in zip(x.values(), model["safety"] - min_avg_safety):
+        safety_row[v] = delta
+
+    prob.solve(default_solver(warm_start=warm_start and model["solved"]))
+    if prob.status != 1:
+        return []
+    model["solved"] = True
+
+    chosen = solution_values(x) > 0.5
+    return sorted(model["vessel_ids"][chosen].astype(int).tolist())
 
 
 def select_fleet_minmax_milp(
@@ -180,6 +394,7 @@ def select_fleet_minmax_milp(
     scenarios: dict[str, dict[str, float]],
     cargo_demand: float,
     require_all_fuel_types: bool = True,
+    cost_matrix: pd.DataFrame | None = None,
 ) -> tuple[list[int], float | None]:
     """
     Select min-max robust fleet: one fleet minimising worst-case cost across scenarios.
@@ -189,19 +404,23 @@ def select_fleet_minmax_milp(
     For each scenario s: sum_i c_{i,s} x_i <= Z.
     Same structural constraints: DWT, linearised safety (strictest threshold), fuel diversity.
 
+    ``cost_matrix`` may be passed in (from ``build_scenario_cost_matrix``) so
+    the caller can reuse it for ``fleet_costs_by_scenario`` and reporting.
+
     Returns (selected_vessel_ids, Z_value). Empty list and None if infeasible.
     """
-    cost_matrix = build_scenario_cost_matrix(df_per_vessel, scenarios)
+    if cost_matrix is None:
+        cost_matrix = build_scenario_cost_matrix(df_per_vessel, scenarios)
     min_avg_safety_robust = max(
         float(s["min_avg_safety"]) for s in scenarios.values()
     )
 
     indices = list(df_per_vessel.index)
-    vessel_ids = df_per_vessel["vessel_id"].tolist()
-    dwts = df_per_vessel["dwt"].tolist()
+    vessel_ids = df_per_vessel["vessel_id"].to_numpy()
+    dwts = df_per_vessel["dwt"].to_numpy(dtype=float)
     safety_deltas = (
-        df_per_vessel["safety_score"] - min_avg_safety_robust
-    ).tolist()
+        df_per_vessel["safety_score"].to_numpy(dtype=float) - min_avg_safety_robust
+    )
 
     prob = LpProblem("fleet_minmax_robust", LpMinimize)
     x = LpVariable.dicts("x", indices, 0, 1, LpBinary)
@@ -212,56 +431,63 @@ def select_fleet_minmax_milp(
 
     # Robust cost: for each scenario s, sum_i c[i,s]*x[i] <= Z
     for sname in scenarios:
-        costs_s = cost_matrix[sname].tolist()
+        costs_s = cost_matrix[sname].to_numpy(dtype=float)
         prob += (
-            lpSum([costs_s[i] * x[i] for i in indices]) <= Z_var,
+            _linear_expr(x, costs_s) <= Z_var,
             f"Cost_{sname}",
         )
 
     # DWT >= cargo demand
     prob += (
-        lpSum([dwts[i] * x[i] for i in indices]) >= cargo_demand,
+        _linear_expr(x, dwts) >= cargo_demand,
         "DWT",
     )
 
     # Linearised average safety >= strictest threshold
     prob += (
-        lpSum([safety_deltas[i] * x[i] for i in indices]) >= 0,
+        _linear_expr(x, safety_deltas) >= 0,
         "Safety",
     )
 
     # Fuel diversity
     if require_all_fuel_types:
-        fuel_types = df_per_vessel["main_engine_fuel_type"].unique()
-        for ft in fuel_types:
-            ft_indices = df_per_vessel.index[
-                df_per_vessel["main_engine_fuel_type"] == ft
-            ].tolist()
-            prob += lpSum([x[i] for i in ft_indices]) >= 1, f"Fuel_{ft}"
+        add_fuel_diversity_rows(prob, list(x.values()), fuel_type_groups(df_per_vessel))
 
-    prob.solve(PULP_CBC_CMD(msg=0))
+    prob.solve(default_solver())
 
     if prob.status != 1:
         return [], None
 
-    selected = sorted(
-        [int(vessel_ids[i]) for i in indices if x[i].varValue > 0.5]
-    )
+    chosen = solution_values(x) > 0.5
+    selected = sorted(vessel_ids[chosen].astype(int).tolist())
     z_value = float(Z_var.varValue) if Z_var.varValue is not None else None
     return selected, z_value
 
 
+def _normalize_metrics(metrics: dict[str, Any]) -> dict[str, Any]:
+    """Round/cast the reported metrics once, shared by both output formats."""
+    return {
+        **metrics,
+        "avg_safety_score": round(metrics["avg_safety_score"], 2),
+        "total_co2e_tonnes": round(metrics["total_co2e_tonnes"], 2),
+        "total_fuel_tonnes": round(metrics["total_fuel_tonnes"], 2),
+        "num_unique_main_engine_fuel_types": int(metrics["num_unique_main_engine_fuel_types"]),
+        "fleet_size": int(metrics["fleet_size"]),
+    }
+
+
 def format_outputs(metrics: dict[str, Any], sensitivity_done: bool = False) -> dict[str, Any]:
     """Format for report / console."""
+    m = _normalize_metrics(metrics)
     return {
-        "Total DWT of selected fleet": metrics["total_dwt"],
-        "Total cost of selected fleet (USD)": metrics["total_cost_usd"],
-        "Average fleet safety score": round(metrics["avg_safety_score"], 2),
-        "Number of unique main_engine_fuel_type vessels": metrics["num_unique_main_engine_fuel_types"],
+        "Total DWT of selected fleet": m["total_dwt"],
+        "Total cost of selected fleet (USD)": m["total_cost_usd"],
+        "Average fleet safety score": m["avg_safety_score"],
+        "Number of unique main_engine_fuel_type vessels": m["num_unique_main_engine_fuel_types"],
         "Sensitivity analysis performed": "Yes" if sensitivity_done else "No",
-        "Size of fleet (Number of ships)": metrics["fleet_size"],
-        "Total emission of CO2 equivalent (tonnes)": round(metrics["total_co2e_tonnes"], 2),
-        "Total fuel consumption (tonnes)": round(metrics["total_fuel_tonnes"], 2),
+        "Size of fleet (Number of ships)": m["fleet_size"],
+        "Total emission of CO2 equivalent (tonnes)": m["total_co2e_tonnes"],
+        "Total fuel consumption (tonnes)": m["total_fuel_tonnes"],
     }
 
 
@@ -273,16 +499,17 @@ def submission_outputs(
     report_file_name: str = "",
 ) -> dict[str, Any]:
     """Official submission column values (given_data submission_template.csv). Do not alter column order."""
+    m = _normalize_metrics(metrics)
     return {
         "team_name": team_name,
         "category": category,
         "report_file_name": report_file_name,
-        "sum_of_fleet_deadweight": metrics["total_dwt"],
-        "total_cost_of_fleet": metrics["total_cost_usd"],
-        "average_fleet_safety_score": round(metrics["avg_safety_score"], 2),
-        "no_of_unique_main_engine_fuel_types_in_fleet": int(metrics["num_unique_main_engine_fuel_types"]),
+        "sum_of_fleet_deadweight": m["total_dwt"],
+        "total_cost_of_fleet": m["total_cost_usd"],
+        "average_fleet_safety_score": m["avg_safety_score"],
+        "no_of_unique_main_engine_fuel_types_in_fleet": m["num_unique_main_engine_fuel_types"],
         "sensitivity_analysis_performance": "Yes" if sensitivity_done else "No",
-        "size_of_fleet_count": int(metrics["fleet_size"]),
-        "total_emission_CO2_eq": round(metrics["total_co2e_tonnes"], 2),
-        "total_fuel_consumption": round(metrics["total_fuel_tonnes"], 2),
+        "size_of_fleet_count": m["fleet_size"],
+        "total_emission_CO2_eq": m["total_co2e_tonnes"],
+        "total_fuel_consumption": m["total_fuel_tonnes"],
     }
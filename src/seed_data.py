@@ -13,6 +13,8 @@ import numpy as np
 import pandas as pd
 from typing import Any
 
+from src.constants import get_safety_adjustment_rates
+
 
 # Fuel type distribution from methodology (Section 2.2)
 FUEL_TYPES_DISTRIBUTION = {
@@ -118,24 +120,42 @@ SAFETY_ADJUSTMENT_RATES = {
     5: -0.05,  # -5%
 }
 
+# Per-fuel cost-model constants, built once: LCV (MJ/kg), price (USD/GJ) and
+# CO2eq factor using GWP: CO2 + 28*CH4 + 265*N2O (from methodology)
+_FUEL_TABLE = pd.DataFrame({
+    'lcv': {k: v['LCV'] for k, v in EMISSION_FACTORS.items()},
+    'price': FUEL_PRICES,
+    'co2eq': {k: v['CO2'] + 28 * v['CH4'] + 265 * v['N2O'] for k, v in EMISSION_FACTORS.items()},
+}, dtype=float)
 
-def get_capex_base(dwt: float) -> float:
-    """Get base CAPEX in millions USD based on DWT bracket."""
-    for min_dwt, max_dwt, cost in CAPEX_BASE['brackets']:
-        if min_dwt <= dwt <= max_dwt:
-            return cost
-    return 90  # Default for >120k
+
+_CAPEX_LOWERS = np.array([b[0] for b in CAPEX_BASE['brackets']])
+_CAPEX_UPPERS = np.array([b[1] for b in CAPEX_BASE['brackets']])
+_CAPEX_COSTS = np.array([b[2] for b in CAPEX_BASE['brackets']])
+
+
+def get_capex_base_array(dwt) -> np.ndarray:
+    """Base CAPEX in millions USD for an array of DWTs (bracket lookup via searchsorted)."""
+    dwt = np.asarray(dwt, dtype=float)
+    k = np.searchsorted(_CAPEX_UPPERS, dwt, side='left')
+    k_clipped = np.minimum(k, len(_CAPEX_COSTS) - 1)
+    in_bracket = (k < len(_CAPEX_COSTS)) & (dwt >= _CAPEX_LOWERS[k_clipped])
+    return np.where(in_bracket, _CAPEX_COSTS[k_clipped], 90)  # Default for >120k
 
 
-def generate_vessel_id(idx: int) -> int:
-    """Generate realistic vessel ID (8 digits)."""
-    return 10000000 + idx * 1000 + np.random.randint(0, 1000)
+def get_capex_base(dwt: float) -> float:
+    """Get base CAPEX in millions USD based on DWT bracket."""
+    return int(get_capex_base_array(dwt))
 
 
 def generate_seed_fleet(n_vessels: int = 108, seed: int = 42) -> pd.DataFrame:
     """
     Generate realistic seed fleet data for testing.
 
+    The committed data/seed/seed_vessels.csv was drawn with the legacy
+    np.random stream; regenerating it from this Generator gives a
+    different, equally distributed fleet, so tests read the committed file.
+
     Args:
         n_vessels: Number of vessels (default 108 from methodology)
         seed: Random seed for reproducibility
@@ -143,70 +163,73 @@ def generate_seed_fleet(n_vessels: int = 108, seed: int = 42) -> pd.DataFrame:
     Returns:
         DataFrame with vessel data ready for cost model
     """
-    np.random.seed(seed)
-
-    vessels = []
-
-    # Distribute vessels by fuel type
-    vessel_idx = 0
-    for fuel_type, count in FUEL_TYPES_DISTRIBUTION.items():
-        for _ in range(count):
-            # Generate DWT within realistic range for fuel type
-            dwt_min, dwt_max = DWT_RANGES[fuel_type]
-            dwt = np.random.uniform(dwt_min, dwt_max)
-
-            # Safety score with fuel-type bias
-            mean_safety = FUEL_SAFETY_MEANS[fuel_type]
-            # Use wider distribution to get more high-safety vessels
-            safety_raw = np.random.normal(mean_safety, 1.2)
-            safety = int(np.clip(np.round(safety_raw), 1, 5))
-
-            # Main engine power (MEP) scales with DWT
-            # Approximate: 10-20 kW per tonne DWT
-            mep = dwt * np.random.uniform(10, 20) * 0.08  # 80% of max power
-
-            # Reference speed (Vref) - typical 12-16 knots
-            vref = np.random.uniform(12.5, 15.5)
-
-            # Auxiliary engine load (AEL) - typically 5-10% of MEP
-            ael = mep * np.random.uniform(0.05, 0.10)
-
-            # Auxiliary boiler load (ABL) - typically 1-2% of MEP
-            abl = mep * np.random.uniform(0.01, 0.02)
-
-            # Specific Fuel Consumption (SFC) - g/kWh
-            # ME: 165-180 g/kWh typical for modern engines
-            sfc_me = np.random.uniform(165, 180)
-            sfc_ae = np.random.uniform(195, 210)
-            sfc_ab = np.random.uniform(290, 310)
-
-            # CAPEX calculation
-            base_capex = get_capex_base(dwt) * 1_000_000
-            capex = base_capex * CAPEX_MULTIPLIERS[fuel_type]
-
-            vessel = {
-                'vessel_id': generate_vessel_id(vessel_idx),
-                'vessel_name': f'VESSEL_{vessel_idx:03d}',
-                'vessel_type': 'Chemical/Products Tanker',
-                'dwt': int(dwt),
-                'main_engine_fuel_type': fuel_type,
-                'aux_engine_fuel_type': 'DISTILLATE FUEL',  # Always distillate
-                'aux_boiler_fuel_type': 'DISTILLATE FUEL',  # Always distillate
-                'safety_score': safety,
-                'P': int(mep),  # Main engine power
-                'vref': round(vref, 2),
-                'ael': int(ael),
-                'abl': int(abl),
-                'sfc_me': round(sfc_me, 1),
-                'sfc_ae': round(sfc_ae, 1),
-                'sfc_ab': round(sfc_ab, 1),
-                'capex_usd': capex,
-            }
-
-            vessels.append(vessel)
-            vessel_idx += 1
-
-    df = pd.DataFrame(vessels)
+    rng = np.random.default_rng(seed)
+
+    # Distribute vessels by fuel type; per-vessel parameters follow from the fuel
+    counts = list(FUEL_TYPES_DISTRIBUTION.values())
+    fuel_types = pd.Categorical(
+        np.repeat(list(FUEL_TYPES_DISTRIBUTION), counts),
+        categories=list(FUEL_TYPES_DISTRIBUTION),
+    )
+    n = len(fuel_types)
+    dwt_ranges = np.array([DWT_RANGES[ft] for ft in FUEL_TYPES_DISTRIBUTION])
+    dwt_min, dwt_max = np.repeat(dwt_ranges, counts, axis=0).T
+    mean_safety = np.repeat([FUEL_SAFETY_MEANS[ft] for ft in FUEL_TYPES_DISTRIBUTION], counts)
+    capex_mult = np.repeat([CAPEX_MULTIPLIERS[ft] for ft in FUEL_TYPES_DISTRIBUTION], counts)
+
+    # Generate DWT within realistic range for fuel type
+    dwt = rng.uniform(dwt_min, dwt_max)
+
+    # Safety score with fuel-type bias
+    # Use wider distribution to get more high-safety vessels
+    safety_raw = rng.normal(mean_safety, 1.2)
+    safety = np.clip(np.round(safety_raw), 1, 5).astype(int)
+
+    # Main engine power (MEP) scales with DWT
+    # Approximate: 10-20 kW per tonne DWT
+    mep = dwt * rng.uniform(10, 20, size=n) * 0.08  # 80% of max power
+
+    # Reference speed (Vref) - typical 12-16 knots
+    vref = rng.uniform(12.5, 15.5, size=n)
+
+    # Auxiliary engine load (AEL) - typically 5-10% of MEP
+    ael = mep * rng.uniform(0.05, 0.10, size=n)
+
+    # Auxiliary boiler load (ABL) - typically 1-2% of MEP
+    abl = mep * rng.uniform(0.01, 0.02, size=n)
+
+    # Specific Fuel Consumption (SFC) - g/kWh
+    # ME: 165-180 g/kWh typical for modern engines
+    sfc_me = rng.uniform(165, 180, size=n)
+    sfc_ae = rng.uniform(195, 210, size=n)
+    sfc_ab = rng.uniform(290, 310, size=n)
+
+    # CAPEX calculation
+    base_capex = get_capex_base_array(dwt) * 1_000_000
+    capex = base_capex * capex_mult
+
+    # Realistic vessel IDs (8 digits)
+    idx = np.arange(n)
+    vessel_id = 10000000 + idx * 1000 + rng.integers(0, 1000, size=n)
+
+    df = pd.DataFrame({
+        'vessel_id': vessel_id,
+        'vessel_name': [f'VESSEL_{i:03d}' for i in idx],
+        'vessel_type': 'Chemical/Products Tanker',
+        'dwt': dwt.astype(int),
+        'main_engine_fuel_type': fuel_types,
+        'aux_engine_fuel_type': 'DISTILLATE FUEL',  # Always distillate
+        'aux_boiler_fuel_type': 'DISTILLATE FUEL',  # Always distillate
+        'safety_score': safety,
+        'P': mep.astype(int),  # Main engine power
+        'vref': np.round(vref, 2),
+        'ael': ael.astype(int),
+        'abl': abl.astype(int),
+        'sfc_me': np.round(sfc_me, 1),
+        'sfc_ae': np.round(sfc_ae, 1),
+        'sfc_ab': np.round(sfc_ab, 1),
+        'capex_usd': capex,
+    })
 
     # Calculate estimated voyage parameters (simplified)
     # Voyage distance: Singapore to West Australia ≈ 1762 NM
@@ -230,86 +253,76 @@ def generate_global_params() -> dict[str, Any]:
     }
 
 
-def compute_estimated_costs(df: pd.DataFrame, global_params: dict[str, Any]) -> pd.DataFrame:
+def compute_estimated_costs(
+    df: pd.DataFrame, global_params: dict[str, Any], copy: bool = True
+) -> pd.DataFrame:
     """
     Compute estimated costs using simplified model (matching cost_model.py logic).
 
     Args:
         df: Vessel dataframe
         global_params: Global parameters
+        copy: If False, add the cost columns to df in place instead of a copy
 
     Returns:
         DataFrame with cost columns added
     """
-    df = df.copy()
-
     # Load factors (simplified - from cost_model.py defaults)
     LF_ME = 0.8
     LF_AE = 0.5
     LF_AB = 0.3
 
-    rows = []
-    for _, row in df.iterrows():
-        # Fuel consumption (tonnes)
-        voyage_hours = row['voyage_hours']
-        fuel_me = (row['P'] * LF_ME * voyage_hours * row['sfc_me']) / 1e6
-        fuel_ae = (row['ael'] * LF_AE * voyage_hours * row['sfc_ae']) / 1e6
-        fuel_ab = (row['abl'] * LF_AB * voyage_hours * row['sfc_ab']) / 1e6
-
-        # Fuel cost (USD)
-        me_fuel_type = row['main_engine_fuel_type']
-        lcv_me = EMISSION_FACTORS[me_fuel_type]['LCV']
-        price_me = FUEL_PRICES[me_fuel_type]
-        lcv_dist = EMISSION_FACTORS['DISTILLATE FUEL']['LCV']
-        price_dist = FUEL_PRICES['DISTILLATE FUEL']
-
-        fuel_cost_me = (fuel_me * 1000 * lcv_me / 1000) * price_me
-        fuel_cost_ae = (fuel_ae * 1000 * lcv_dist / 1000) * price_dist
-        fuel_cost_ab = (fuel_ab * 1000 * lcv_dist / 1000) * price_dist
-        fuel_cost_total = fuel_cost_me + fuel_cost_ae + fuel_cost_ab
-
-        # Emissions (tonnes CO2eq)
-        cf_me = EMISSION_FACTORS[me_fuel_type]
-        cf_dist = EMISSION_FACTORS['DISTILLATE FUEL']
-
-        # CO2eq using GWP: CO2 + 28*CH4 + 265*N2O (from methodology)
-        co2eq_me = fuel_me * (cf_me['CO2'] + 28 * cf_me['CH4'] + 265 * cf_me['N2O'])
-        co2eq_ae = fuel_ae * (cf_dist['CO2'] + 28 * cf_dist['CH4'] + 265 * cf_dist['N2O'])
-        co2eq_ab = fuel_ab * (cf_dist['CO2'] + 28 * cf_dist['CH4'] + 265 * cf_dist['N2O'])
-        co2eq_total = co2eq_me + co2eq_ae + co2eq_ab
-
-        # Carbon cost
-        carbon_cost = co2eq_total * global_params['carbon_price_usd_per_tco2e']
-
-        # Ownership cost (monthly amortized)
-        capex = row['capex_usd']
-        crf = global_params['crf']
-        ownership_cost = (capex * crf) / 12
-
-        # Risk premium
-        base_cost = fuel_cost_total + carbon_cost + ownership_cost
-        safety_adj = SAFETY_ADJUSTMENT_RATES[row['safety_score']]
-        risk_premium = base_cost * safety_adj
-
-        # Total cost
-        total_cost = base_cost + risk_premium
-
-        row_dict = row.to_dict()
-        row_dict.update({
-            'fuel_me_tonnes': fuel_me,
-            'fuel_ae_tonnes': fuel_ae,
-            'fuel_ab_tonnes': fuel_ab,
-            'fuel_tonnes': fuel_me + fuel_ae + fuel_ab,
-            'fuel_cost_usd': fuel_cost_total,
-            'co2e_tonnes': co2eq_total,
-            'carbon_cost_usd': carbon_cost,
-            'ownership_cost_usd': ownership_cost,
-            'risk_premium_usd': risk_premium,
-            'total_cost_usd': total_cost,
-        })
-        rows.append(row_dict)
-
-    return pd.DataFrame(rows)
+    # Per-vessel lookups for the main engine fuel (aux engine/boiler burn distillate)
+    fuel_types = df['main_engine_fuel_type']
+    unknown = set(fuel_types.unique()).difference(_FUEL_TABLE.index)
+    if unknown:
+        raise ValueError(f"Unknown main_engine_fuel_type: {sorted(map(str, unknown))}")
+    lcv_me, price_me, cf_me = _FUEL_TABLE.loc[fuel_types].to_numpy().T
+    lcv_dist, price_dist, cf_dist = _FUEL_TABLE.loc['DISTILLATE FUEL']
+
+    # Fuel consumption (tonnes)
+    voyage_hours = df['voyage_hours'].to_numpy(dtype=float)
+    fuel_me = (df['P'].to_numpy(dtype=float) * LF_ME * voyage_hours * df['sfc_me'].to_numpy(dtype=float)) / 1e6
+    fuel_ae = (df['ael'].to_numpy(dtype=float) * LF_AE * voyage_hours * df['sfc_ae'].to_numpy(dtype=float)) / 1e6
+    fuel_ab = (df['abl'].to_numpy(dtype=float) * LF_AB * voyage_hours * df['sfc_ab'].to_numpy(dtype=float)) / 1e6
+
+    # Fuel cost (USD)
+    fuel_cost_me = (fuel_me * 1000 * lcv_me / 1000) * price_me
+    fuel_cost_ae = (fuel_ae * 1000 * lcv_dist / 1000) * price_dist
+    fuel_cost_ab = (fuel_ab * 1000 * lcv_dist / 1000) * price_dist
+    fuel_cost_total = fuel_cost_me + fuel_cost_ae + fuel_cost_ab
+
+    # Emissions (tonnes CO2eq)
+    co2eq_total = fuel_me * cf_me + fuel_ae * cf_dist + fuel_ab * cf_dist
+
+    # Carbon cost
+    carbon_cost = co2eq_total * global_params['carbon_price_usd_per_tco2e']
+
+    # Ownership cost (monthly amortized)
+    ownership_cost = (df['capex_usd'].to_numpy(dtype=float) * global_params['crf']) / 12
+
+    # Risk premium
+    base_cost = fuel_cost_total + carbon_cost + ownership_cost
+    safety_adj = get_safety_adjustment_rates(df['safety_score'].to_numpy())
+    risk_premium = base_cost * safety_adj
+
+    costs = {
+        'fuel_me_tonnes': fuel_me,
+        'fuel_ae_tonnes': fuel_ae,
+        'fuel_ab_tonnes': fuel_ab,
+        'fuel_tonnes': fuel_me + fuel_ae + fuel_ab,
+        'fuel_cost_usd': fuel_cost_total,
+        'co2e_tonnes': co2eq_total,
+        'carbon_cost_usd': carbon_cost,
+        'ownership_cost_usd': ownership_cost,
+        'risk_premium_usd': risk_premium,
+        'total_cost_usd': base_cost + risk_premium,
+    }
+    if copy:
+        return df.assign(**costs)
+    for col, values in costs.items():
+        df[col] = values
+    return df
 
 
 def save_seed_data(output_dir: str = 'data/seed') -> tuple[pd.DataFrame, dict[str, Any]]:
@@ -331,8 +344,8 @@ def save_seed_data(output_dir: str = 'data/seed') -> tuple[pd.DataFrame, dict[st
     df_vessels = generate_seed_fleet()
     global_params = generate_global_params()
 
-    # Compute costs
-    df_vessels = compute_estimated_costs(df_vessels, global_params)
+    # Compute costs (the generated frame is ours, so fill it in place)
+    df_vessels = compute_estimated_costs(df_vessels, global_params, copy=False)
 
     # Save
     df_vessels.to_csv(output_path / 'seed_vessels.csv', index=False)
@@ -3,24 +3,148 @@ Sensitivity analysis: re-run fleet selection at different safety thresholds
 and compare costs, fleet composition, and emissions.
 """
 
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from pulp import LpBinary, LpMinimize, LpProblem, LpVariable, PULP_CBC_CMD, lpSum
 
 from src.constants import CARBON_PRICE, MONTHLY_DEMAND, SAFETY_THRESHOLD
-from src.optimization import select_fleet_milp, total_cost_and_metrics
+from src.optimization import (
+    build_fleet_model,
+    select_fleet_milp,
+    solve_fleet_model,
+    total_cost_and_metrics,
+)
+
+
+def _fuel_type_counts(subset: pd.DataFrame) -> dict[str, int]:
+    """Vessels per fuel type present in subset (unused categories are dropped)."""
+    counts = subset["main_engine_fuel_type"].value_counts()
+    return counts[counts > 0].to_dict()
+
+
+_FINGERPRINT_COLUMNS = ["vessel_id", "final_cost", "dwt", "safety_score", "CO2eq", "main_engine_fuel_type"]
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> bytes:
+    """Digest of the columns select_fleet_milp reads."""
+    hashes = pd.util.hash_pandas_object(df[_FINGERPRINT_COLUMNS], index=False)
+    return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).digest()
+
+
+def _milp_cache_key(fingerprint: bytes, job: dict[str, Any]) -> tuple:
+    """
+    Memo key for one select_fleet_milp job on a fingerprinted frame.
+
+    Each sweep keeps its own memo for the length of the call, so repeated
+    points (the same threshold, price or cap twice) are solved once. Besides
+    the model arguments the key holds every solver setting: a gap or time
+    limit may stop short of the optimum, and a different backend or thread
+    count may break ties between equal-cost fleets differently.
+    """
+    co2_cap = job.get("co2_cap")
+    return (
+        fingerprint,
+        float(job["cargo_demand"]),
+        float(job["min_avg_safety"]),
+        bool(job.get("require_all_fuel_types", True)),
+        # absorb float jitter from linspace without merging distinct caps
+        None if co2_cap is None else float(f"{co2_cap:.12g}"),
+        job.get("solver_name"),
+        job.get("threads"),
+        job.get("gap_rel"),
+        job.get("time_limit"),
+    )
+
+
+def _cached_select_fleet_milp(
+    df: pd.DataFrame,
+    memo: dict[tuple, list[int]],
+    **kwargs: Any,
+) -> list[int]:
+    """select_fleet_milp(df, **kwargs) through a sweep's memo (see _milp_cache_key)."""
+    key = _milp_cache_key(_frame_fingerprint(df), kwargs)
+    if key not in memo:
+        memo[key] = select_fleet_milp(df, **kwargs)
+    return list(memo[key])
+
+
+# Frame shared with pool workers via the initializer, so it is pickled once per
+# worker rather than once per solve.
+_WORKER_DF: pd.DataFrame | None = None
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    global _WORKER_DF
+    _WORKER_DF = df
+
+
+def _solve_on_worker(job: dict[str, Any]) -> list[int]:
+    return select_fleet_milp(_WORKER_DF, threads=1, **job)
+
+
+def _map_fleet_milp(
+    df: pd.DataFrame,
+    jobs: list[dict[str, Any]],
+    max_workers: int | None = 1,
+) -> list[list[int]]:
+    """
+    Solve ``select_fleet_milp(df, **job)`` for each job, in input order.
+
+    Jobs repeated within ``jobs`` (same _milp_cache_key) are solved once.
+    The rest are independent: max_workers=1 (the default) solves them
+    in-process; otherwise they run in a process pool (None = one per job,
+    capped at the CPU count) with a single solver thread each to avoid
+    oversubscription.
+    """
+    fingerprint = _frame_fingerprint(df)
+    keys = [_milp_cache_key(fingerprint, job) for job in jobs]
+    pending = dict(zip(keys, jobs))
+    if max_workers is None:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+    if max_workers <= 1 or len(pending) <= 1:
+        fleets = [select_fleet_milp(df, **job) for job in pending.values()]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(df,)
+        ) as ex:
+            fleets = list(ex.map(_solve_on_worker, pending.values()))
+    solved = dict(zip(pending, fleets))
+    return [list(solved[k]) for k in keys]
+
+
+_BREAKDOWN_COLUMNS = {
+    "total_fuel_cost": "fuel_cost",
+    "total_carbon_cost": "carbon_cost",
+    "total_capex": "monthly_capex",
+    "total_risk_premium": "risk_premium",
+}
+
+
+def _cost_breakdown(df: pd.DataFrame, mask: np.ndarray) -> dict[str, Any]:
+    """Fleet totals per cost component (0 where the column is missing), summed over a row mask."""
+    return {
+        key: df[col].to_numpy()[mask].sum() if col in df.columns else 0
+        for key, col in _BREAKDOWN_COLUMNS.items()
+    }
 
 
 def run_safety_sweep(
     df: pd.DataFrame,
     thresholds: list[float] | None = None,
     cargo_demand: float = MONTHLY_DEMAND,
+    max_workers: int | None = 1,
 ) -> list[dict[str, Any]]:
     """
     Re-run MILP at each safety threshold and collect fleet metrics.
 
+    With max_workers=1 one model is re-solved in-process for every threshold;
+    otherwise the thresholds are solved independently in a process pool
+    (None = one worker per threshold, capped at the CPU count).
+
     Returns a list of dicts, one per threshold, with keys:
     threshold, feasible, fleet_size, total_cost_usd, avg_safety_score,
     total_co2e_tonnes, total_dwt, total_fuel_tonnes, fuel_type_counts, selected_ids
@@ -28,10 +152,24 @@ def run_safety_sweep(
     if thresholds is None:
         thresholds = [3.0, 3.5, 4.0, 4.5]
 
-    results = []
-    for t in thresholds:
-        selected_ids = select_fleet_milp(df, cargo_demand=cargo_demand, min_avg_safety=t)
+    if max_workers == 1:
+        fingerprint = _frame_fingerprint(df)
+        memo: dict[tuple, list[int]] = {}
+        model = None
+        fleets = []
+        for t in thresholds:
+            key = _milp_cache_key(fingerprint, {"cargo_demand": cargo_demand, "min_avg_safety": t})
+            if key not in memo:
+                if model is None:
+                    model = build_fleet_model(df)
+                memo[key] = solve_fleet_model(model, cargo_demand=cargo_demand, min_avg_safety=t)
+            fleets.append(list(memo[key]))
+    else:
+        jobs = [{"cargo_demand": cargo_demand, "min_avg_safety": t} for t in thresholds]
+        fleets = _map_fleet_milp(df, jobs, max_workers)
 
+    results = []
+    for t, selected_ids in zip(thresholds, fleets):
         if not selected_ids:
             results.append({
                 "threshold": t,
@@ -47,15 +185,13 @@ def run_safety_sweep(
             })
         else:
             metrics = total_cost_and_metrics(df, selected_ids)
-            subset = df[df["vessel_id"].isin(selected_ids)]
-            fuel_counts = subset["main_engine_fuel_type"].value_counts().to_dict()
+            mask = df["vessel_id"].isin(selected_ids).to_numpy()
+            subset = df[mask]
+            fuel_counts = _fuel_type_counts(subset)
             # Cost breakdown for stacked bar (CAPEX = monthly_capex)
-            total_fuel = subset["fuel_cost"].sum() if "fuel_cost" in subset.columns else 0
-            total_carbon = subset["carbon_cost"].sum() if "carbon_cost" in subset.columns else 0
-            total_capex = subset["monthly_capex"].sum() if "monthly_capex" in subset.columns else 0
-            total_risk = subset["risk_premium"].sum() if "risk_premium" in subset.columns else 0
+            breakdown = _cost_breakdown(df, mask)
             # DWT by fuel type for fuel-mix charts (used in safety context too if needed)
-            dwt_by_fuel = subset.groupby("main_engine_fuel_type")["dwt"].sum().to_dict() if "dwt" in subset.columns else {}
+            dwt_by_fuel = subset.groupby("main_engine_fuel_type", observed=True)["dwt"].sum().to_dict() if "dwt" in subset.columns else {}
 
             results.append({
                 "threshold": t,
@@ -68,10 +204,7 @@ def run_safety_sweep(
                 "total_fuel_tonnes": metrics["total_fuel_tonnes"],
                 "fuel_type_counts": fuel_counts,
                 "selected_ids": selected_ids,
-                "total_fuel_cost": total_fuel,
-                "total_carbon_cost": total_carbon,
-                "total_capex": total_capex,
-                "total_risk_premium": total_risk,
+                **breakdown,
                 "dwt_by_fuel": dwt_by_fuel,
             })
 
@@ -93,13 +226,12 @@ def run_safety_sweep_fixed_fleet(
     if thresholds is None:
         thresholds = [2.5, 3.0, 3.5, 4.0, 4.5]
     metrics = total_cost_and_metrics(df, selected_ids)
-    subset = df[df["vessel_id"].isin(selected_ids)]
-    fuel_counts = subset["main_engine_fuel_type"].value_counts().to_dict()
-    total_fuel = subset["fuel_cost"].sum() if "fuel_cost" in subset.columns else 0
-    total_carbon = subset["carbon_cost"].sum() if "carbon_cost" in subset.columns else 0
-    total_capex = subset["monthly_capex"].sum() if "monthly_capex" in subset.columns else 0
-    total_risk = subset["risk_premium"].sum() if "risk_premium" in subset.columns else 0
-    dwt_by_fuel = subset.groupby("main_engine_fuel_type")["dwt"].sum().to_dict()
+    mask = df["vessel_id"].isin(selected_ids).to_numpy()
+    subset = df[mask]
+    fuel_counts = _fuel_type_counts(subset)
+    # Cost breakdown for stacked bar (CAPEX = monthly_capex)
+    breakdown = _cost_breakdown(df, mask)
+    dwt_by_fuel = subset.groupby("main_engine_fuel_type", observed=True)["dwt"].sum().to_dict()
 
     results = []
     for t in thresholds:
@@ -115,15 +247,21 @@ def run_safety_sweep_fixed_fleet(
             "total_fuel_tonnes": metrics["total_fuel_tonnes"],
             "fuel_type_counts": fuel_counts,
             "selected_ids": selected_ids,
-            "total_fuel_cost": total_fuel,
-            "total_carbon_cost": total_carbon,
-            "total_capex": total_capex,
-            "total_risk_premium": total_risk,
+            **breakdown,
             "dwt_by_fuel": dwt_by_fuel,
         })
     return results
 
 
+def _cost_ex_carbon(df: pd.DataFrame) -> np.ndarray:
+    """final_cost without its carbon component (CO2eq * CARBON_PRICE if carbon_cost is missing)."""
+    if "carbon_cost" in df.columns:
+        carbon_cost = df["carbon_cost"].to_numpy()
+    else:
+        carbon_cost = df["CO2eq"].to_numpy() * CARBON_PRICE
+    return df["final_cost"].to_numpy() - carbon_cost
+
+
 def run_carbon_price_sweep_fixed_fleet(
     df: pd.DataFrame,
     selected_ids: list[int],
@@ -137,26 +275,20 @@ def run_carbon_price_sweep_fixed_fleet(
     """
     if carbon_prices is None:
         carbon_prices = [80, 120, 160, 200]
-    if "carbon_cost" in df.columns:
-        original_carbon_cost = df["carbon_cost"]
-    else:
-        original_carbon_cost = df["CO2eq"] * CARBON_PRICE
+    co2 = df["CO2eq"].to_numpy()
+    cost_ex_carbon = _cost_ex_carbon(df)
 
     results: list[dict[str, Any]] = []
     for cp in carbon_prices:
-        df_copy = df.copy()
-        df_copy["carbon_cost"] = df_copy["CO2eq"] * cp
-        df_copy["final_cost"] = (
-            df_copy["final_cost"] - original_carbon_cost + df_copy["carbon_cost"]
-        )
+        carbon_cost = co2 * cp
+        df_copy = df.assign(carbon_cost=carbon_cost, final_cost=cost_ex_carbon + carbon_cost)
         metrics = total_cost_and_metrics(df_copy, selected_ids)
-        subset = df_copy[df_copy["vessel_id"].isin(selected_ids)]
-        fuel_counts = subset["main_engine_fuel_type"].value_counts().to_dict()
-        total_fuel = subset["fuel_cost"].sum() if "fuel_cost" in subset.columns else 0
-        total_carbon = subset["carbon_cost"].sum() if "carbon_cost" in subset.columns else 0
-        total_capex = subset["monthly_capex"].sum() if "monthly_capex" in subset.columns else 0
-        total_risk = subset["risk_premium"].sum() if "risk_premium" in subset.columns else 0
-        dwt_by_fuel = subset.groupby("main_engine_fuel_type")["dwt"].sum().to_dict()
+        mask = df_copy["vessel_id"].isin(selected_ids).to_numpy()
+        subset = df_copy[mask]
+        fuel_counts = _fuel_type_counts(subset)
+        # Cost breakdown for stacked bar (CAPEX = monthly_capex)
+        breakdown = _cost_breakdown(df_copy, mask)
+        dwt_by_fuel = subset.groupby("main_engine_fuel_type", observed=True)["dwt"].sum().to_dict()
 
         results.append({
             "carbon_price": cp,
@@ -168,15 +300,44 @@ def run_carbon_price_sweep_fixed_fleet(
             "total_dwt": metrics["total_dwt"],
             "selected_ids": selected_ids,
             "fuel_type_counts": fuel_counts,
-            "total_fuel_cost": total_fuel,
-            "total_carbon_cost": total_carbon,
-            "total_capex": total_capex,
-            "total_risk_premium": total_risk,
+            **breakdown,
             "dwt_by_fuel": dwt_by_fuel,
         })
     return results
 
 
+def _format_results(
+    results: list[dict[str, Any]],
+    leading: dict[str, tuple[str, str | None]],
+    feasible_only: dict[str, tuple[str, str | None]],
+) -> pd.DataFrame:
+    """
+    Shared column-wise formatter for the sweep tables.
+
+    Each spec maps an output label to (result key, format string or None for
+    the raw value). ``leading`` columns are shown for every row, then comes
+    Feasible ("Yes"/"INFEASIBLE"), then ``feasible_only`` columns, which show
+    "-" for infeasible rows and for missing (None) values.
+    """
+    if not results:
+        return pd.DataFrame()
+    raw = pd.DataFrame(results, dtype=object)
+    feasible = raw["feasible"].astype(bool)
+
+    def column(key: str, fmt: str | None, mask: pd.Series) -> list:
+        values = raw[key][mask & raw[key].notna()]
+        if fmt is not None:
+            values = values.map(fmt.format)
+        return values.reindex(raw.index, fill_value="-").tolist()
+
+    every_row = pd.Series(True, index=raw.index)
+    table = {label: column(key, fmt, every_row) for label, (key, fmt) in leading.items()}
+    table["Feasible"] = feasible.map({True: "Yes", False: "INFEASIBLE"}).tolist()
+    for label, (key, fmt) in feasible_only.items():
+        table[label] = column(key, fmt, feasible)
+    return pd.DataFrame(table)
+
+
 def format_sweep_table(results: list[dict[str, Any]]) -> pd.DataFrame:
     """
     Format sweep results as a readable comparison table.
@@ -184,32 +345,18 @@ def format_sweep_table(results: list[dict[str, Any]]) -> pd.DataFrame:
     Returns a DataFrame with columns: Threshold, Feasible, Fleet Size,
     Total Cost ($), Avg Safety, Total CO2eq (t), Total DWT, Total Fuel (t).
     """
-    rows = []
-    for r in results:
-        if r["feasible"]:
-            rows.append({
-                "Threshold": r["threshold"],
-                "Feasible": "Yes",
-                "Fleet Size": r["fleet_size"],
-                "Total Cost ($)": f"{r['total_cost_usd']:,.2f}",
-                "Avg Safety": f"{r['avg_safety_score']:.2f}",
-                "Total CO2eq (t)": f"{r['total_co2e_tonnes']:,.2f}",
-                "Total DWT": f"{r['total_dwt']:,.0f}",
-                "Total Fuel (t)": f"{r['total_fuel_tonnes']:,.2f}",
-            })
-        else:
-            rows.append({
-                "Threshold": r["threshold"],
-                "Feasible": "INFEASIBLE",
-                "Fleet Size": "-",
-                "Total Cost ($)": "-",
-                "Avg Safety": "-",
-                "Total CO2eq (t)": "-",
-                "Total DWT": "-",
-                "Total Fuel (t)": "-",
-            })
-
-    return pd.DataFrame(rows)
+    return _format_results(
+        results,
+        {"Threshold": ("threshold", None)},
+        {
+            "Fleet Size": ("fleet_size", None),
+            "Total Cost ($)": ("total_cost_usd", "{:,.2f}"),
+            "Avg Safety": ("avg_safety_score", "{:.2f}"),
+            "Total CO2eq (t)": ("total_co2e_tonnes", "{:,.2f}"),
+            "Total DWT": ("total_dwt", "{:,.0f}"),
+            "Total Fuel (t)": ("total_fuel_tonnes", "{:,.2f}"),
+        },
+    )
 
 
 def _solve_min_co2(
@@ -217,43 +364,28 @@ def _solve_min_co2(
     cargo_demand: float,
     min_avg_safety: float,
     require_all_fuel_types: bool,
+    model: dict[str, Any] | None = None,
 ) -> float | None:
     """
-    Solve a one-off MILP that minimizes total CO2eq subject to the same
-    feasibility constraints (DWT, safety, fuel diversity).
+    Minimize total CO2eq subject to the same feasibility constraints (DWT,
+    safety, fuel diversity).
+
+    Re-solves ``model`` (from build_fleet_model, e.g. the one that just found
+    the cost-optimal fleet) with CO2eq as the objective, warm-started from its
+    previous optimum, which stays feasible; builds a fresh model if None.
 
     Returns the minimum achievable CO2eq, or None if infeasible.
     """
-    indices = list(df.index)
-    dwts = df["dwt"].tolist()
-    safety_deltas = (df["safety_score"] - min_avg_safety).tolist()
-    co2eqs = df["CO2eq"].tolist()
-
-    prob = LpProblem("min_co2", LpMinimize)
-    x = LpVariable.dicts("x", indices, 0, 1, LpBinary)
-
-    # Objective: minimize total CO2eq
-    prob += lpSum([co2eqs[i] * x[i] for i in indices])
-
-    # Constraint 1: DWT >= cargo demand
-    prob += lpSum([dwts[i] * x[i] for i in indices]) >= cargo_demand, "DWT"
-
-    # Constraint 2: linearized average safety >= threshold
-    prob += lpSum([safety_deltas[i] * x[i] for i in indices]) >= 0, "Safety"
-
-    # Constraint 3: fuel diversity
-    if require_all_fuel_types:
-        fuel_types = df["main_engine_fuel_type"].unique()
-        for ft in fuel_types:
-            ft_indices = df.index[df["main_engine_fuel_type"] == ft].tolist()
-            prob += lpSum([x[i] for i in ft_indices]) >= 1, f"Fuel_{ft}"
-
-    prob.solve(PULP_CBC_CMD(msg=0))
-
-    if prob.status != 1:
+    if model is None:
+        model = build_fleet_model(df, require_all_fuel_types)
+    co2eqs = df["CO2eq"].to_numpy(dtype=float)
+    selected_ids = solve_fleet_model(
+        model, cargo_demand, min_avg_safety, costs=co2eqs, warm_start=True
+    )
+    if not selected_ids:
         return None
 
-    selected_co2 = sum(co2eqs[i] for i in indices if x[i].varValue > 0.5)
+    selected_co2 = sum(co2eqs[df["vessel_id"].isin(selected_ids).to_numpy()].tolist())
     return selected_co2
 
 
@@ -263,6 +395,7 @@ def run_pareto_sweep(
     cargo_demand: float = MONTHLY_DEMAND,
     min_avg_safety: float = SAFETY_THRESHOLD,
     require_all_fuel_types: bool = True,
+    max_workers: int | None = 1,
 ) -> list[dict[str, Any]]:
     """
     Epsilon-constraint Pareto frontier: sweep CO2eq cap from fleet-max to
@@ -271,22 +404,23 @@ def run_pareto_sweep(
 
     Algorithm:
     1. Run base MILP (no cap) to get cost-minimizing fleet -> co2_max.
-    2. Solve min-CO2eq MILP (same constraints) -> co2_min.
+    2. Re-solve the same model with a min-CO2eq objective -> co2_min.
     3. Create ``n_points`` evenly-spaced epsilon values from co2_max to co2_min.
-    4. For each epsilon, solve MILP with co2_cap=epsilon.
+    4. For each epsilon, solve MILP with co2_cap=epsilon. The solves are
+       independent: by default they run in-process, or in a process pool
+       with max_workers > 1 (None = one per point, capped at the CPU count).
+       Points whose cap the base fleet already meets reuse it without a
+       solve.
     5. Compute shadow carbon price between consecutive feasible points.
 
     Returns list of dicts with keys: epsilon, feasible, fleet_size,
     total_cost_usd, total_co2e_tonnes, avg_safety_score, total_dwt,
     selected_ids, shadow_carbon_price.
     """
-    # Step 1: base MILP (cost-minimizing, no CO2 cap) -> co2_max
-    base_ids = select_fleet_milp(
-        df,
-        cargo_demand=cargo_demand,
-        min_avg_safety=min_avg_safety,
-        require_all_fuel_types=require_all_fuel_types,
-    )
+    # Step 1: base MILP (cost-minimizing, no CO2 cap) -> co2_max. Its model
+    # is kept so step 2 only swaps the objective.
+    model = build_fleet_model(df, require_all_fuel_types)
+    base_ids = solve_fleet_model(model, cargo_demand, min_avg_safety)
     if not base_ids:
         # Base problem is infeasible — no Pareto frontier possible
         return []
@@ -296,7 +430,7 @@ def run_pareto_sweep(
 
     # Step 2: min-CO2eq MILP -> co2_min
     co2_min = _solve_min_co2(
-        df, cargo_demand, min_avg_safety, require_all_fuel_types
+        df, cargo_demand, min_avg_safety, require_all_fuel_types, model
     )
     if co2_min is None:
         # Should not happen if base is feasible, but handle gracefully
@@ -306,16 +440,26 @@ def run_pareto_sweep(
     epsilons = np.linspace(co2_max, co2_min, n_points).tolist()
 
     # Step 4: solve at each epsilon
-    results: list[dict[str, Any]] = []
-    for eps in epsilons:
-        selected_ids = select_fleet_milp(
-            df,
-            cargo_demand=cargo_demand,
-            min_avg_safety=min_avg_safety,
-            require_all_fuel_types=require_all_fuel_types,
-            co2_cap=eps,
-        )
+    jobs = [
+        {
+            "cargo_demand": cargo_demand,
+            "min_avg_safety": min_avg_safety,
+            "require_all_fuel_types": require_all_fuel_types,
+            "co2_cap": eps,
+        }
+        for eps in epsilons
+    ]
+    # A fleet that is optimal under a looser cap (or none) and already meets
+    # a tighter one is optimal there too, so such points skip the MILP.
+    open_jobs = [job for job in jobs if job["co2_cap"] < co2_max]
+    solved = iter(_map_fleet_milp(df, open_jobs, max_workers))
+    fleets = [
+        next(solved) if job["co2_cap"] < co2_max else list(base_ids)
+        for job in jobs
+    ]
 
+    results: list[dict[str, Any]] = []
+    for eps, selected_ids in zip(epsilons, fleets):
         if not selected_ids:
             results.append({
                 "epsilon": eps,
@@ -342,20 +486,17 @@ def run_pareto_sweep(
                 "shadow_carbon_price": None,  # computed below
             })
 
-    # Step 5: compute shadow carbon prices between consecutive feasible points
-    prev_feasible = None
-    for r in results:
-        if not r["feasible"]:
-            continue
-        if prev_feasible is not None:
-            co2_reduction = prev_feasible["total_co2e_tonnes"] - r["total_co2e_tonnes"]
-            cost_increase = r["total_cost_usd"] - prev_feasible["total_cost_usd"]
-            if co2_reduction > 0:
-                r["shadow_carbon_price"] = cost_increase / co2_reduction
-            else:
-                # No actual CO2 reduction (same fleet selected) -> no shadow price
-                r["shadow_carbon_price"] = None
-        prev_feasible = r
+    # Step 5: shadow carbon price between consecutive feasible points; no
+    # actual CO2 reduction (same fleet selected) -> no shadow price
+    feasible = [r for r in results if r["feasible"]]
+    if len(feasible) > 1:
+        costs = np.array([r["total_cost_usd"] for r in feasible], dtype=float)
+        co2s = np.array([r["total_co2e_tonnes"] for r in feasible], dtype=float)
+        co2_reduction = co2s[:-1] - co2s[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shadow = np.diff(costs) / co2_reduction
+        for r, price, reduced in zip(feasible[1:], shadow, co2_reduction > 0):
+            r["shadow_carbon_price"] = price if reduced else None
 
     return results
 
@@ -368,35 +509,17 @@ def format_pareto_table(results: list[dict[str, Any]]) -> pd.DataFrame:
     Total Cost ($), Actual CO2eq (t), Shadow Price ($/tCO2eq), Avg Safety.
     Numbers formatted with commas and 2 decimal places.
     """
-    rows = []
-    for r in results:
-        if r["feasible"]:
-            shadow = (
-                f"{r['shadow_carbon_price']:,.2f}"
-                if r["shadow_carbon_price"] is not None
-                else "-"
-            )
-            rows.append({
-                "CO2eq Cap": f"{r['epsilon']:,.2f}",
-                "Feasible": "Yes",
-                "Fleet Size": r["fleet_size"],
-                "Total Cost ($)": f"{r['total_cost_usd']:,.2f}",
-                "Actual CO2eq (t)": f"{r['total_co2e_tonnes']:,.2f}",
-                "Shadow Price ($/tCO2eq)": shadow,
-                "Avg Safety": f"{r['avg_safety_score']:.2f}",
-            })
-        else:
-            rows.append({
-                "CO2eq Cap": f"{r['epsilon']:,.2f}",
-                "Feasible": "INFEASIBLE",
-                "Fleet Size": "-",
-                "Total Cost ($)": "-",
-                "Actual CO2eq (t)": "-",
-                "Shadow Price ($/tCO2eq)": "-",
-                "Avg Safety": "-",
-            })
-
-    return pd.DataFrame(rows)
+    return _format_results(
+        results,
+        {"CO2eq Cap": ("epsilon", "{:,.2f}")},
+        {
+            "Fleet Size": ("fleet_size", None),
+            "Total Cost ($)": ("total_cost_usd", "{:,.2f}"),
+            "Actual CO2eq (t)": ("total_co2e_tonnes", "{:,.2f}"),
+            "Shadow Price ($/tCO2eq)": ("shadow_carbon_price", "{:,.2f}"),
+            "Avg Safety": ("avg_safety_score", "{:.2f}"),
+        },
+    )
 
 
 def compute_shadow_prices(
@@ -554,23 +677,16 @@ def run_carbon_price_sweep(
         carbon_prices = [80, 120, 160, 200]
 
     results: list[dict[str, Any]] = []
+    memo: dict[tuple, list[int]] = {}
+    co2 = df["CO2eq"].to_numpy()
+    cost_ex_carbon = _cost_ex_carbon(df)
     for cp in carbon_prices:
-        df_copy = df.copy()
-
-        # Compute the original carbon cost; fall back to base CARBON_PRICE if column missing
-        if "carbon_cost" in df_copy.columns:
-            original_carbon_cost = df_copy["carbon_cost"]
-        else:
-            original_carbon_cost = df_copy["CO2eq"] * CARBON_PRICE
-
-        # Recalculate carbon cost and final_cost with the new carbon price
-        df_copy["carbon_cost"] = df_copy["CO2eq"] * cp
-        df_copy["final_cost"] = (
-            df_copy["final_cost"] - original_carbon_cost + df_copy["carbon_cost"]
-        )
-
-        selected_ids = select_fleet_milp(
+        # Re-price carbon; assign shares every other column with df
+        carbon_cost = co2 * cp
+        df_copy = df.assign(carbon_cost=carbon_cost, final_cost=cost_ex_carbon + carbon_cost)
+        selected_ids = _cached_select_fleet_milp(
             df_copy,
+            memo,
             cargo_demand=cargo_demand,
             min_avg_safety=safety_threshold,
         )
@@ -589,13 +705,12 @@ def run_carbon_price_sweep(
             })
         else:
             metrics = total_cost_and_metrics(df_copy, selected_ids)
-            subset = df_copy[df_copy["vessel_id"].isin(selected_ids)]
-            fuel_counts = subset["main_engine_fuel_type"].value_counts().to_dict()
-            total_fuel = subset["fuel_cost"].sum() if "fuel_cost" in subset.columns else 0
-            total_carbon = subset["carbon_cost"].sum() if "carbon_cost" in subset.columns else 0
-            total_capex = subset["monthly_capex"].sum() if "monthly_capex" in subset.columns else 0
-            total_risk = subset["risk_premium"].sum() if "risk_premium" in subset.columns else 0
-            dwt_by_fuel = subset.groupby("main_engine_fuel_type")["dwt"].sum().to_dict() if "dwt" in subset.columns else {}
+            mask = df_copy["vessel_id"].isin(selected_ids).to_numpy()
+            subset = df_copy[mask]
+            fuel_counts = _fuel_type_counts(subset)
+            # Cost breakdown for stacked bar (CAPEX = monthly_capex)
+            breakdown = _cost_breakdown(df_copy, mask)
+            dwt_by_fuel = subset.groupby("main_engine_fuel_type", observed=True)["dwt"].sum().to_dict() if "dwt" in subset.columns else {}
 
             results.append({
                 "carbon_price": cp,
@@ -607,10 +722,7 @@ def run_carbon_price_sweep(
                 "total_dwt": metrics["total_dwt"],
                 "selected_ids": selected_ids,
                 "fuel_type_counts": fuel_counts,
-                "total_fuel_cost": total_fuel,
-                "total_carbon_cost": total_carbon,
-                "total_capex": total_capex,
-                "total_risk_premium": total_risk,
+                **breakdown,
                 "dwt_by_fuel": dwt_by_fuel,
             })
 
@@ -624,38 +736,30 @@ def format_carbon_sweep_table(results: list[dict[str, Any]]) -> pd.DataFrame:
     Returns a DataFrame with columns: Carbon Price ($/t), Feasible,
     Fleet Size, Total Cost ($), Total CO2eq (t), Avg Safety.
     """
-    rows = []
-    for r in results:
-        if r["feasible"]:
-            rows.append({
-                "Carbon Price ($/t)": r["carbon_price"],
-                "Feasible": "Yes",
-                "Fleet Size": r["fleet_size"],
-                "Total Cost ($)": f"{r['total_cost_usd']:,.2f}",
-                "Total CO2eq (t)": f"{r['total_co2e_tonnes']:,.2f}",
-                "Avg Safety": f"{r['avg_safety_score']:.2f}",
-            })
-        else:
-            rows.append({
-                "Carbon Price ($/t)": r["carbon_price"],
-                "Feasible": "INFEASIBLE",
-                "Fleet Size": "-",
-                "Total Cost ($)": "-",
-                "Total CO2eq (t)": "-",
-                "Avg Safety": "-",
-            })
-
-    return pd.DataFrame(rows)
+    return _format_results(
+        results,
+        {"Carbon Price ($/t)": ("carbon_price", None)},
+        {
+            "Fleet Size": ("fleet_size", None),
+            "Total Cost ($)": ("total_cost_usd", "{:,.2f}"),
+            "Total CO2eq (t)": ("total_co2e_tonnes", "{:,.2f}"),
+            "Avg Safety": ("avg_safety_score", "{:.2f}"),
+        },
+    )
 
 
 def run_diversity_whatif(
     df: pd.DataFrame,
     cargo_demand: float = MONTHLY_DEMAND,
     safety_threshold: float = SAFETY_THRESHOLD,
+    max_workers: int | None = 1,
 ) -> dict[str, Any]:
     """
     Compare fleet selection with and without fuel diversity constraint.
 
+    The two solves are independent; by default they run in-process, and with
+    max_workers > 1 (or None) concurrently (see _map_fleet_milp).
+
     Returns dict with:
     - with_diversity: metrics when require_all_fuel_types=True
     - without_diversity: metrics when require_all_fuel_types=False
@@ -663,31 +767,36 @@ def run_diversity_whatif(
     - fleet_size_diff: fleet size difference
     - fuel_types_lost: fuel types present with diversity but missing without
     """
-    # --- With diversity constraint ---
-    with_ids = select_fleet_milp(
-        df, cargo_demand=cargo_demand, min_avg_safety=safety_threshold,
-        require_all_fuel_types=True,
+    with_ids, without_ids = _map_fleet_milp(
+        df,
+        [
+            {
+                "cargo_demand": cargo_demand,
+                "min_avg_safety": safety_threshold,
+                "require_all_fuel_types": require_all,
+            }
+            for require_all in (True, False)
+        ],
+        max_workers,
     )
+
+    # --- With diversity constraint ---
     if with_ids:
         with_metrics = total_cost_and_metrics(df, with_ids)
         with_subset = df[df["vessel_id"].isin(with_ids)]
         with_fuel_types = set(with_subset["main_engine_fuel_type"].unique())
-        with_fuel_counts = with_subset["main_engine_fuel_type"].value_counts().to_dict()
+        with_fuel_counts = _fuel_type_counts(with_subset)
     else:
         with_metrics = None
         with_fuel_types = set()
         with_fuel_counts = {}
 
     # --- Without diversity constraint ---
-    without_ids = select_fleet_milp(
-        df, cargo_demand=cargo_demand, min_avg_safety=safety_threshold,
-        require_all_fuel_types=False,
-    )
     if without_ids:
         without_metrics = total_cost_and_metrics(df, without_ids)
         without_subset = df[df["vessel_id"].isin(without_ids)]
         without_fuel_types = set(without_subset["main_engine_fuel_type"].unique())
-        without_fuel_counts = without_subset["main_engine_fuel_type"].value_counts().to_dict()
+        without_fuel_counts = _fuel_type_counts(without_subset)
     else:
         without_metrics = None
         without_fuel_types = set()
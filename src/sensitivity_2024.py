@@ -7,13 +7,17 @@ Enhanced sensitivity analysis including:
 Based on Methodology_Report.md Section 4.4 and Methodology_SOP.md Section 8.3
 """
 
-from pathlib import Path
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 import pandas as pd
 import numpy as np
 
 from .optimization import (
+    build_fleet_model,
     select_fleet_milp,
+    selected_rows,
+    solve_fleet_model,
     total_cost_and_metrics,
     validate_fleet,
 )
@@ -23,15 +27,18 @@ def _df_for_milp(df: pd.DataFrame) -> pd.DataFrame:
     """
     Ensure DataFrame has columns required by select_fleet_milp: final_cost, CO2eq, FC_total.
     Copies from total_cost_usd / co2e_tonnes / fuel_tonnes if present (legacy schema).
+    Returns df itself when nothing is missing; it is only read, never modified.
     """
-    out = df.copy()
-    if "final_cost" not in out.columns and "total_cost_usd" in out.columns:
-        out["final_cost"] = out["total_cost_usd"]
-    if "CO2eq" not in out.columns and "co2e_tonnes" in out.columns:
-        out["CO2eq"] = out["co2e_tonnes"]
-    if "FC_total" not in out.columns and "fuel_tonnes" in out.columns:
-        out["FC_total"] = out["fuel_tonnes"]
-    return out
+    missing = {
+        col: df[legacy]
+        for col, legacy in (
+            ("final_cost", "total_cost_usd"),
+            ("CO2eq", "co2e_tonnes"),
+            ("FC_total", "fuel_tonnes"),
+        )
+        if col not in df.columns and legacy in df.columns
+    }
+    return df.assign(**missing) if missing else df
 
 
 # IMO CII calculation and rating
@@ -52,9 +59,33 @@ def calculate_cii(co2_tonnes: float, dwt: float, distance_nm: float = ROUTE_DIST
     Returns:
         CII value in g CO2 / tonne·NM
     """
-    if dwt <= 0 or distance_nm <= 0:
-        return 0.0
-    return (co2_tonnes * 1_000_000) / (dwt * distance_nm)
+    return float(calculate_cii_array(co2_tonnes, dwt, distance_nm))
+
+
+def calculate_cii_array(co2_tonnes, dwt, distance_nm=ROUTE_DISTANCE_NM) -> np.ndarray:
+    """CII for arrays of CO2 / DWT / distance (broadcast); 0 where DWT or distance <= 0."""
+    co2_tonnes = np.asarray(co2_tonnes, dtype=float)
+    dwt = np.asarray(dwt, dtype=float)
+    distance_nm = np.asarray(distance_nm, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cii = (co2_tonnes * 1_000_000) / (dwt * distance_nm)
+    return np.where((dwt <= 0) | (distance_nm <= 0), 0.0, cii)
+
+
+# Cost multiplier per CII rating
+CII_PENALTY_MAP = {
+    'A': 0.95,  # 5% discount
+    'B': 0.98,  # 2% discount
+    'C': 1.00,  # No change
+    'D': 1.05,  # 5% penalty
+    'E': 1.10,  # 10% penalty
+}
+
+# Rating bands A-E: inclusive upper CII bound of A-D (anything above is E),
+# then the rating and cost multiplier indexed by band
+_CII_THRESHOLDS = np.array([3.5, 4.5, 5.5, 6.5])
+_CII_RATINGS = np.array(list(CII_PENALTY_MAP))
+_CII_MULTIPLIERS = np.array(list(CII_PENALTY_MAP.values()))
 
 
 def get_cii_rating(cii_value: float) -> str:
@@ -65,21 +96,14 @@ def get_cii_rating(cii_value: float) -> str:
     Real IMO thresholds are vessel-size and type-specific.
 
     Args:
-        cii_value: CII in g CO2 / tonne·NM
+        cii_value: CII in g CO2 / tonne·NM (or an array of them)
 
     Returns:
-        Rating: 'A' (best) to 'E' (worst)
+        Rating: 'A' (best) to 'E' (worst); an array of ratings for array input
     """
-    if cii_value <= 3.5:
-        return 'A'  # Superior
-    elif cii_value <= 4.5:
-        return 'B'  # Good
-    elif cii_value <= 5.5:
-        return 'C'  # Acceptable
-    elif cii_value <= 6.5:
-        return 'D'  # Needs improvement
-    else:
-        return 'E'  # Poor
+    # A: Superior, B: Good, C: Acceptable, D: Needs improvement, E: Poor
+    ratings = _CII_RATINGS[np.searchsorted(_CII_THRESHOLDS, cii_value, side='left')]
+    return ratings if np.ndim(ratings) else str(ratings)
 
 
 def get_cii_penalty_multiplier(rating: str) -> float:
@@ -92,13 +116,6 @@ def get_cii_penalty_multiplier(rating: str) -> float:
     Returns:
         Multiplier: < 1.0 = discount, > 1.0 = penalty
     """
-    CII_PENALTY_MAP = {
-        'A': 0.95,  # 5% discount
-        'B': 0.98,  # 2% discount
-        'C': 1.00,  # No change
-        'D': 1.05,  # 5% penalty
-        'E': 1.10,  # 10% penalty
-    }
     return CII_PENALTY_MAP.get(rating, 1.0)
 
 
@@ -106,7 +123,7 @@ def apply_cii_penalties(df: pd.DataFrame, co2_col: str = "co2e_tonnes") -> pd.Da
     """
     Calculate CII and apply penalty multipliers to vessel costs.
 
-    Adds columns: 'CII', 'CII_rating', 'CII_penalty_multiplier'
+    Adds columns: 'CII', 'CII_rating' (ordered categorical A-E), 'CII_penalty_multiplier'
     Does NOT modify total_cost_usd - caller should apply multiplier.
 
     Args:
@@ -116,21 +133,16 @@ def apply_cii_penalties(df: pd.DataFrame, co2_col: str = "co2e_tonnes") -> pd.Da
     Returns:
         DataFrame with CII columns added
     """
-    df = df.copy()
-
     # Calculate CII per vessel
-    df['CII'] = df.apply(
-        lambda row: calculate_cii(row[co2_col], row['dwt']),
-        axis=1
-    )
-
-    # Assign ratings
-    df['CII_rating'] = df['CII'].apply(get_cii_rating)
+    cii = calculate_cii_array(df[co2_col].to_numpy(), df['dwt'].to_numpy())
 
-    # Get penalty multipliers
-    df['CII_penalty_multiplier'] = df['CII_rating'].apply(get_cii_penalty_multiplier)
+    # Rating band per vessel (same thresholds as get_cii_rating), found once
+    # and used to look up both the rating and its penalty multiplier
+    band = np.searchsorted(_CII_THRESHOLDS, cii, side='left')
+    ratings = pd.Categorical.from_codes(band, categories=_CII_RATINGS, ordered=True)
+    multipliers = _CII_MULTIPLIERS[band]
 
-    return df
+    return df.assign(CII=cii, CII_rating=ratings, CII_penalty_multiplier=multipliers)
 
 
 def apply_fuel_price_multiplier(df: pd.DataFrame, multiplier: float, cost_col: str = "fuel_cost_usd") -> pd.DataFrame:
@@ -147,26 +159,26 @@ def apply_fuel_price_multiplier(df: pd.DataFrame, multiplier: float, cost_col: s
     Returns:
         DataFrame with adjusted costs
     """
-    df = df.copy()
-
-    # Store original fuel cost
-    df['fuel_cost_usd_original'] = df[cost_col]
-
-    # Apply multiplier
-    df[cost_col] = df[cost_col] * multiplier
+    # Original and adjusted fuel cost
+    original = df[cost_col].to_numpy()
+    adjusted = original * multiplier
 
     # Recalculate total cost
     # total_cost = fuel + carbon + ownership + risk_premium
     # risk_premium is based on (fuel + carbon + ownership), so need to recalc
-    fuel_delta = df[cost_col] - df['fuel_cost_usd_original']
-    df['total_cost_usd'] = df['total_cost_usd'] + fuel_delta
+    fuel_delta = adjusted - original
+    total_cost = df['total_cost_usd'].to_numpy() + fuel_delta
 
     # Recalculate risk premium with new base
     # risk_premium = (fuel + carbon + ownership) * adj_rate
     # New base = original_base + fuel_delta
     # This is approximate - for exact, would need to store safety_adj_rate
 
-    return df
+    return df.assign(**{
+        'fuel_cost_usd_original': original,
+        cost_col: adjusted,
+        'total_cost_usd': total_cost,
+    })
 
 
 def add_port_congestion_fuel(
@@ -192,26 +204,21 @@ def add_port_congestion_fuel(
     Returns:
         DataFrame with increased fuel and emissions
     """
-    df = df.copy()
-
     # Calculate additional auxiliary fuel consumption
     # FC_ae = (ael × sfc_ae × hours) / 1,000,000
     # FC_ab = (abl × sfc_ab × hours) / 1,000,000
-
-    df['congestion_fuel_ae'] = (df['ael'] * df['sfc_ae'] * congestion_hours * aux_load_factor) / 1_000_000
-    df['congestion_fuel_ab'] = (df['abl'] * df['sfc_ab'] * congestion_hours * aux_load_factor) / 1_000_000
-    df['congestion_fuel_total'] = df['congestion_fuel_ae'] + df['congestion_fuel_ab']
-
-    # Add to total fuel
-    df[fuel_col] = df[fuel_col] + df['congestion_fuel_total']
+    fuel_ae = (df['ael'].to_numpy() * df['sfc_ae'].to_numpy() * congestion_hours * aux_load_factor) / 1_000_000
+    fuel_ab = (df['abl'].to_numpy() * df['sfc_ab'].to_numpy() * congestion_hours * aux_load_factor) / 1_000_000
+    fuel_add = fuel_ae + fuel_ab
 
     # Add emissions from congestion fuel (assume Distillate)
     # AE and AB always burn Distillate: Cf_CO2 = 3.206
     DISTILLATE_CF_CO2 = 3.206
-    df['congestion_co2'] = df['congestion_fuel_total'] * DISTILLATE_CF_CO2
-    df[co2_col] = df[co2_col] + df['congestion_co2']
 
-    return df
+    return df.assign(**{
+        fuel_col: df[fuel_col].to_numpy() + fuel_add,
+        co2_col: df[co2_col].to_numpy() + fuel_add * DISTILLATE_CF_CO2,
+    })
 
 
 def run_carbon_price_sensitivity(
@@ -220,6 +227,7 @@ def run_carbon_price_sensitivity(
     min_safety: float,
     carbon_prices: list[float],
     require_all_fuel_types: bool = True,
+    threads: int | None = None,
 ) -> list[dict[str, Any]]:
     """
     Re-run fleet selection at different carbon prices.
@@ -230,38 +238,45 @@ def run_carbon_price_sensitivity(
         min_safety: Minimum average safety score
         carbon_prices: List of carbon prices to test (USD/tonne CO2eq)
         require_all_fuel_types: Require all 8 fuel types
+        threads: Solver threads per MILP (None = solver default)
 
     Returns:
         List of result dicts with metrics for each carbon price
     """
     results = []
 
-    # Store original carbon cost and total cost
-    df_orig = df.copy()
-    original_carbon_price = df_orig['carbon_cost_usd'].iloc[0] / max(df_orig['co2e_tonnes'].iloc[0], 0.001) if len(df_orig) > 0 else 80
+    # df is only read; each price gets its own frame via assign
+    df_orig = df
 
-    for carbon_price in carbon_prices:
-        df_test = df_orig.copy()
+    # Per-vessel inputs that do not depend on the carbon price
+    fuel = df_orig['fuel_cost_usd'].to_numpy()
+    own = df_orig['ownership_cost_usd'].to_numpy()
+    co2 = df_orig['co2e_tonnes'].to_numpy()
 
-        # Recalculate carbon cost
-        df_test['carbon_cost_usd'] = df_test['co2e_tonnes'] * carbon_price
+    # Approximate risk premium recalculation
+    # Assuming safety adjustment rates are stored or can be inferred
+    # For simplicity, recalculate as proportion of new base
+    original_base = fuel + df_orig['carbon_cost_usd'].to_numpy() + own
+    risk_premium_ratio = df_orig['risk_premium_usd'].to_numpy() / original_base.clip(min=1)
 
+    for carbon_price in carbon_prices:
         # Recalculate total cost
         # total = fuel + carbon + ownership + risk_premium
         # risk_premium = (fuel + carbon + ownership) * adj_rate
-        # Need to recalculate properly
-
-        base_cost = df_test['fuel_cost_usd'] + df_test['carbon_cost_usd'] + df_test['ownership_cost_usd']
-
-        # Approximate risk premium recalculation
-        # Assuming safety adjustment rates are stored or can be inferred
-        # For simplicity, recalculate as proportion of new base
-        original_base = df_orig['fuel_cost_usd'] + df_orig['carbon_cost_usd'] + df_orig['ownership_cost_usd']
-        risk_premium_ratio = df_orig['risk_premium_usd'] / original_base.clip(lower=1)
-        df_test['risk_premium_usd'] = base_cost * risk_premium_ratio
-
-        df_test['total_cost_usd'] = base_cost + df_test['risk_premium_usd']
-        df_test['final_cost'] = df_test['total_cost_usd']
+        # (base cost is accumulated in place and then topped up to the total)
+        carbon_cost = co2 * carbon_price
+        total_cost = fuel + carbon_cost
+        total_cost += own
+        risk_premium = total_cost * risk_premium_ratio
+        total_cost += risk_premium
+
+        # Only the cost columns change; assign shares the rest with df_orig
+        df_test = df_orig.assign(
+            carbon_cost_usd=carbon_cost,
+            risk_premium_usd=risk_premium,
+            total_cost_usd=total_cost,
+            final_cost=total_cost,
+        )
         if 'CO2eq' not in df_test.columns and 'co2e_tonnes' in df_test.columns:
             df_test['CO2eq'] = df_test['co2e_tonnes']
         if 'FC_total' not in df_test.columns and 'fuel_tonnes' in df_test.columns:
@@ -274,6 +289,7 @@ def run_carbon_price_sensitivity(
                 cargo_demand=cargo_demand_tonnes,
                 min_avg_safety=min_safety,
                 require_all_fuel_types=require_all_fuel_types,
+                threads=threads,
             )
 
             metrics = total_cost_and_metrics(df_test, selected, cost_col='total_cost_usd')
@@ -302,6 +318,7 @@ def run_2024_scenario(
     min_safety: float,
     scenario_config: dict[str, Any],
     require_all_fuel_types: bool = True,
+    threads: int | None = None,
 ) -> dict[str, Any]:
     """
     Run single 2024 scenario with specified adjustments.
@@ -317,11 +334,13 @@ def run_2024_scenario(
         min_safety: Minimum safety score
         scenario_config: Dict with scenario parameters
         require_all_fuel_types: Require all 8 fuel types
+        threads: Solver threads per MILP (None = solver default)
 
     Returns:
         Dict with metrics and selected vessels
     """
-    df_scenario = df.copy()
+    # Every adjustment returns a new frame, so df itself is never modified
+    df_scenario = df
 
     # Apply adjustments
     if scenario_config.get('congestion_hours', 0) > 0:
@@ -341,10 +360,12 @@ def run_2024_scenario(
     if scenario_config.get('cii_enforcement', False):
         df_scenario = apply_cii_penalties(df_scenario)
         # Apply CII penalty to total cost
-        df_scenario['total_cost_usd_pre_cii'] = df_scenario['total_cost_usd']
-        df_scenario['total_cost_usd'] = df_scenario['total_cost_usd'] * df_scenario['CII_penalty_multiplier']
+        df_scenario = df_scenario.assign(
+            total_cost_usd_pre_cii=df_scenario['total_cost_usd'],
+            total_cost_usd=df_scenario['total_cost_usd'] * df_scenario['CII_penalty_multiplier'],
+        )
 
-    df_scenario['final_cost'] = df_scenario['total_cost_usd']
+    df_scenario = df_scenario.assign(final_cost=df_scenario['total_cost_usd'])
     if 'CO2eq' not in df_scenario.columns and 'co2e_tonnes' in df_scenario.columns:
         df_scenario['CO2eq'] = df_scenario['co2e_tonnes']
     if 'FC_total' not in df_scenario.columns and 'fuel_tonnes' in df_scenario.columns:
@@ -357,6 +378,7 @@ def run_2024_scenario(
             cargo_demand=cargo_demand_tonnes,
             min_avg_safety=min_safety,
             require_all_fuel_types=require_all_fuel_types,
+            threads=threads,
         )
 
         metrics = total_cost_and_metrics(df_scenario, selected, cost_col='total_cost_usd')
@@ -364,9 +386,11 @@ def run_2024_scenario(
 
         # Add CII statistics if enforcement enabled
         if scenario_config.get('cii_enforcement', False):
-            selected_df = df_scenario[df_scenario['vessel_id'].isin(selected)]
-            metrics['avg_cii'] = selected_df['CII'].mean()
-            metrics['cii_rating_distribution'] = selected_df['CII_rating'].value_counts().to_dict()
+            # Row positions of the selected fleet, as total_cost_and_metrics uses
+            rows = selected_rows(df_scenario, selected)
+            metrics['avg_cii'] = df_scenario['CII'].iloc[rows].mean()
+            counts = df_scenario['CII_rating'].iloc[rows].value_counts()
+            metrics['cii_rating_distribution'] = counts[counts > 0].to_dict()
 
         return {
             'scenario_name': scenario_config.get('name', 'Unnamed'),
@@ -383,11 +407,35 @@ def run_2024_scenario(
         }
 
 
+_WORKER_DF: pd.DataFrame | None = None
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    global _WORKER_DF
+    _WORKER_DF = df
+
+
+def _run_task_on_worker(job: tuple[str, Any, float, float, bool]) -> dict[str, Any]:
+    """
+    Run one carbon price or 2024 scenario from run_comprehensive_sensitivity,
+    with a single solver thread so pooled workers do not oversubscribe the CPU.
+    """
+    kind, arg, cargo_demand_tonnes, min_safety, require_all_fuel_types = job
+    if kind == 'carbon_price':
+        return run_carbon_price_sensitivity(
+            _WORKER_DF, cargo_demand_tonnes, min_safety, [arg], require_all_fuel_types, threads=1
+        )[0]
+    return run_2024_scenario(
+        _WORKER_DF, cargo_demand_tonnes, min_safety, arg, require_all_fuel_types, threads=1
+    )
+
+
 def run_comprehensive_sensitivity(
     df: pd.DataFrame,
     cargo_demand_tonnes: float,
     base_min_safety: float = 3.0,
     require_all_fuel_types: bool = True,
+    max_workers: int | None = 1,
 ) -> dict[str, Any]:
     """
     Run all sensitivity analyses from methodology.
@@ -405,6 +453,9 @@ def run_comprehensive_sensitivity(
         cargo_demand_tonnes: Monthly demand
         base_min_safety: Base case minimum safety score
         require_all_fuel_types: Require all 8 fuel types
+        max_workers: Processes for the carbon price and 2024 scenario runs
+            (default 1: in-process; None = one per run, capped at the CPU
+            count, each solving single-threaded)
 
     Returns:
         Dict with all sensitivity results
@@ -416,67 +467,73 @@ def run_comprehensive_sensitivity(
         'scenarios_2024': [],
     }
 
-    # 1. Base case (MILP)
-    df_milp = _df_for_milp(df)
-    try:
-        selected_base = select_fleet_milp(
-            df_milp,
-            cargo_demand=cargo_demand_tonnes,
-            min_avg_safety=base_min_safety,
-            require_all_fuel_types=require_all_fuel_types,
-        )
-        if selected_base:
-            results['base_case'] = {
-                'metrics': total_cost_and_metrics(df_milp, selected_base),
-                'selected_vessel_ids': selected_base,
-            }
-        else:
-            results['base_case'] = {'error': 'Infeasible'}
-    except Exception as e:
-        results['base_case'] = {'error': str(e)}
-
-    # 2. Safety threshold sensitivity (MILP)
+    # The base case and the safety sweep differ only in the threshold, so one
+    # model is built and re-solved once per distinct threshold (the base
+    # threshold is usually also in the sweep). A failed solve keeps its error,
+    # and the model, possibly left half-updated, is rebuilt for the next one.
+    # Thresholds go in ascending order: raising the threshold only shrinks
+    # the feasible set, so a fleet that already meets the next threshold is
+    # still optimal there, and an infeasible threshold stays infeasible.
     safety_thresholds = [2.5, 3.0, 3.5, 4.0, 4.5]
-    for threshold in safety_thresholds:
+    df_milp = _df_for_milp(df)
+    safety = df_milp['safety_score'].to_numpy(dtype=float)
+    model = None
+    fleets: dict[float, list[int] | Exception] = {}
+    prev: list[int] | None = None
+    for threshold in sorted(dict.fromkeys([base_min_safety, *safety_thresholds])):
+        if prev is not None and (not prev or (safety[selected_rows(df_milp, prev)] - threshold).sum() >= 0):
+            fleets[threshold] = prev
+            continue
         try:
-            selected = select_fleet_milp(
-                df_milp,
+            if model is None:
+                model = build_fleet_model(df_milp, require_all_fuel_types)
+            fleets[threshold] = prev = solve_fleet_model(
+                model,
                 cargo_demand=cargo_demand_tonnes,
                 min_avg_safety=threshold,
-                require_all_fuel_types=require_all_fuel_types,
             )
-            if selected:
-                metrics = total_cost_and_metrics(df_milp, selected)
-                results['safety_sensitivity'].append({
-                    'threshold': threshold,
-                    'metrics': metrics,
-                    'selected_vessel_ids': selected,
-                    'error': None,
-                })
-            else:
-                results['safety_sensitivity'].append({
-                    'threshold': threshold,
-                    'error': 'Infeasible',
-                    'metrics': None,
-                })
         except Exception as e:
+            fleets[threshold] = e
+            model = prev = None
+
+    # 1. Base case (MILP)
+    selected_base = fleets[base_min_safety]
+    if isinstance(selected_base, Exception):
+        results['base_case'] = {'error': str(selected_base)}
+    elif selected_base:
+        results['base_case'] = {
+            'metrics': total_cost_and_metrics(df_milp, selected_base),
+            'selected_vessel_ids': selected_base,
+        }
+    else:
+        results['base_case'] = {'error': 'Infeasible'}
+
+    # 2. Safety threshold sensitivity (MILP)
+    for threshold in safety_thresholds:
+        selected = fleets[threshold]
+        if isinstance(selected, Exception):
             results['safety_sensitivity'].append({
                 'threshold': threshold,
-                'error': str(e),
+                'error': str(selected),
+                'metrics': None,
+            })
+        elif selected:
+            metrics = total_cost_and_metrics(df_milp, selected)
+            results['safety_sensitivity'].append({
+                'threshold': threshold,
+                'metrics': metrics,
+                'selected_vessel_ids': list(selected),
+                'error': None,
+            })
+        else:
+            results['safety_sensitivity'].append({
+                'threshold': threshold,
+                'error': 'Infeasible',
                 'metrics': None,
             })
 
-    # 3. Carbon price sensitivity
+    # 3. Carbon price sensitivity and 4. 2024 scenarios
     carbon_prices = [80, 120, 160, 200]
-    results['carbon_price_sensitivity'] = run_carbon_price_sensitivity(
-        df,
-        cargo_demand_tonnes,
-        base_min_safety,
-        carbon_prices,
-        require_all_fuel_types,
-    )
-
-    # 4. 2024 scenarios
     scenarios_2024 = [
         {
             'name': 'Base (Idealised)',
@@ -498,15 +555,37 @@ def run_comprehensive_sensitivity(
         },
     ]
 
-    for scenario_config in scenarios_2024:
-        result = run_2024_scenario(
+    # Each price and scenario re-prices its own frame and solves one MILP,
+    # so they are independent and can run in a process pool sharing df.
+    tasks = [('carbon_price', p) for p in carbon_prices] + [('scenario', c) for c in scenarios_2024]
+    if max_workers is None:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+    if max_workers <= 1:
+        results['carbon_price_sensitivity'] = run_carbon_price_sensitivity(
             df,
             cargo_demand_tonnes,
             base_min_safety,
-            scenario_config,
+            carbon_prices,
             require_all_fuel_types,
         )
-        results['scenarios_2024'].append(result)
+        results['scenarios_2024'] = [
+            run_2024_scenario(
+                df,
+                cargo_demand_tonnes,
+                base_min_safety,
+                scenario_config,
+                require_all_fuel_types,
+            )
+            for scenario_config in scenarios_2024
+        ]
+    else:
+        jobs = [(kind, arg, cargo_demand_tonnes, base_min_safety, require_all_fuel_types) for kind, arg in tasks]
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(df,)
+        ) as ex:
+            outputs = list(ex.map(_run_task_on_worker, jobs))
+        results['carbon_price_sensitivity'] = outputs[:len(carbon_prices)]
+        results['scenarios_2024'] = outputs[len(carbon_prices):]
 
     return results
 
@@ -4,15 +4,24 @@ Utilities: voyage time estimate (distance/speed), path helpers.
 
 from pathlib import Path
 
+import numpy as np
+
 # Approximate distance Singapore to Australia West coast (e.g. Fremantle) in nautical miles
 SINGAPORE_TO_AU_WEST_NM = 2100  # Adjust with actual route data if provided
 
 
 def voyage_hours_from_nm_and_speed(distance_nm: float, speed_knots: float) -> float:
     """Voyage duration in hours. speed_knots = design speed Vref or actual."""
-    if speed_knots <= 0:
-        return 0.0
-    return distance_nm / speed_knots
+    return float(voyage_hours_array(distance_nm, speed_knots))
+
+
+def voyage_hours_array(distance_nm, speed_knots) -> np.ndarray:
+    """Voyage hours for arrays of distance / speed (broadcast); 0 where speed <= 0."""
+    distance_nm = np.asarray(distance_nm, dtype=float)
+    speed_knots = np.asarray(speed_knots, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hours = distance_nm / speed_knots
+    return np.where(speed_knots <= 0, 0.0, hours)
 
 
 def project_root() -> Path:
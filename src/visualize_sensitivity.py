@@ -14,65 +14,174 @@ bars are sorted by impact so the case with the largest value is at the top
 (tornado shape). Clarifies which assumptions drive the most change.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import seaborn as sns
 import pandas as pd
 import numpy as np
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# matplotlib.pyplot, imported by _ensure_mpl() on the first plot so that
+# callers only loading results skip the matplotlib/seaborn import
+plt = None
 
+# Screen resolution, as in charts.py; 300 DPI quadrupled the pixels Agg renders
+SAVE_DPI = 150
+# Pixel budget per PNG (the 20x12 in dashboard at 120 DPI); larger figures are
+# saved at a lower DPI so they cost no more to render than that
+MAX_CHART_PIXELS = 20 * 12 * 120 ** 2
 
-def load_sensitivity_results(results_dir: str = 'outputs/sensitivity') -> dict[str, pd.DataFrame]:
-    """Load all sensitivity CSV results."""
-    results_path = Path(results_dir)
 
-    data = {}
-    files = {
-        'base_case': 'base_case.csv',
-        'safety': 'safety_sensitivity.csv',
-        'carbon': 'carbon_price_sensitivity.csv',
-        'scenarios_2024': '2024_scenarios.csv',
+# Result columns read by the plots below (dwt_<fuel type> columns are matched by
+# prefix); anything else in the CSVs is skipped at parse time
+_PLOT_COLUMNS = frozenset({
+    'safety_threshold', 'carbon_price_usd_per_tco2e', 'scenario_name',
+    'total_cost_usd', 'total_co2e_tonnes', 'fleet_size', 'avg_safety_score', 'avg_cii',
+    'total_capex', 'total_fuel_cost', 'total_carbon_cost', 'total_risk_premium',
+})
+
+
+def _is_plot_column(name: str) -> bool:
+    return name in _PLOT_COLUMNS or name.startswith('dwt_')
+
+
+_RESULT_FILES = {
+    'base_case': 'base_case.csv',
+    'safety': 'safety_sensitivity.csv',
+    'carbon': 'carbon_price_sensitivity.csv',
+    'scenarios_2024': '2024_scenarios.csv',
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    results_dir: str, mtimes: tuple[int | None, ...], plot_columns_only: bool
+) -> dict[str, pd.DataFrame]:
+    """Parsed result tables for one directory state (mtime None = file missing)."""
+    results_path = Path(results_dir)
+    usecols = _is_plot_column if plot_columns_only else None
+    return {
+        key: pd.read_csv(results_path / filename, usecols=usecols) if mtime is not None else pd.DataFrame()
+        for (key, filename), mtime in zip(_RESULT_FILES.items(), mtimes)
     }
 
-    for key, filename in files.items():
-        filepath = results_path / filename
-        if filepath.exists():
-            data[key] = pd.read_csv(filepath)
+
+def _load_results(results_dir: str, plot_columns_only: bool) -> dict[str, pd.DataFrame]:
+    """
+    Result tables of results_dir, optionally cut down to the columns the plots use.
+
+    Parsed tables are memoised per directory and file modification times, so
+    CSVs are only re-read after they change; every call gets its own copies.
+    """
+    results_path = Path(results_dir).resolve()
+    filepaths = [results_path / filename for filename in _RESULT_FILES.values()]
+    mtimes = tuple(f.stat().st_mtime_ns if f.exists() else None for f in filepaths)
+    cached = _load_cached(str(results_path), mtimes, plot_columns_only)
+
+    data = {}
+    for (key, filename), mtime in zip(_RESULT_FILES.items(), mtimes):
+        data[key] = cached[key].copy()
+        if mtime is not None:
             print(f"Loaded {key}: {len(data[key])} rows")
         else:
             print(f"Warning: {filename} not found")
-            data[key] = pd.DataFrame()
 
     return data
 
 
-def _suffix_path(output_path: Path, base_name: str, suffix: str = "") -> Path:
-    """Return output_path / (base_name + suffix + .png)."""
-    name = base_name.replace(".png", "") + suffix + ".png"
+def load_sensitivity_results(results_dir: str = 'outputs/sensitivity') -> dict[str, pd.DataFrame]:
+    """
+    Load all sensitivity CSV results.
+
+    CSVs are only re-read after they change (see _load_results).
+    """
+    return _load_results(results_dir, plot_columns_only=False)
+
+
+def _valid_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a positive total cost (solved runs); df itself if that is every row."""
+    valid = df['total_cost_usd'] > 0
+    return df if valid.all() else df[valid]
+
+
+def _sorted_by(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """df ordered by column with a fresh index; df itself if it already is."""
+    if df[column].is_monotonic_increasing and df.index.equals(pd.RangeIndex(len(df))):
+        return df
+    return df.sort_values(column).reset_index(drop=True)
+
+
+def _ensure_mpl() -> None:
+    """Import pyplot on the Agg backend and set the chart style on first use."""
+    global plt
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('Agg')  # Charts are only written to files; no GUI toolkit
+    import matplotlib.pyplot as pyplot
+    import seaborn as sns
+
+    from matplotlib import font_manager
+
+    pyplot.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+    # Resolve the regular and bold chart fonts now rather than at first draw
+    for weight in ('normal', 'bold'):
+        font_manager.findfont(font_manager.FontProperties(weight=weight))
+    plt = pyplot
+
+
+# Output formats accepted by generate_all_visualizations
+PLOT_FORMATS = ('png', 'svg', 'pdf')
+
+
+def _suffix_path(output_path: Path, base_name: str, suffix: str = "", fmt: str = 'png') -> Path:
+    """Return output_path / (base_name + suffix + .fmt)."""
+    name = base_name.replace(".png", "") + suffix + "." + fmt
     return output_path / name
 
 
-def plot_safety_pareto_frontier(df_safety: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def _save_chart(path: Path) -> None:
+    """
+    Save the current figure, as SVG, PDF or PNG by extension.
+
+    SVG and PDF skip Agg rasterisation entirely. PNGs are saved at SAVE_DPI, lowered
+    for figures that would exceed MAX_CHART_PIXELS.
+    """
+    if path.suffix == '.svg':
+        # Fixed element ids and no timestamp: unchanged charts give identical files
+        with plt.rc_context({'svg.hashsalt': 'visualize_sensitivity'}):
+            plt.savefig(path, format='svg', bbox_inches='tight', metadata={'Date': None})
+        return
+    if path.suffix == '.pdf':
+        plt.savefig(path, format='pdf', bbox_inches='tight', metadata={'CreationDate': None})
+        return
+
+    width, height = plt.gcf().get_size_inches()
+    dpi = min(SAVE_DPI, (MAX_CHART_PIXELS / (width * height)) ** 0.5)
+    plt.savefig(path, format='png', dpi=dpi, bbox_inches='tight')
+
+
+def plot_safety_pareto_frontier(df_safety: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Plot cost vs safety Pareto frontier.
 
     Left: cost vs minimum safety threshold (one point per constraint, clear curve).
     Right: fleet size vs minimum safety threshold.
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-
+    _ensure_mpl()
     # Filter valid rows and sort by threshold so the line connects in order
-    df = df_safety[df_safety['total_cost_usd'] > 0].copy()
+    df = _valid_rows(df_safety)
     if len(df) == 0:
         print("No valid safety data for Pareto plot")
         return
-    df = df.sort_values('safety_threshold').reset_index(drop=True)
+    df = _sorted_by(df, 'safety_threshold')
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
     # Plot 1: Cost vs minimum safety threshold (x = threshold, so one point per run, no duplicates)
     ax1.plot(df['safety_threshold'], df['total_cost_usd'] / 1e6,
@@ -86,9 +195,11 @@ def plot_safety_pareto_frontier(df_safety: pd.DataFrame, output_path: Path, suff
     ax1.grid(True, alpha=0.3)
 
     # Annotate with threshold (matches x-axis)
-    for _, row in df.iterrows():
-        ax1.annotate(f"≥{row['safety_threshold']:.1f}",
-                    xy=(row['safety_threshold'], row['total_cost_usd'] / 1e6),
+    thresholds = df['safety_threshold'].to_numpy()
+    costs_m = df['total_cost_usd'].to_numpy() / 1e6
+    for thr, cost_m in zip(thresholds, costs_m):
+        ax1.annotate(f"≥{thr:.1f}",
+                    xy=(thr, cost_m),
                     xytext=(5, 5), textcoords='offset points',
                     fontsize=9, alpha=0.7)
 
@@ -104,19 +215,20 @@ def plot_safety_pareto_frontier(df_safety: pd.DataFrame, output_path: Path, suff
     ax2.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    out = _suffix_path(output_path, 'safety_pareto_frontier.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'safety_pareto_frontier.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_carbon_price_sensitivity(df_carbon: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def plot_carbon_price_sensitivity(df_carbon: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Plot carbon price sensitivity curves.
 
     Shows how fleet cost and CO2eq respond to carbon pricing.
     """
-    df = df_carbon[df_carbon['total_cost_usd'] > 0].copy()
+    _ensure_mpl()
+    df = _valid_rows(df_carbon)
 
     if len(df) == 0:
         print("No valid carbon price data")
@@ -148,10 +260,9 @@ def plot_carbon_price_sensitivity(df_carbon: pd.DataFrame, output_path: Path, su
 
     # Add elasticity annotation
     if len(df) >= 2:
-        cost_change_pct = ((df['total_cost_usd'].iloc[-1] - df['total_cost_usd'].iloc[0]) /
-                           df['total_cost_usd'].iloc[0]) * 100
-        emis_change_pct = ((df['total_co2e_tonnes'].iloc[-1] - df['total_co2e_tonnes'].iloc[0]) /
-                           max(df['total_co2e_tonnes'].iloc[0], 1)) * 100
+        (cost0, emis0), (cost1, emis1) = df[['total_cost_usd', 'total_co2e_tonnes']].iloc[[0, -1]].to_numpy()
+        cost_change_pct = (cost1 - cost0) / cost0 * 100
+        emis_change_pct = (emis1 - emis0) / max(emis0, 1) * 100
 
         ax1.text(0.05, 0.95, f'Cost change: {cost_change_pct:+.1f}%',
                 transform=ax1.transAxes, fontsize=10,
@@ -162,8 +273,8 @@ def plot_carbon_price_sensitivity(df_carbon: pd.DataFrame, output_path: Path, su
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     plt.tight_layout()
-    out = _suffix_path(output_path, 'carbon_price_sensitivity.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'carbon_price_sensitivity.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
@@ -171,16 +282,17 @@ def plot_carbon_price_sensitivity(df_carbon: pd.DataFrame, output_path: Path, su
 # --- Mandatory methodology charts (1–5) ---------------------------------------
 
 
-def plot_cost_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def plot_cost_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Line chart: Total Fleet Cost vs Safety Threshold.
     Optional second line: Fleet size (or total DWT).
     Shows marginal cost of safety.
     """
-    df = df_safety[df_safety['total_cost_usd'] > 0].copy()
+    _ensure_mpl()
+    df = _valid_rows(df_safety)
     if len(df) == 0:
         return
-    df = df.sort_values('safety_threshold').reset_index(drop=True)
+    df = _sorted_by(df, 'safety_threshold')
     fig, ax1 = plt.subplots(figsize=(10, 6))
     ax1.plot(df['safety_threshold'], df['total_cost_usd'] / 1e6, marker='o', linewidth=2,
              markersize=10, color='#2E86AB', label='Total fleet cost (M$)')
@@ -195,54 +307,62 @@ def plot_cost_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Path, su
     ax2.set_ylabel('Fleet size (number of vessels)', fontsize=12, fontweight='bold')
     ax2.legend(loc='upper right')
     plt.tight_layout()
-    out = _suffix_path(output_path, 'cost_vs_safety_threshold.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'cost_vs_safety_threshold.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_cost_breakdown_vs_safety(df_safety: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+# Stacked cost components in plot order: column -> (legend label, colour)
+_COST_COMPONENTS = {
+    'total_capex': ('CAPEX', '#4A90E2'),
+    'total_fuel_cost': ('Fuel cost', '#F39C12'),
+    'total_carbon_cost': ('Carbon cost', '#6A994E'),
+    'total_risk_premium': ('Risk premium', '#E74C3C'),
+}
+
+
+def plot_cost_breakdown_vs_safety(df_safety: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Stacked bar: Cost breakdown (CAPEX, Fuel, Carbon, Risk premium) vs safety threshold.
     """
-    need = ['total_capex', 'total_fuel_cost', 'total_carbon_cost', 'total_risk_premium']
-    if not all(c in df_safety.columns for c in need):
+    _ensure_mpl()
+    if not all(c in df_safety.columns for c in _COST_COMPONENTS):
         print("Cost breakdown columns missing; skip cost breakdown chart")
         return
-    df = df_safety[df_safety['total_cost_usd'] > 0].copy()
+    df = _valid_rows(df_safety)
     if len(df) == 0:
         return
-    df = df.sort_values('safety_threshold').reset_index(drop=True)
+    df = _sorted_by(df, 'safety_threshold')
     x = df['safety_threshold'].astype(str)
-    cap = (df['total_capex'] / 1e6).fillna(0)
-    fuel = (df['total_fuel_cost'] / 1e6).fillna(0)
-    carbon = (df['total_carbon_cost'] / 1e6).fillna(0)
-    risk = (df['total_risk_premium'] / 1e6).fillna(0)
+    # (threshold, component) costs in M$, each stack starting where the previous ends
+    values = df[list(_COST_COMPONENTS)].fillna(0).to_numpy(dtype=float) / 1e6
+    bottoms = np.zeros_like(values)
+    bottoms[:, 1:] = np.cumsum(values, axis=1)[:, :-1]
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.bar(x, cap, label='CAPEX', color='#4A90E2', alpha=0.9)
-    ax.bar(x, fuel, bottom=cap, label='Fuel cost', color='#F39C12', alpha=0.9)
-    ax.bar(x, carbon, bottom=cap + fuel, label='Carbon cost', color='#6A994E', alpha=0.9)
-    ax.bar(x, risk, bottom=cap + fuel + carbon, label='Risk premium', color='#E74C3C', alpha=0.9)
+    for i, (label, color) in enumerate(_COST_COMPONENTS.values()):
+        ax.bar(x, values[:, i], bottom=bottoms[:, i], label=label, color=color, alpha=0.9)
     ax.set_xlabel('Minimum average safety threshold', fontsize=12, fontweight='bold')
     ax.set_ylabel('Cost (Million USD)', fontsize=12, fontweight='bold')
     ax.set_title('Cost Breakdown vs Safety Threshold', fontsize=14, fontweight='bold')
     ax.legend(loc='upper right')
     ax.grid(axis='y', alpha=0.3)
     plt.tight_layout()
-    out = _suffix_path(output_path, 'cost_breakdown_vs_safety.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'cost_breakdown_vs_safety.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_emissions_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def plot_emissions_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Line chart: Fleet emissions (total CO₂eq) vs safety threshold.
     """
-    df = df_safety[df_safety['total_cost_usd'] > 0].copy()
+    _ensure_mpl()
+    df = _valid_rows(df_safety)
     if len(df) == 0:
         return
-    df = df.sort_values('safety_threshold').reset_index(drop=True)
+    df = _sorted_by(df, 'safety_threshold')
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(df['safety_threshold'], df['total_co2e_tonnes'] / 1000, marker='o', linewidth=2,
             markersize=10, color='#6A994E')
@@ -251,38 +371,40 @@ def plot_emissions_vs_safety_threshold(df_safety: pd.DataFrame, output_path: Pat
     ax.set_title('Fleet Emissions vs Safety Threshold', fontsize=14, fontweight='bold')
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
-    out = _suffix_path(output_path, 'emissions_vs_safety_threshold.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'emissions_vs_safety_threshold.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_fuel_mix_vs_carbon_price(df_carbon: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def plot_fuel_mix_vs_carbon_price(df_carbon: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Stacked bar: Share of fleet by total DWT by fuel type vs carbon price.
     x: Carbon price ($80, $120, $160, $200); y: share of DWT (stacks = fuel types).
     """
-    df = df_carbon[df_carbon['total_cost_usd'] > 0].copy()
+    _ensure_mpl()
+    df = _valid_rows(df_carbon)
     if len(df) == 0:
         return
     dwt_cols = [c for c in df.columns if c.startswith('dwt_')]
     if not dwt_cols:
         print("No dwt_* columns; skip fuel mix vs carbon price chart")
         return
-    df = df.sort_values('carbon_price_usd_per_tco2e').reset_index(drop=True)
+    df = _sorted_by(df, 'carbon_price_usd_per_tco2e')
     x_labels = [f"${int(p)}" for p in df['carbon_price_usd_per_tco2e']]
     x_pos = np.arange(len(x_labels))
-    total_dwt = df[dwt_cols].sum(axis=1)
-    total_dwt = total_dwt.replace(0, np.nan)
+    total_dwt = df[dwt_cols].sum(axis=1).to_numpy()
     # Stack order: deterministic by column name
     fuel_order = sorted(dwt_cols, key=lambda c: c.replace('dwt_', ''))
-    bottom = np.zeros(len(df))
+    # (carbon price, fuel) DWT shares in one pass; 0 for rows with no DWT at all
+    dwt = df[fuel_order].fillna(0).to_numpy(dtype=float)
+    shares = np.divide(dwt, total_dwt[:, None], out=np.zeros_like(dwt), where=total_dwt[:, None] > 0)
+    bottoms = np.zeros_like(shares)
+    bottoms[:, 1:] = np.cumsum(shares, axis=1)[:, :-1]
     fig, ax = plt.subplots(figsize=(10, 6))
     colors = plt.cm.tab10(np.linspace(0, 1, len(fuel_order)))
     for i, col in enumerate(fuel_order):
-        share = (df[col].fillna(0) / total_dwt).fillna(0).values
-        ax.bar(x_pos, share, bottom=bottom, label=col.replace('dwt_', ''), color=colors[i % len(colors)], alpha=0.9)
-        bottom = bottom + share
+        ax.bar(x_pos, shares[:, i], bottom=bottoms[:, i], label=col.replace('dwt_', ''), color=colors[i % len(colors)], alpha=0.9)
     ax.set_xticks(x_pos)
     ax.set_xticklabels(x_labels)
     ax.set_xlabel('Carbon price (USD / tCO₂eq)', fontsize=12, fontweight='bold')
@@ -292,13 +414,13 @@ def plot_fuel_mix_vs_carbon_price(df_carbon: pd.DataFrame, output_path: Path, su
     ax.set_ylim(0, 1)
     ax.grid(axis='y', alpha=0.3)
     plt.tight_layout()
-    out = _suffix_path(output_path, 'fuel_mix_vs_carbon_price.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'fuel_mix_vs_carbon_price.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "") -> None:
+def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     MACC: Marginal Abatement Cost Curve (formal definition).
     Baseline: min avg safety ≥ 3.0, carbon price = USD 80/tCO₂eq.
@@ -307,6 +429,7 @@ def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = ""
     Bars contiguous; each bar = one scenario (bar_left, width=abatement, height=MAC).
     Fallback: if abatement volumes are extremely small, plot simple bar chart and skip MACC.
     """
+    _ensure_mpl()
     base = data.get('base_case')
     safety = data.get('safety')
     if base is None or base.empty or safety is None or safety.empty:
@@ -318,31 +441,25 @@ def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = ""
         return
 
     # One policy axis only: safety tightening. Exclude baseline (3.0) and carbon scenarios.
-    rows = []
-    for _, row in safety.iterrows():
-        t = row.get('safety_threshold')
-        if t is None or t <= 3.0:
-            continue
-        co2_i = row.get('total_co2e_tonnes')
-        cost_i = row.get('total_cost_usd')
-        if co2_i is None or cost_i is None or cost_i <= 0:
-            continue
-        abatement = baseline_co2 - float(co2_i)  # tonnes
-        if abatement <= 0:
-            continue
-        delta_cost = float(cost_i) - baseline_cost
-        mac = delta_cost / abatement  # USD / tCO₂eq
-        rows.append({
-            'threshold': t,
-            'label': f"≥{t:.1f}",
-            'abatement': abatement,
-            'delta_cost': delta_cost,
-            'mac': mac,
-        })
-    if not rows:
+    # Missing values (NaN) fail none of the exclusion tests, as with the scalar checks.
+    if not {'safety_threshold', 'total_co2e_tonnes', 'total_cost_usd'} <= set(safety.columns):
         return
-
-    df = pd.DataFrame(rows)
+    thresholds = safety['safety_threshold'].to_numpy(dtype=float)
+    costs = safety['total_cost_usd'].to_numpy(dtype=float)
+    abatement = baseline_co2 - safety['total_co2e_tonnes'].to_numpy(dtype=float)  # tonnes
+    keep = ~(thresholds <= 3.0) & ~(costs <= 0) & ~(abatement <= 0)
+    if not keep.any():
+        return
+    thresholds, abatement = thresholds[keep], abatement[keep]
+    delta_cost = costs[keep] - baseline_cost
+
+    df = pd.DataFrame({
+        'threshold': thresholds,
+        'label': [f"≥{t:.1f}" for t in thresholds],
+        'abatement': abatement,
+        'delta_cost': delta_cost,
+        'mac': delta_cost / abatement,  # USD / tCO₂eq
+    })
     # Sort by increasing MAC (MACC construction rule)
     df = df.sort_values('mac', ascending=True).reset_index(drop=True)
     df['cum_abatement'] = df['abatement'].cumsum()
@@ -361,8 +478,8 @@ def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = ""
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
         plt.tight_layout()
-        out = _suffix_path(output_path, 'macc.png', suffix)
-        plt.savefig(out, dpi=300, bbox_inches='tight')
+        out = _suffix_path(output_path, 'macc.png', suffix, fmt)
+        _save_chart(out)
         plt.close()
         print(f"Saved: {out} (fallback bar chart)")
         return
@@ -370,10 +487,13 @@ def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = ""
     # Proper MACC: x = cumulative abatement (tonnes), y = MAC ($/t). Contiguous bars.
     fig, ax = plt.subplots(figsize=(10, 6))
     colors = plt.cm.Blues(np.linspace(0.4, 0.9, len(df)))
-    for i, (_, r) in enumerate(df.iterrows()):
-        ax.bar(r['bar_left'], r['mac'], width=r['abatement'], align='edge', color=colors[i], alpha=0.9, edgecolor='#1a5276', linewidth=0.8)
-        # Label at bar centre
-        ax.text(r['bar_left'] + r['abatement'] / 2, r['mac'] / 2, r['label'], ha='center', va='center', fontsize=11, fontweight='bold', color='white')
+    bar_left = df['bar_left'].to_numpy()
+    mac = df['mac'].to_numpy()
+    abatement = df['abatement'].to_numpy()
+    ax.bar(bar_left, mac, width=abatement, align='edge', color=colors, alpha=0.9, edgecolor='#1a5276', linewidth=0.8)
+    # Label at bar centre
+    for x, y, label in zip(bar_left + abatement / 2, mac / 2, df['label']):
+        ax.text(x, y, label, ha='center', va='center', fontsize=11, fontweight='bold', color='white')
     ax.axhline(80, color='red', linestyle='--', linewidth=1.5, label='Carbon price $80/tCO₂eq')
     ax.set_xlabel('Cumulative CO₂eq abated (tonnes)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Marginal abatement cost (USD / tCO₂eq)', fontsize=12, fontweight='bold')
@@ -382,141 +502,124 @@ def plot_macc(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = ""
     ax.grid(axis='y', alpha=0.3)
     ax.set_ylim(bottom=0)
     plt.tight_layout()
-    out = _suffix_path(output_path, 'macc.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'macc.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_2024_scenario_comparison(df_scenarios: pd.DataFrame, output_path: Path, suffix: str = "") -> None:
+def _label_bars(ax, bars, fmt, positive_only: bool = False) -> None:
+    """Value label on top of each bar, fmt(height); blank for heights <= 0 if positive_only."""
+    labels = [fmt(h) if h > 0 or not positive_only else '' for h in bars.datavalues]
+    ax.bar_label(bars, labels=labels, fontsize=9)
+
+
+def plot_2024_scenario_comparison(df_scenarios: pd.DataFrame, output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Compare 2024 route-specific scenarios.
 
     Bar chart comparing key metrics across Base/Typical/Stress scenarios.
     """
+    _ensure_mpl()
     if len(df_scenarios) == 0:
         print("No 2024 scenario data")
         return
 
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
 
+    # Bars sit at fixed positions shared by all four panels, rather than each
+    # ax.bar mapping the scenario names onto a categorical axis again
     scenarios = df_scenarios['scenario_name'].tolist()
+    x = np.arange(len(scenarios))
     colors = ['#4A90E2', '#F39C12', '#E74C3C']
 
     # Plot 1: Total cost
     ax = axes[0, 0]
-    costs = df_scenarios['total_cost_usd'] / 1e6
-    bars = ax.bar(scenarios, costs, color=colors, alpha=0.7, edgecolor='black')
+    costs = df_scenarios['total_cost_usd'].to_numpy() / 1e6
+    bars = ax.bar(x, costs, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(x, scenarios)
     ax.set_ylabel('Total Fleet Cost (Million USD)', fontsize=11, fontweight='bold')
     ax.set_title('Fleet Cost by Scenario', fontsize=13, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
 
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'${height:.1f}M',
-                   ha='center', va='bottom', fontsize=9)
+    _label_bars(ax, bars, lambda h: f'${h:.1f}M', positive_only=True)
 
     # Plot 2: Emissions
     ax = axes[0, 1]
-    emissions = df_scenarios['total_co2e_tonnes'] / 1000
-    bars = ax.bar(scenarios, emissions, color=colors, alpha=0.7, edgecolor='black')
+    emissions = df_scenarios['total_co2e_tonnes'].to_numpy() / 1000
+    bars = ax.bar(x, emissions, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(x, scenarios)
     ax.set_ylabel('Total Emissions (Thousand tonnes CO₂eq)', fontsize=11, fontweight='bold')
     ax.set_title('Fleet Emissions by Scenario', fontsize=13, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
 
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:.1f}kt',
-               ha='center', va='bottom', fontsize=9)
+    _label_bars(ax, bars, lambda h: f'{h:.1f}kt')
 
     # Plot 3: Fleet size
     ax = axes[1, 0]
-    fleet_sizes = df_scenarios['fleet_size']
-    bars = ax.bar(scenarios, fleet_sizes, color=colors, alpha=0.7, edgecolor='black')
+    fleet_sizes = df_scenarios['fleet_size'].to_numpy()
+    bars = ax.bar(x, fleet_sizes, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(x, scenarios)
     ax.set_ylabel('Fleet Size (Number of Vessels)', fontsize=11, fontweight='bold')
     ax.set_title('Fleet Size by Scenario', fontsize=13, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
 
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{int(height)}',
-               ha='center', va='bottom', fontsize=9)
+    _label_bars(ax, bars, lambda h: f'{int(h)}')
 
     # Plot 4: Average CII (if available)
     ax = axes[1, 1]
     if 'avg_cii' in df_scenarios.columns:
-        cii_values = df_scenarios['avg_cii'].fillna(0)
-        bars = ax.bar(scenarios, cii_values, color=colors, alpha=0.7, edgecolor='black')
+        cii_values = df_scenarios['avg_cii'].fillna(0).to_numpy()
+        bars = ax.bar(x, cii_values, color=colors, alpha=0.7, edgecolor='black')
+        ax.set_xticks(x, scenarios)
         ax.set_ylabel('Average CII (g CO₂/tonne·NM)', fontsize=11, fontweight='bold')
         ax.set_title('Carbon Intensity by Scenario', fontsize=13, fontweight='bold')
         ax.grid(axis='y', alpha=0.3)
 
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.1f}',
-                       ha='center', va='bottom', fontsize=9)
+        _label_bars(ax, bars, lambda h: f'{h:.1f}', positive_only=True)
     else:
         ax.text(0.5, 0.5, 'CII data not available',
                ha='center', va='center', transform=ax.transAxes, fontsize=12)
         ax.axis('off')
 
     plt.tight_layout()
-    out = _suffix_path(output_path, '2024_scenario_comparison.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, '2024_scenario_comparison.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
+# Case label per source table for the tornado charts, built column-wise
+_TORNADO_CASE_LABELS = {
+    'safety': lambda df: df['safety_threshold'].map("Safety≥{:.1f}".format),
+    'carbon': lambda df: "C$" + df['carbon_price_usd_per_tco2e'].astype(int).astype(str),
+    'scenarios_2024': lambda df: df['scenario_name'].str[:14] if 'scenario_name' in df.columns else 'Scenario',
+}
+
+
 def _build_tornado_cases(data: dict[str, pd.DataFrame]) -> pd.DataFrame:
     """Build a single DataFrame of sensitivity cases with cost and emissions for tornado charts."""
-    rows = []
-    # Safety sensitivity
-    df_safety = data['safety']
-    if not df_safety.empty:
-        for _, row in df_safety.iterrows():
-            if row['total_cost_usd'] > 0:
-                rows.append({
-                    'case': f"Safety≥{row['safety_threshold']:.1f}",
-                    'cost_m': row['total_cost_usd'] / 1e6,
-                    'emissions_kt': row['total_co2e_tonnes'] / 1000,
-                    'fleet_size': row['fleet_size'],
-                    'avg_safety': row['avg_safety_score'],
-                })
-    # Carbon price sensitivity
-    df_carbon = data['carbon']
-    if not df_carbon.empty:
-        for _, row in df_carbon.iterrows():
-            if row['total_cost_usd'] > 0:
-                rows.append({
-                    'case': f"C${int(row['carbon_price_usd_per_tco2e'])}",
-                    'cost_m': row['total_cost_usd'] / 1e6,
-                    'emissions_kt': row['total_co2e_tonnes'] / 1000,
-                    'fleet_size': row['fleet_size'],
-                    'avg_safety': row['avg_safety_score'],
-                })
-    # 2024 scenarios (if present)
-    df_scenarios = data['scenarios_2024']
-    if not df_scenarios.empty:
-        for _, row in df_scenarios.iterrows():
-            if row['total_cost_usd'] > 0:
-                rows.append({
-                    'case': (row['scenario_name'][:14] if 'scenario_name' in row else 'Scenario'),
-                    'cost_m': row['total_cost_usd'] / 1e6,
-                    'emissions_kt': row['total_co2e_tonnes'] / 1000,
-                    'fleet_size': row['fleet_size'],
-                    'avg_safety': row['avg_safety_score'],
-                })
-    return pd.DataFrame(rows)
-
-
-def plot_tornado_analysis(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "") -> None:
+    # Safety sensitivity, carbon price sensitivity, then 2024 scenarios (if present)
+    parts = []
+    for key, case_labels in _TORNADO_CASE_LABELS.items():
+        df = data[key]
+        if df.empty:
+            continue
+        df = _valid_rows(df)
+        parts.append(pd.DataFrame({
+            'case': case_labels(df),
+            'cost_m': df['total_cost_usd'] / 1e6,
+            'emissions_kt': df['total_co2e_tonnes'] / 1000,
+            'fleet_size': df['fleet_size'],
+            'avg_safety': df['avg_safety_score'],
+        }))
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, ignore_index=True)
+
+
+def plot_tornado_analysis(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Tornado analysis: one horizontal bar per sensitivity case, sorted by impact.
 
@@ -530,6 +633,7 @@ def plot_tornado_analysis(data: dict[str, pd.DataFrame], output_path: Path, suff
     (safety thresholds + carbon prices). No base-case reference line; the chart
     compares levels across scenarios.
     """
+    _ensure_mpl()
     df = _build_tornado_cases(data)
     if df.empty:
         print("No data for tornado analysis")
@@ -562,16 +666,17 @@ def plot_tornado_analysis(data: dict[str, pd.DataFrame], output_path: Path, suff
         fontsize=11, fontweight='normal', y=1.02,
     )
     plt.tight_layout()
-    out = _suffix_path(output_path, 'tornado_analysis.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'tornado_analysis.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
-def plot_combined_summary(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "") -> None:
+def plot_combined_summary(data: dict[str, pd.DataFrame], output_path: Path, suffix: str = "", fmt: str = 'png') -> None:
     """
     Create single-page summary dashboard with all key insights.
     """
+    _ensure_mpl()
     fig = plt.figure(figsize=(20, 12))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
 
@@ -581,7 +686,7 @@ def plot_combined_summary(data: dict[str, pd.DataFrame], output_path: Path, suff
 
     # 1. Safety Pareto (top left)
     ax1 = fig.add_subplot(gs[0, 0])
-    df_safety = data['safety'][data['safety']['total_cost_usd'] > 0]
+    df_safety = _valid_rows(data['safety'])
     if not df_safety.empty:
         ax1.plot(df_safety['avg_safety_score'], df_safety['total_cost_usd'] / 1e6,
                 marker='o', linewidth=2, color='#2E86AB')
@@ -592,7 +697,7 @@ def plot_combined_summary(data: dict[str, pd.DataFrame], output_path: Path, suff
 
     # 2. Carbon price response (top middle)
     ax2 = fig.add_subplot(gs[0, 1])
-    df_carbon = data['carbon'][data['carbon']['total_cost_usd'] > 0]
+    df_carbon = _valid_rows(data['carbon'])
     if not df_carbon.empty:
         ax2.plot(df_carbon['carbon_price_usd_per_tco2e'], df_carbon['total_co2e_tonnes'] / 1000,
                 marker='D', linewidth=2, color='#6A994E')
@@ -621,15 +726,51 @@ def plot_combined_summary(data: dict[str, pd.DataFrame], output_path: Path, suff
     fig.text(0.99, 0.01, 'Generated by Maritime Optimization System',
             ha='right', va='bottom', fontsize=8, alpha=0.5)
 
-    out = _suffix_path(output_path, 'summary_dashboard.png', suffix)
-    plt.savefig(out, dpi=300, bbox_inches='tight')
+    out = _suffix_path(output_path, 'summary_dashboard.png', suffix, fmt)
+    _save_chart(out)
     plt.close()
     print(f"Saved: {out}")
 
 
+# Manifest of the input signature each chart in an output directory was drawn from
+_PLOT_CACHE = '.plotcache.json'
+
+
+def _code_salt() -> str:
+    """
+    Digest of everything besides the data that shapes a chart file.
+
+    Covers this module's source, the PNG resolution settings, the matplotlib
+    and seaborn versions and the active rcParams (style, palette, fonts), so
+    upgrading either library or changing the style redraws every chart.
+    """
+    _ensure_mpl()
+    import matplotlib
+    import seaborn as sns
+
+    salt = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    salt.update(f"{SAVE_DPI}:{MAX_CHART_PIXELS}".encode())
+    salt.update(f"{matplotlib.__version__}:{sns.__version__}".encode())
+    salt.update(repr(sorted(plt.rcParams.items())).encode())
+    return salt.hexdigest()
+
+
+def _data_signature(plot_data: pd.DataFrame | dict[str, pd.DataFrame], salt: str = "") -> str:
+    """Digest of a chart's input tables (keys, column names, index and values), plus salt."""
+    frames = sorted(plot_data.items()) if isinstance(plot_data, dict) else [('', plot_data)]
+    sig = hashlib.blake2b(salt.encode(), digest_size=16)
+    for key, df in frames:
+        sig.update(f"{key}:{list(df.columns)}".encode())
+        sig.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return sig.hexdigest()
+
+
 def generate_all_visualizations(results_dir: str = 'outputs/sensitivity',
                                 output_dir: Optional[str] = None,
-                                suffix: str = "") -> None:
+                                suffix: str = "",
+                                max_workers: Optional[int] = 1,
+                                force: bool = False,
+                                fmt: str = 'png') -> None:
     """
     Generate all visualization types.
 
@@ -637,7 +778,20 @@ def generate_all_visualizations(results_dir: str = 'outputs/sensitivity',
         results_dir: Directory containing CSV results
         output_dir: Directory to save plots (defaults to results_dir/plots)
         suffix: Optional suffix for plot filenames (e.g. _milp or _minmax)
+        max_workers: Processes rendering charts in parallel (default 1:
+            in-process, which is faster for this chart set; None = one per
+            chart, capped at the CPU count)
+        force: Redraw every chart. Otherwise a chart whose file exists and
+            whose input tables, plotting code (this module), SAVE_DPI /
+            MAX_CHART_PIXELS, matplotlib / seaborn versions and rcParams
+            match the signature recorded in output_dir/.plotcache.json is
+            skipped.
+        fmt: Chart file format, 'png' (default), or 'svg' / 'pdf' for vector
+            output with no rasterisation
     """
+    if fmt not in PLOT_FORMATS:
+        raise ValueError(f"Unknown plot format {fmt!r}; expected one of {PLOT_FORMATS}")
+
     if output_dir is None:
         output_dir = f"{results_dir}/plots"
 
@@ -645,33 +799,89 @@ def generate_all_visualizations(results_dir: str = 'outputs/sensitivity',
     output_path.mkdir(parents=True, exist_ok=True)
 
     print("Loading sensitivity results...")
-    data = load_sensitivity_results(results_dir)
+    data = _load_results(results_dir, plot_columns_only=True)
+
+    # Drop unsolved runs and order each sweep once; the plots' own
+    # _valid_rows/_sorted_by are then no-ops. The emptiness checks below stay
+    # on the raw tables so the plots still report runs with no valid rows.
+    valid = dict(data)
+    for key, column in (('safety', 'safety_threshold'), ('carbon', 'carbon_price_usd_per_tco2e')):
+        if {'total_cost_usd', column} <= set(data[key].columns):
+            valid[key] = _sorted_by(_valid_rows(data[key]), column)
 
     print("\nGenerating visualizations...")
 
+    # Each chart renders and saves independently of the others. Multi-table
+    # charts get only the tables they read, which keeps pool pickles small and
+    # their plot-cache signatures blind to unrelated result files.
+    sweeps = {key: valid[key] for key in ('safety', 'carbon', 'scenarios_2024')}
+    tasks = []
+
     # 1. Tornado analysis (replaces sensitivity matrix)
-    plot_tornado_analysis(data, output_path, suffix)
+    tasks.append((plot_tornado_analysis, sweeps, 'tornado_analysis.png'))
 
     # 2. Safety Pareto frontier
     if not data['safety'].empty:
-        plot_safety_pareto_frontier(data['safety'], output_path, suffix)
+        tasks.append((plot_safety_pareto_frontier, valid['safety'], 'safety_pareto_frontier.png'))
 
     # 3. Mandatory methodology charts (1–5)
     if not data['safety'].empty:
-        plot_cost_vs_safety_threshold(data['safety'], output_path, suffix)
-        plot_cost_breakdown_vs_safety(data['safety'], output_path, suffix)
-        plot_emissions_vs_safety_threshold(data['safety'], output_path, suffix)
+        tasks.append((plot_cost_vs_safety_threshold, valid['safety'], 'cost_vs_safety_threshold.png'))
+        tasks.append((plot_cost_breakdown_vs_safety, valid['safety'], 'cost_breakdown_vs_safety.png'))
+        tasks.append((plot_emissions_vs_safety_threshold, valid['safety'], 'emissions_vs_safety_threshold.png'))
     if not data['carbon'].empty:
-        plot_carbon_price_sensitivity(data['carbon'], output_path, suffix)
-        plot_fuel_mix_vs_carbon_price(data['carbon'], output_path, suffix)
-    plot_macc(data, output_path, suffix)
+        tasks.append((plot_carbon_price_sensitivity, valid['carbon'], 'carbon_price_sensitivity.png'))
+        tasks.append((plot_fuel_mix_vs_carbon_price, valid['carbon'], 'fuel_mix_vs_carbon_price.png'))
+    tasks.append((plot_macc, {key: valid[key] for key in ('base_case', 'safety')}, 'macc.png'))
 
     # 4. 2024 scenarios
     if not data['scenarios_2024'].empty:
-        plot_2024_scenario_comparison(data['scenarios_2024'], output_path, suffix)
+        tasks.append((plot_2024_scenario_comparison, data['scenarios_2024'], '2024_scenario_comparison.png'))
 
     # 5. Summary dashboard
-    plot_combined_summary(data, output_path, suffix)
+    tasks.append((plot_combined_summary, sweeps, 'summary_dashboard.png'))
+
+    # Skip charts already drawn from identical inputs
+    manifest_path = output_path / _PLOT_CACHE
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    # Plotting code, resolution, library or style changes invalidate every
+    # recorded signature
+    salt = _code_salt()
+    pending = []
+    for plot, plot_data, base_name in tasks:
+        out = _suffix_path(output_path, base_name, suffix, fmt)
+        sig = _data_signature(plot_data, salt)
+        if not force and manifest.get(out.name) == sig and out.exists():
+            print(f"Unchanged: {out}")
+            continue
+        mtime = out.stat().st_mtime_ns if out.exists() else None
+        pending.append((plot, plot_data, out, sig, mtime))
+
+    if max_workers is None:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+    if max_workers <= 1:
+        for plot, plot_data, *_ in pending:
+            plot(plot_data, output_path, suffix, fmt)
+    else:
+        # Import and style matplotlib before forking, so workers inherit it
+        _ensure_mpl()
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(plot, plot_data, output_path, suffix, fmt) for plot, plot_data, *_ in pending]
+            for future in futures:
+                future.result()
+
+    # Record only charts written on this pass (a plot with no valid rows
+    # prints a message and leaves any older PNG untouched)
+    for _, _, out, sig, mtime in pending:
+        if out.exists() and out.stat().st_mtime_ns != mtime:
+            manifest[out.name] = sig
+        else:
+            manifest.pop(out.name, None)
+    if pending:
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
 
     print(f"\nAll visualizations saved to {output_path}")
 
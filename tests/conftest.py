@@ -0,0 +1,75 @@
+"""Shared fixtures: checkpoint vessels parsed, and MILP fleets solved, once per session."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data_adapter import load_per_vessel
+from src.optimization import select_fleet_milp, select_fleet_minmax_milp
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "checkpoint_vessels.csv"
+
+
+@pytest.fixture(scope="session")
+def _vessels_raw() -> pd.DataFrame:
+    """Loaded like production per_vessel.csv (categorical main_engine_fuel_type)."""
+    return load_per_vessel(FIXTURE_PATH)
+
+
+@pytest.fixture
+def vessels(_vessels_raw) -> pd.DataFrame:
+    """The 5 checkpoint vessels from test fixtures (a fresh copy per test)."""
+    return _vessels_raw.copy()
+
+
+@pytest.fixture(scope="session")
+def vessels_by_id(_vessels_raw) -> pd.DataFrame:
+    """Read-only checkpoint vessels indexed by vessel_id."""
+    return _vessels_raw.set_index("vessel_id")
+
+
+@pytest.fixture(scope="session")
+def solve_milp(_vessels_raw):
+    """select_fleet_milp on the checkpoint vessels, solved once per argument set."""
+    cache: dict[tuple, tuple[int, ...]] = {}
+
+    def _solve(cargo_demand, min_avg_safety, require_all_fuel_types):
+        key = (cargo_demand, min_avg_safety, require_all_fuel_types)
+        if key not in cache:
+            cache[key] = tuple(select_fleet_milp(
+                _vessels_raw,
+                cargo_demand=cargo_demand,
+                min_avg_safety=min_avg_safety,
+                require_all_fuel_types=require_all_fuel_types,
+            ))
+        return list(cache[key])
+
+    return _solve
+
+
+@pytest.fixture(scope="session")
+def solve_minmax(_vessels_raw):
+    """select_fleet_minmax_milp on the checkpoint vessels, solved once per argument set."""
+    cache: dict[tuple, tuple[list[int], float | None]] = {}
+
+    def _solve(scenarios, cargo_demand, require_all_fuel_types):
+        key = (
+            tuple(sorted((name, tuple(sorted(params.items()))) for name, params in scenarios.items())),
+            cargo_demand,
+            require_all_fuel_types,
+        )
+        if key not in cache:
+            cache[key] = select_fleet_minmax_milp(
+                _vessels_raw,
+                scenarios=scenarios,
+                cargo_demand=cargo_demand,
+                require_all_fuel_types=require_all_fuel_types,
+            )
+        selected, z_value = cache[key]
+        return list(selected), z_value
+
+    return _solve
@@ -0,0 +1,46 @@
+"""Tests for src/constants.py lookup helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.constants import (
+    get_base_capex_millions,
+    get_base_capex_millions_array,
+    get_monthly_capex,
+    get_monthly_capex_array,
+    get_safety_adjustment_rates,
+)
+
+
+@pytest.mark.parametrize("dwt,expected", [
+    (10_000, 35), (40_000, 35), (40_001, 53), (55_000, 53), (55_001, 80),
+    (80_000, 80), (80_001, 78), (120_000, 78), (120_001, 90), (300_000, 90),
+])
+def test_base_capex_bracket_edges(dwt, expected):
+    assert get_base_capex_millions(dwt) == expected
+
+
+def test_base_capex_below_range_raises():
+    with pytest.raises(ValueError, match="out of range"):
+        get_base_capex_millions(9_999)
+    with pytest.raises(ValueError, match="out of range"):
+        get_base_capex_millions_array(np.array([50_000, 9_999]))
+    with pytest.raises(ValueError, match="out of range"):
+        get_base_capex_millions(float("nan"))
+    with pytest.raises(ValueError, match="nan out of range"):
+        get_base_capex_millions_array(np.array([50_000.0, np.nan]))
+
+
+def test_monthly_capex_array_matches_scalar():
+    dwt = np.array([10_000, 40_001, 80_000, 150_000])
+    fuels = pd.Series(["DISTILLATE FUEL", "LNG", "Methanol", "Hydrogen"])
+    expected = [get_monthly_capex(d, f) for d, f in zip(dwt, fuels)]
+    assert get_monthly_capex_array(dwt, fuels).tolist() == expected
+
+
+def test_safety_adjustment_rates_reject_invalid_scores():
+    assert get_safety_adjustment_rates(np.array([1, 3, 5])).tolist() == [0.10, 0.0, -0.05]
+    for scores in ([3, 0], [6], [2.5], [np.nan]):
+        with pytest.raises(ValueError, match="Safety scores must be 1-5"):
+            get_safety_adjustment_rates(np.array(scores))
@@ -2,9 +2,6 @@
 Tests for src/data_adapter.py — per_vessel.csv loading and validation.
 """
 
-import tempfile
-from pathlib import Path
-
 import pandas as pd
 import pytest
 
@@ -19,9 +16,9 @@ FIXTURE_PATH = project_root() / "tests" / "fixtures" / "checkpoint_vessels.csv"
 
 
 @pytest.fixture
-def fixture_df() -> pd.DataFrame:
-    """Load the checkpoint vessels fixture directly."""
-    return pd.read_csv(FIXTURE_PATH)
+def fixture_df(vessels) -> pd.DataFrame:
+    """The checkpoint vessels fixture, read directly (see conftest.py)."""
+    return vessels
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +40,14 @@ def test_loaded_df_has_all_required_columns():
         assert col in df.columns, f"Missing column: {col}"
 
 
+def test_fuel_type_loaded_as_category():
+    """main_engine_fuel_type is categorical with no unused categories."""
+    df = load_per_vessel(FIXTURE_PATH)
+    fuel = df["main_engine_fuel_type"]
+    assert isinstance(fuel.dtype, pd.CategoricalDtype)
+    assert set(fuel.cat.categories) == set(fuel)
+
+
 def test_checkpoint_vessel_final_cost():
     """Vessel 10102950 (DISTILLATE FUEL) has final_cost close to $880,688."""
     df = load_per_vessel()
@@ -59,12 +64,13 @@ def test_validate_fixture_returns_expected_errors(fixture_df):
     """5-row fixture should fail production checks (108 rows, 8 fuels, DWT)."""
     ok, errors = validate_per_vessel(fixture_df)
     assert not ok, "5-row fixture should not pass production validation"
+    report = "\n".join(errors)
     # Must flag row count
-    assert any("108" in e for e in errors), f"Expected row-count error, got: {errors}"
+    assert "108" in report, f"Expected row-count error, got: {errors}"
     # Must flag fuel type count
-    assert any("fuel type" in e.lower() for e in errors), f"Expected fuel-type error, got: {errors}"
+    assert "fuel type" in report.lower(), f"Expected fuel-type error, got: {errors}"
     # Must flag DWT sum
-    assert any("DWT" in e for e in errors), f"Expected DWT error, got: {errors}"
+    assert "DWT" in report, f"Expected DWT error, got: {errors}"
 
 
 # ---------------------------------------------------------------------------
@@ -72,17 +78,11 @@ def test_validate_fixture_returns_expected_errors(fixture_df):
 # ---------------------------------------------------------------------------
 
 
-def test_load_raises_on_missing_columns():
+def test_load_raises_on_missing_columns(tmp_path):
     """load_per_vessel raises ValueError when required columns are absent."""
     # Create a CSV missing most columns
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".csv", delete=False
-    ) as tmp:
-        tmp.write("vessel_id,dwt\n")
-        tmp.write("123,50000\n")
-        tmp_path = tmp.name
+    csv_path = tmp_path / "bad.csv"
+    csv_path.write_text("vessel_id,dwt\n123,50000\n")
 
     with pytest.raises(ValueError, match="Missing required columns"):
-        load_per_vessel(path=tmp_path)
-
-    Path(tmp_path).unlink(missing_ok=True)
+        load_per_vessel(path=csv_path)
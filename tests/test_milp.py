@@ -1,22 +1,12 @@
 """Tests for select_fleet_milp() — the binary MILP fleet selector."""
 
-import sys
-from pathlib import Path
+import os
 
-import pandas as pd
 import pytest
+from pulp import HiGHS, PULP_CBC_CMD
 
-# Add project root for imports
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from src.optimization import select_fleet_milp
-
-
-@pytest.fixture
-def vessels():
-    """Load the 5 checkpoint vessels from test fixtures."""
-    csv_path = Path(__file__).parent / "fixtures" / "checkpoint_vessels.csv"
-    return pd.read_csv(csv_path)
+import src.optimization as optimization
+from src.optimization import build_fleet_model, default_solver, select_fleet_milp, solve_fleet_model
 
 
 # Vessel reference:
@@ -31,111 +21,140 @@ ALL_IDS = sorted([10102950, 10657280, 10791900, 10522650, 10673120])
 
 
 class TestAllVesselsWhenDemandRequiresIt:
-    def test_selects_all_five_when_demand_equals_total_dwt(self, vessels):
+    def test_selects_all_five_when_demand_equals_total_dwt(self, solve_milp):
         """With demand=855421 (total DWT), all 5 must be selected."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=855_421,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
+        result = solve_milp(cargo_demand=855_421, min_avg_safety=1.0, require_all_fuel_types=False)
         assert sorted(result) == ALL_IDS
 
-    def test_total_cost_is_sum_of_all(self, vessels):
+    def test_total_cost_is_sum_of_all(self, vessels_by_id, solve_milp):
         """When all 5 selected, total cost = 5,526,543."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=855_421,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
-        selected = vessels[vessels["vessel_id"].isin(result)]
-        assert selected["final_cost"].sum() == 5_526_543
+        result = solve_milp(cargo_demand=855_421, min_avg_safety=1.0, require_all_fuel_types=False)
+        assert vessels_by_id.loc[result, "final_cost"].sum() == 5_526_543
 
 
 class TestDWTConstraint:
-    def test_drops_methanol_to_minimize_cost(self, vessels):
+    def test_drops_methanol_to_minimize_cost(self, solve_milp):
         """With demand=700000, optimal is to drop Methanol (cheapest removable)."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=700_000,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
+        result = solve_milp(cargo_demand=700_000, min_avg_safety=1.0, require_all_fuel_types=False)
         expected = sorted([10102950, 10657280, 10791900, 10673120])
         assert sorted(result) == expected
 
-    def test_cost_without_methanol(self, vessels):
+    def test_cost_without_methanol(self, vessels_by_id, solve_milp):
         """Dropping Methanol gives cost = 4,370,409."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=700_000,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
-        selected = vessels[vessels["vessel_id"].isin(result)]
-        assert selected["final_cost"].sum() == 4_370_409
+        result = solve_milp(cargo_demand=700_000, min_avg_safety=1.0, require_all_fuel_types=False)
+        assert vessels_by_id.loc[result, "final_cost"].sum() == 4_370_409
 
 
 class TestSafetyConstraint:
-    def test_cheapest_combo_meeting_safety(self, vessels):
+    def test_cheapest_combo_meeting_safety(self, solve_milp):
         """With demand=500000, safety>=3.0: cheapest is {Distillate, LNG, Hydrogen}.
         DWT: 175108+179700+178838=533646 >= 500000
         Safety: (1-3)+(5-3)+(3-3) = 0 >= 0
         Cost: 880688+1043965+1185540 = 3,110,193
         """
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=500_000,
-            min_avg_safety=3.0,
-            require_all_fuel_types=False,
-        )
+        result = solve_milp(cargo_demand=500_000, min_avg_safety=3.0, require_all_fuel_types=False)
         expected = sorted([10102950, 10791900, 10673120])
         assert sorted(result) == expected
 
-    def test_safety_combo_cost(self, vessels):
+    def test_safety_combo_cost(self, vessels_by_id, solve_milp):
         """Cheapest safety-valid combo costs $3,110,193."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=500_000,
-            min_avg_safety=3.0,
-            require_all_fuel_types=False,
-        )
-        selected = vessels[vessels["vessel_id"].isin(result)]
-        assert selected["final_cost"].sum() == 3_110_193
+        result = solve_milp(cargo_demand=500_000, min_avg_safety=3.0, require_all_fuel_types=False)
+        assert vessels_by_id.loc[result, "final_cost"].sum() == 3_110_193
 
 
 class TestFuelDiversityConstraint:
-    def test_all_fuel_types_forces_all_selected(self, vessels):
+    def test_all_fuel_types_forces_all_selected(self, solve_milp):
         """With require_all_fuel_types=True, must include all 5 fuel types → all 5 vessels."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=500_000,
-            min_avg_safety=1.0,
-            require_all_fuel_types=True,
-        )
+        result = solve_milp(cargo_demand=500_000, min_avg_safety=1.0, require_all_fuel_types=True)
         assert sorted(result) == ALL_IDS
 
 
 class TestInfeasible:
-    def test_returns_empty_on_impossible_demand(self, vessels):
+    def test_returns_empty_on_impossible_demand(self, solve_milp):
         """Demand=999,999,999 is impossible → empty list."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=999_999_999,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
+        result = solve_milp(cargo_demand=999_999_999, min_avg_safety=1.0, require_all_fuel_types=False)
         assert result == []
 
 
 class TestDeterminism:
-    def test_returns_sorted_ids(self, vessels):
+    def test_returns_sorted_ids(self, solve_milp):
         """Output vessel IDs should be sorted for deterministic output."""
-        result = select_fleet_milp(
-            vessels,
-            cargo_demand=500_000,
-            min_avg_safety=1.0,
-            require_all_fuel_types=False,
-        )
+        result = solve_milp(cargo_demand=500_000, min_avg_safety=1.0, require_all_fuel_types=False)
         assert result == sorted(result)
+
+
+class TestSolverOptions:
+    def test_threads_and_zero_gap_match_default(self, vessels):
+        """Explicit solver settings with a zero gap keep the proven optimum."""
+        kwargs = dict(cargo_demand=500_000, min_avg_safety=3.0, require_all_fuel_types=False)
+        result = select_fleet_milp(vessels, threads=2, gap_rel=0.0, time_limit=30, **kwargs)
+        assert result == select_fleet_milp(vessels, **kwargs)
+
+    @pytest.mark.parametrize("solver_name", ["cbc", "highs"])
+    def test_solver_name_matches_default(self, vessels, solver_name):
+        """Pinning a backend (HiGHS falls back to CBC without highspy) keeps the optimum."""
+        kwargs = dict(cargo_demand=700_000, min_avg_safety=1.0, require_all_fuel_types=False)
+        assert select_fleet_milp(vessels, solver_name=solver_name, **kwargs) == select_fleet_milp(vessels, **kwargs)
+
+    def test_unknown_solver_name_raises(self, vessels):
+        with pytest.raises(ValueError):
+            select_fleet_milp(vessels, cargo_demand=500_000, solver_name="glpk")
+
+    def test_missing_highs_warns_and_uses_cbc(self, monkeypatch):
+        default_solver.cache_clear()
+        monkeypatch.setattr(optimization, "_HIGHS_AVAILABLE", False)
+        with pytest.warns(UserWarning, match="highspy"):
+            solver = default_solver(solver_name="highs")
+        default_solver.cache_clear()
+        assert isinstance(solver, PULP_CBC_CMD)
+
+    def test_default_solver_is_shared_per_setting(self):
+        assert default_solver() is default_solver()
+        assert default_solver(warm_start=True) is not default_solver()
+
+
+@pytest.fixture
+def highs_available(monkeypatch):
+    """Pretend highspy is installed; default_solver's cache is reset around the test."""
+    default_solver.cache_clear()
+    monkeypatch.setattr(optimization, "_HIGHS_AVAILABLE", True)
+    yield
+    default_solver.cache_clear()
+
+
+class TestHiGHSBackend:
+    def test_cbc_stays_the_default(self, highs_available):
+        """HiGHS is opt-in; warm-started and cold solves share the CBC backend."""
+        assert isinstance(default_solver(), PULP_CBC_CMD)
+        solver = default_solver(warm_start=True)
+        assert isinstance(solver, PULP_CBC_CMD)
+        assert solver.optionsDict["warmStart"] is True
+
+    def test_highs_uses_all_cores_and_a_zero_gap(self, highs_available):
+        solver = default_solver(solver_name="highs")
+        assert isinstance(solver, HiGHS)
+        assert solver.optionsDict["threads"] == (os.cpu_count() or 1)
+        assert solver.optionsDict["gapRel"] == 0.0
+        assert isinstance(default_solver(warm_start=True, solver_name="highs"), HiGHS)
+
+    def test_highs_overrides_are_passed_through(self, highs_available):
+        solver = default_solver(threads=1, gap_rel=0.01, time_limit=30, solver_name="highs")
+        assert isinstance(solver, HiGHS)
+        assert solver.optionsDict["threads"] == 1
+        assert solver.optionsDict["gapRel"] == 0.01
+        assert solver.timeLimit == 30
+
+
+class TestFleetModelReuse:
+    def test_resolves_match_fresh_milp(self, vessels):
+        """One model re-solved across demand/safety/cost changes matches fresh solves."""
+        model = build_fleet_model(vessels, require_all_fuel_types=False)
+        for demand, safety in [(855_421, 1.0), (700_000, 1.0), (500_000, 3.0), (999_999_999, 1.0), (500_000, 3.0)]:
+            kwargs = dict(cargo_demand=demand, min_avg_safety=safety)
+            assert solve_fleet_model(model, **kwargs) == select_fleet_milp(
+                vessels, require_all_fuel_types=False, **kwargs
+            )
+        costs = vessels["final_cost"][::-1].to_numpy()
+        assert solve_fleet_model(model, 500_000, 3.0, costs=costs, warm_start=True) == select_fleet_milp(
+            vessels.assign(final_cost=costs), 500_000, 3.0, require_all_fuel_types=False
+        )
@@ -31,10 +31,48 @@ def test_validate_fleet_ok(sample_ships):
     assert len(errs) == 0
 
 
-def test_total_cost_and_metrics(sample_ships):
-    m = total_cost_and_metrics(sample_ships, [1, 2, 3])
+def test_metrics_lookup_by_vessel_id(sample_ships):
+    """Unknown ids are ignored and rows follow the frame, even after an in-place sort."""
+    assert total_cost_and_metrics(sample_ships, [1, 99])["total_dwt"] == 10000
+    reordered = sample_ships.iloc[::-1].reset_index(drop=True)
+    assert total_cost_and_metrics(reordered, [1])["total_cost_usd"] == 100
+    assert total_cost_and_metrics(sample_ships, [1])["total_cost_usd"] == 100
+    sample_ships.sort_values("final_cost", inplace=True)
+    assert total_cost_and_metrics(sample_ships, [1])["total_cost_usd"] == 100
+
+
+def test_validate_fleet_fuel_types_per_frame(sample_ships):
+    """Fuel types are read from the frame as it is now: subsets and in-place edits included."""
+    args = dict(cargo_demand_tonnes=0, min_avg_safety=1, require_all_fuel_types=True)
+    ok, errs = validate_fleet(sample_ships, [1, 2], **args)
+    assert not ok and errs == ["Missing main_engine_fuel_type: {'C'}"]
+    assert validate_fleet(sample_ships[sample_ships["vessel_id"] < 3], [1, 2], **args) == (True, [])
+    sample_ships["main_engine_fuel_type"] = ["A", "B", "B"]
+    assert validate_fleet(sample_ships, [1, 2], **args) == (True, [])
+
+
+def test_validate_fleet_fail_fast(sample_ships):
+    args = dict(cargo_demand_tonnes=30000, min_avg_safety=4.5, require_all_fuel_types=True)
+    ok, errs = validate_fleet(sample_ships, [1, 2], **args)
+    assert not ok and len(errs) == 3
+    ok, errs = validate_fleet(sample_ships, [1, 2], fail_fast=True, **args)
+    assert not ok
+    assert len(errs) == 1 and "DWT" in errs[0]
+
+
+@pytest.mark.parametrize(
+    "cols",
+    [("final_cost", "FC_total", "CO2eq"), ("total_cost_usd", "fuel_tonnes", "co2e_tonnes")],
+    ids=["per_vessel", "seed"],
+)
+def test_total_cost_and_metrics(sample_ships, cols):
+    """Same totals whether the frame uses per_vessel.csv or seed-data column names."""
+    ships = sample_ships.rename(columns=dict(zip(("final_cost", "FC_total", "CO2eq"), cols)))
+    m = total_cost_and_metrics(ships, [1, 2, 3], **dict(zip(("cost_col", "fuel_col", "co2e_col"), cols)))
     assert m["total_dwt"] == 45000
     assert m["total_cost_usd"] == 310
+    assert m["total_fuel_tonnes"] == 150
+    assert m["total_co2e_tonnes"] == 480
     assert m["fleet_size"] == 3
     assert m["num_unique_main_engine_fuel_types"] == 3
 
@@ -1,13 +1,7 @@
 """Tests for select_fleet_minmax_milp() — min-max robust fleet selector."""
 
-import sys
-from pathlib import Path
-
-import pandas as pd
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from src.optimization import (
     DEFAULT_ROBUST_SCENARIOS,
     build_scenario_cost_matrix,
@@ -17,13 +11,6 @@ from src.optimization import (
 )
 
 
-@pytest.fixture
-def vessels():
-    """Load the 5 checkpoint vessels from test fixtures."""
-    csv_path = Path(__file__).parent / "fixtures" / "checkpoint_vessels.csv"
-    return pd.read_csv(csv_path)
-
-
 # Scenario set feasible with 5-vessel fixture: max safety 1.0 so all 5 can be selected
 FEASIBLE_SCENARIOS = {
     "base": {"carbon_price": 80, "min_avg_safety": 1.0},
@@ -32,25 +19,15 @@ FEASIBLE_SCENARIOS = {
 
 
 class TestSelectFleetMinmaxMilp:
-    def test_returns_non_empty_sorted_ids_when_feasible(self, vessels):
+    def test_returns_non_empty_sorted_ids_when_feasible(self, solve_minmax):
         """With feasible scenarios and demand <= total DWT, returns non-empty sorted list."""
-        selected, z_value = select_fleet_minmax_milp(
-            vessels,
-            scenarios=FEASIBLE_SCENARIOS,
-            cargo_demand=855_421,
-            require_all_fuel_types=True,
-        )
+        selected, z_value = solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=855_421, require_all_fuel_types=True)
         assert len(selected) > 0
         assert selected == sorted(selected)
 
-    def test_validate_fleet_passes_for_strictest_scenario(self, vessels):
+    def test_validate_fleet_passes_for_strictest_scenario(self, vessels, solve_minmax):
         """Returned fleet satisfies constraints under the strictest scenario."""
-        selected, z_value = select_fleet_minmax_milp(
-            vessels,
-            scenarios=FEASIBLE_SCENARIOS,
-            cargo_demand=855_421,
-            require_all_fuel_types=True,
-        )
+        selected, z_value = solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=855_421, require_all_fuel_types=True)
         assert len(selected) > 0
         min_avg_safety_robust = max(
             s["min_avg_safety"] for s in FEASIBLE_SCENARIOS.values()
@@ -64,14 +41,9 @@ class TestSelectFleetMinmaxMilp:
         )
         assert ok, errors
 
-    def test_worst_case_cost_equals_z(self, vessels):
+    def test_worst_case_cost_equals_z(self, vessels, solve_minmax):
         """Max cost over scenarios equals (or is very close to) optimal Z."""
-        selected, z_value = select_fleet_minmax_milp(
-            vessels,
-            scenarios=FEASIBLE_SCENARIOS,
-            cargo_demand=855_421,
-            require_all_fuel_types=True,
-        )
+        selected, z_value = solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=855_421, require_all_fuel_types=True)
         assert len(selected) > 0
         assert z_value is not None
         cost_by_scenario = fleet_costs_by_scenario(
@@ -80,14 +52,9 @@ class TestSelectFleetMinmaxMilp:
         worst_cost = max(cost_by_scenario.values())
         assert abs(worst_cost - z_value) < 1.0
 
-    def test_returns_empty_and_none_when_infeasible(self, vessels):
+    def test_returns_empty_and_none_when_infeasible(self, solve_minmax):
         """When demand exceeds total DWT, returns ([], None)."""
-        selected, z_value = select_fleet_minmax_milp(
-            vessels,
-            scenarios=FEASIBLE_SCENARIOS,
-            cargo_demand=999_999_999,
-            require_all_fuel_types=False,
-        )
+        selected, z_value = solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=999_999_999, require_all_fuel_types=False)
         assert selected == []
         assert z_value is None
 
@@ -108,14 +75,9 @@ class TestBuildScenarioCostMatrix:
 
 
 class TestFleetCostsByScenario:
-    def test_matches_sum_of_cost_matrix_rows(self, vessels):
+    def test_matches_sum_of_cost_matrix_rows(self, vessels, solve_minmax):
         """Total cost by scenario equals sum of cost matrix for selected vessels."""
-        selected, _ = select_fleet_minmax_milp(
-            vessels,
-            scenarios=FEASIBLE_SCENARIOS,
-            cargo_demand=500_000,
-            require_all_fuel_types=False,
-        )
+        selected, _ = solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=500_000, require_all_fuel_types=False)
         if not selected:
             pytest.skip("infeasible with demand 500k")
         cost_by_scenario = fleet_costs_by_scenario(
@@ -126,3 +88,18 @@ class TestFleetCostsByScenario:
         for sname, total in cost_by_scenario.items():
             expected = matrix.loc[mask, sname].sum()
             assert abs(total - expected) < 1.0
+
+    def test_precomputed_cost_matrix_gives_same_result(self, vessels, solve_minmax):
+        """Passing the cost matrix in matches building it internally."""
+        matrix = build_scenario_cost_matrix(vessels, FEASIBLE_SCENARIOS)
+        selected, z_value = select_fleet_minmax_milp(
+            vessels,
+            scenarios=FEASIBLE_SCENARIOS,
+            cargo_demand=500_000,
+            require_all_fuel_types=False,
+            cost_matrix=matrix,
+        )
+        assert (selected, z_value) == solve_minmax(FEASIBLE_SCENARIOS, cargo_demand=500_000, require_all_fuel_types=False)
+        assert fleet_costs_by_scenario(
+            vessels, FEASIBLE_SCENARIOS, selected, cost_matrix=matrix
+        ) == fleet_costs_by_scenario(vessels, FEASIBLE_SCENARIOS, selected)
@@ -0,0 +1,19 @@
+"""Tests for src.seed_data cost estimates."""
+
+import pandas as pd
+import pytest
+
+from src.seed_data import compute_estimated_costs, generate_global_params, generate_seed_fleet
+
+
+def test_unknown_fuel_type_raises():
+    df = pd.DataFrame({"main_engine_fuel_type": ["LNG", "Unobtainium", "Plasma"]})
+    with pytest.raises(ValueError, match=r"\['Plasma', 'Unobtainium'\]"):
+        compute_estimated_costs(df, generate_global_params())
+
+
+def test_invalid_safety_score_raises():
+    df = generate_seed_fleet(n_vessels=3)
+    df.loc[0, "safety_score"] = 0
+    with pytest.raises(ValueError, match="Safety scores must be 1-5"):
+        compute_estimated_costs(df, generate_global_params())
@@ -0,0 +1,85 @@
+"""Tests for src.sensitivity sweeps."""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from src import sensitivity
+from src.sensitivity import (
+    compute_shadow_prices,
+    run_carbon_price_sweep,
+    run_diversity_whatif,
+    run_pareto_sweep,
+    run_safety_sweep,
+)
+
+
+class TestParallelSweeps:
+    def test_safety_sweep_pool_matches_in_process(self, vessels):
+        """Pooled independent solves give the same results as one re-solved model."""
+        kwargs = dict(thresholds=[1.0, 3.0, 4.5], cargo_demand=500_000)
+        pooled = run_safety_sweep(vessels, max_workers=2, **kwargs)
+        assert pooled == run_safety_sweep(vessels, max_workers=1, **kwargs)
+
+    def test_pareto_sweep_pool_matches_in_process(self, vessels):
+        kwargs = dict(n_points=4, cargo_demand=500_000, min_avg_safety=1.0, require_all_fuel_types=False)
+        pooled = run_pareto_sweep(vessels, max_workers=2, **kwargs)
+        assert pooled == run_pareto_sweep(vessels, max_workers=1, **kwargs)
+
+    def test_diversity_whatif_pool_matches_in_process(self, vessels):
+        kwargs = dict(cargo_demand=500_000, safety_threshold=3.0)
+        pooled = run_diversity_whatif(vessels, max_workers=2, **kwargs)
+        assert pooled == run_diversity_whatif(vessels, max_workers=1, **kwargs)
+        assert pooled["cost_savings"] < 0
+
+
+class TestMilpMemo:
+    @pytest.fixture
+    def solves(self, monkeypatch):
+        """Records the kwargs of every select_fleet_milp call made by the sweeps."""
+        calls = []
+        solve = sensitivity.select_fleet_milp
+
+        def counting_solve(df, **kwargs):
+            calls.append(kwargs)
+            return solve(df, **kwargs)
+
+        monkeypatch.setattr(sensitivity, "select_fleet_milp", counting_solve)
+        return calls
+
+    def test_repeated_points_are_solved_once(self, vessels, solves):
+        results = run_carbon_price_sweep(vessels, [80, 120, 80], cargo_demand=500_000, safety_threshold=1.0)
+        assert len(solves) == 2
+        assert results[0] == results[2]
+
+    def test_memo_does_not_outlive_the_call(self, vessels, solves):
+        for _ in range(2):
+            run_carbon_price_sweep(vessels, [80], cargo_demand=500_000, safety_threshold=1.0)
+        assert len(solves) == 2
+
+    def test_changed_costs_miss_the_memo(self, vessels):
+        fingerprint = sensitivity._frame_fingerprint(vessels)
+        cheaper = vessels.assign(final_cost=vessels["final_cost"] / 2)
+        job = {"cargo_demand": 500_000, "min_avg_safety": 1.0}
+        assert sensitivity._milp_cache_key(fingerprint, job) != sensitivity._milp_cache_key(
+            sensitivity._frame_fingerprint(cheaper), job
+        )
+
+    @pytest.mark.parametrize(
+        "setting", [{"solver_name": "highs"}, {"threads": 2}, {"gap_rel": 0.01}, {"time_limit": 30}]
+    )
+    def test_solver_settings_are_part_of_the_key(self, vessels, setting):
+        fingerprint = sensitivity._frame_fingerprint(vessels)
+        job = {"cargo_demand": 500_000, "min_avg_safety": 1.0}
+        assert sensitivity._milp_cache_key(fingerprint, job) != sensitivity._milp_cache_key(
+            fingerprint, {**job, **setting}
+        )
+
+
+def test_each_function_defined_once():
+    """No top-level function is shadowed by a later redefinition."""
+    tree = ast.parse(Path(sensitivity.__file__).read_text())
+    names = Counter(node.name for node in tree.body if isinstance(node, ast.FunctionDef))
+    assert [name for name, n in names.items() if n > 1] == []
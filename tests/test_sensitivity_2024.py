@@ -0,0 +1,130 @@
+"""Tests for src.sensitivity_2024 route-specific adjustments."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import sensitivity_2024
+from src.optimization import select_fleet_milp
+from src.sensitivity_2024 import (
+    add_port_congestion_fuel,
+    apply_cii_penalties,
+    calculate_cii,
+    calculate_cii_array,
+    format_sensitivity_summary,
+    get_cii_rating,
+    run_2024_scenario,
+    run_comprehensive_sensitivity,
+)
+
+
+@pytest.fixture
+def seed_vessels():
+    """Seed fleet in the legacy (total_cost_usd / co2e_tonnes) schema."""
+    return pd.read_csv(Path(__file__).resolve().parent.parent / "data" / "seed" / "seed_vessels.csv")
+
+
+class TestCII:
+    def test_array_matches_scalar(self):
+        co2 = np.array([12_577.5, 100.0, 100.0, 0.0])
+        dwt = np.array([206_596, 0, 50_000, 80_000])
+        expected = [calculate_cii(c, d) for c, d in zip(co2, dwt)]
+        assert calculate_cii_array(co2, dwt).tolist() == expected
+        assert expected[1] == 0.0
+
+    def test_non_positive_distance_gives_zero(self):
+        assert calculate_cii(100.0, 50_000, distance_nm=0) == 0.0
+
+    def test_rating_band_edges(self):
+        values = [0.0, 3.5, 3.51, 4.5, 5.5, 6.5, 6.51, float("nan")]
+        expected = ["A", "A", "B", "B", "C", "D", "E", "E"]
+        assert [get_cii_rating(v) for v in values] == expected
+        assert get_cii_rating(np.array(values)).tolist() == expected
+
+    def test_ratings_are_ordered_categorical(self, seed_vessels):
+        ratings = apply_cii_penalties(seed_vessels)["CII_rating"]
+        assert list(ratings.cat.categories) == ["A", "B", "C", "D", "E"] and ratings.cat.ordered
+        assert ratings.astype(str).tolist() == [get_cii_rating(v) for v in calculate_cii_array(
+            seed_vessels["co2e_tonnes"], seed_vessels["dwt"]
+        )]
+
+    def test_penalties_follow_rating_bands(self, seed_vessels):
+        out = apply_cii_penalties(seed_vessels)
+        expected = out["CII"].map(
+            lambda v: 0.95 if v <= 3.5 else 0.98 if v <= 4.5 else 1.0 if v <= 5.5 else 1.05 if v <= 6.5 else 1.10
+        )
+        assert out["CII_penalty_multiplier"].tolist() == expected.tolist()
+        assert out["CII"].iloc[0] == calculate_cii(seed_vessels["co2e_tonnes"].iloc[0], seed_vessels["dwt"].iloc[0])
+
+
+class TestPortCongestion:
+    def test_adds_aux_fuel_and_distillate_co2(self, seed_vessels):
+        out = add_port_congestion_fuel(seed_vessels, congestion_hours=48, aux_load_factor=0.5)
+        added = (seed_vessels["ael"] * seed_vessels["sfc_ae"] + seed_vessels["abl"] * seed_vessels["sfc_ab"]) * 24 / 1e6
+        np.testing.assert_allclose(out["fuel_tonnes"] - seed_vessels["fuel_tonnes"], added)
+        np.testing.assert_allclose(out["co2e_tonnes"] - seed_vessels["co2e_tonnes"], added * 3.206)
+        assert list(out.columns) == list(seed_vessels.columns)
+
+
+class TestScenario2024:
+    def test_input_frame_is_not_modified(self, seed_vessels):
+        before = seed_vessels.copy()
+        config = {"name": "Stress", "fuel_price_multiplier": 1.10, "congestion_hours": 72, "cii_enforcement": True}
+        result = run_2024_scenario(seed_vessels, 1_000_000, 3.0, config, require_all_fuel_types=False)
+        assert result["error"] is None and result["selected_vessel_ids"]
+        pd.testing.assert_frame_equal(seed_vessels, before)
+
+
+class TestComprehensiveSensitivity:
+    def test_pool_matches_in_process(self, seed_vessels):
+        """Carbon price and 2024 scenario runs give the same results in a pool."""
+        kwargs = dict(cargo_demand_tonnes=1_000_000, base_min_safety=3.0, require_all_fuel_types=False)
+        pooled = run_comprehensive_sensitivity(seed_vessels, max_workers=2, **kwargs)
+        assert pooled == run_comprehensive_sensitivity(seed_vessels, max_workers=1, **kwargs)
+        assert [r["carbon_price"] for r in pooled["carbon_price_sensitivity"]] == [80, 120, 160, 200]
+
+    @pytest.mark.parametrize("demand", [2_000_000, 999_999_999])
+    def test_safety_sweep_matches_fresh_milp(self, seed_vessels, demand):
+        """Reusing a lower threshold's fleet (or infeasibility) matches solving each threshold."""
+        out = run_comprehensive_sensitivity(seed_vessels, demand, 3.0, require_all_fuel_types=False, max_workers=1)
+        df_milp = seed_vessels.assign(final_cost=seed_vessels["total_cost_usd"], CO2eq=seed_vessels["co2e_tonnes"])
+        for r in out["safety_sensitivity"]:
+            expected = select_fleet_milp(df_milp, demand, r["threshold"], require_all_fuel_types=False)
+            assert r.get("selected_vessel_ids", []) == expected
+
+    def test_failed_solve_rebuilds_the_model(self, seed_vessels, monkeypatch):
+        """A solver error is reported for its threshold; the next one gets a fresh model."""
+        models = []
+        solve = sensitivity_2024.solve_fleet_model
+
+        def failing_first_solve(model, **kwargs):
+            models.append(model)
+            if len(models) == 1:
+                raise RuntimeError("solver crashed")
+            return solve(model, **kwargs)
+
+        monkeypatch.setattr(sensitivity_2024, "solve_fleet_model", failing_first_solve)
+        out = run_comprehensive_sensitivity(seed_vessels, 2_000_000, 3.0, require_all_fuel_types=False, max_workers=1)
+        assert out["safety_sensitivity"][0] == {"threshold": 2.5, "error": "solver crashed", "metrics": None}
+        assert models[1] is not models[0]
+        df_milp = seed_vessels.assign(final_cost=seed_vessels["total_cost_usd"], CO2eq=seed_vessels["co2e_tonnes"])
+        for r in out["safety_sensitivity"][1:]:
+            assert r["selected_vessel_ids"] == select_fleet_milp(df_milp, 2_000_000, r["threshold"], require_all_fuel_types=False)
+
+    def test_summary_lists_failed_and_solved_runs(self):
+        metrics = {"fleet_size": 3, "total_cost_usd": 1_234_567.4, "total_co2e_tonnes": 8_910.6}
+        results = {
+            "base_case": None,
+            "safety_sensitivity": [
+                {"threshold": 3.0, "metrics": metrics, "error": None},
+                {"threshold": 4.5, "metrics": None, "error": "Infeasible"},
+            ],
+            "carbon_price_sensitivity": [{"carbon_price": 80, "metrics": None, "error": "boom"}],
+            "scenarios_2024": [],
+        }
+        summary = format_sensitivity_summary(results)
+        assert "  Safety ≥ 3.0: Fleet 3, Cost $1,234,567, CO2eq 8,911t" in summary
+        assert "  Safety ≥ 4.5: INFEASIBLE - Infeasible" in summary
+        assert "  $80/tCO2eq: FAILED - boom" in summary
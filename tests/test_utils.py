@@ -0,0 +1,13 @@
+"""Tests for src.utils voyage time helpers."""
+
+import numpy as np
+
+from src.utils import voyage_hours_array, voyage_hours_from_nm_and_speed
+
+
+def test_voyage_hours_array_matches_scalar():
+    distance = np.array([2100.0, 2100.0, 1762.0, 1762.0])
+    speed = np.array([12.0, 0.0, -1.0, 14.5])
+    expected = [voyage_hours_from_nm_and_speed(d, s) for d, s in zip(distance, speed)]
+    assert voyage_hours_array(distance, speed).tolist() == expected
+    assert expected == [175.0, 0.0, 0.0, 1762.0 / 14.5]
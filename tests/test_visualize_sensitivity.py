@@ -0,0 +1,162 @@
+"""Tests for src.visualize_sensitivity result loading."""
+
+import functools
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src import visualize_sensitivity
+from src.visualize_sensitivity import generate_all_visualizations, load_sensitivity_results
+
+
+def _write_safety(results_dir: Path, cost: float, mtime_ns: int) -> None:
+    path = results_dir / "safety_sensitivity.csv"
+    pd.DataFrame({"safety_threshold": [3.0], "total_cost_usd": [cost], "total_dwt": [1]}).to_csv(path, index=False)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _write_results(results_dir: Path, safety_costs=(2.0e7, 2.2e7)) -> None:
+    pd.DataFrame({
+        "safety_threshold": [3.0, 4.0],
+        "total_cost_usd": list(safety_costs),
+        "total_co2e_tonnes": [1.2e4, 1.1e4],
+        "fleet_size": [20, 22],
+        "avg_safety_score": [3.2, 4.1],
+    }).to_csv(results_dir / "safety_sensitivity.csv", index=False)
+    pd.DataFrame({"total_cost_usd": [2.0e7], "total_co2e_tonnes": [1.2e4]}).to_csv(
+        results_dir / "base_case.csv", index=False
+    )
+    pd.DataFrame({
+        "carbon_price_usd_per_tco2e": [80, 160],
+        "total_cost_usd": [2.0e7, 2.1e7],
+        "total_co2e_tonnes": [1.2e4, 1.1e4],
+        "fleet_size": [20, 20],
+        "avg_safety_score": [3.2, 3.2],
+    }).to_csv(results_dir / "carbon_price_sensitivity.csv", index=False)
+
+
+class TestLoadSensitivityResults:
+    def test_reloads_only_after_csv_changes(self, tmp_path):
+        _write_safety(tmp_path, 1.0, 1_000_000_000)
+        first = load_sensitivity_results(str(tmp_path))
+        assert first["safety"]["total_cost_usd"].tolist() == [1.0]
+        assert "total_dwt" in first["safety"].columns
+        assert first["carbon"].empty
+
+        first["safety"].loc[0, "total_cost_usd"] = -1.0
+        assert load_sensitivity_results(str(tmp_path))["safety"]["total_cost_usd"].tolist() == [1.0]
+
+        _write_safety(tmp_path, 2.0, 2_000_000_000)
+        assert load_sensitivity_results(str(tmp_path))["safety"]["total_cost_usd"].tolist() == [2.0]
+
+    def test_plots_read_only_their_columns(self, tmp_path):
+        _write_safety(tmp_path, 1.0, 1_000_000_000)
+        safety = visualize_sensitivity._load_results(str(tmp_path), plot_columns_only=True)["safety"]
+        assert list(safety.columns) == ["safety_threshold", "total_cost_usd"]
+
+
+# Chart still drawn by matplotlib in TestGenerateAllVisualizations; the rest
+# are stubbed so the pool, signature and format logic is tested cheaply.
+_RENDERED_CHARTS = {"plot_tornado_analysis"}
+
+
+def _stub_chart(name, data, output_path, suffix="", fmt="png"):
+    out = Path(output_path) / f"{name}{suffix}.{fmt}"
+    out.write_text(name)
+    print(f"Saved: {out}")
+
+
+@pytest.fixture
+def few_charts(monkeypatch):
+    """Replace every plot_* function except _RENDERED_CHARTS with a file-writing stub."""
+    for attr in dir(visualize_sensitivity):
+        if attr.startswith("plot_") and attr not in _RENDERED_CHARTS:
+            stub = functools.partial(_stub_chart, attr.removeprefix("plot_"))
+            monkeypatch.setattr(visualize_sensitivity, attr, stub)
+
+
+@pytest.mark.usefixtures("few_charts")
+class TestGenerateAllVisualizations:
+    def test_pool_writes_same_charts_as_in_process(self, tmp_path):
+        results = tmp_path / "results"
+        results.mkdir()
+        _write_results(results)
+
+        written = {}
+        for workers in (1, 2):
+            out = tmp_path / f"plots_{workers}"
+            generate_all_visualizations(str(results), output_dir=str(out), max_workers=workers)
+            written[workers] = sorted(p.name for p in out.iterdir())
+        assert written[1] == written[2]
+        assert "tornado_analysis.png" in written[1] and "macc.png" in written[1]
+
+    def test_skips_charts_with_unchanged_inputs(self, tmp_path, capsys):
+        results = tmp_path / "results"
+        results.mkdir()
+        _write_results(results)
+        out = tmp_path / "plots"
+        chart = out / "cost_vs_safety_threshold.png"
+
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1)
+        first = chart.stat().st_mtime_ns
+        capsys.readouterr()
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1)
+        assert f"Unchanged: {chart}" in capsys.readouterr().out
+        assert chart.stat().st_mtime_ns == first
+
+        _write_results(results, safety_costs=(2.0e7, 2.5e7))
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1)
+        printed = capsys.readouterr().out
+        assert f"Saved: {chart}" in printed
+        assert f"Unchanged: {out / 'carbon_price_sensitivity.png'}" in printed
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1, force=True)
+        assert f"Saved: {chart}" in capsys.readouterr().out
+
+    def test_resolution_change_redraws_charts(self, tmp_path, capsys, monkeypatch):
+        results = tmp_path / "results"
+        results.mkdir()
+        _write_results(results)
+        out = tmp_path / "plots"
+        chart = out / "cost_vs_safety_threshold.png"
+
+        generate_all_visualizations(str(results), output_dir=str(out))
+        capsys.readouterr()
+        monkeypatch.setattr(visualize_sensitivity, "SAVE_DPI", 100)
+        generate_all_visualizations(str(results), output_dir=str(out))
+        assert f"Saved: {chart}" in capsys.readouterr().out
+
+    def test_style_change_redraws_charts(self, tmp_path, capsys, monkeypatch):
+        results = tmp_path / "results"
+        results.mkdir()
+        _write_results(results)
+        out = tmp_path / "plots"
+        chart = out / "cost_vs_safety_threshold.png"
+
+        generate_all_visualizations(str(results), output_dir=str(out))
+        capsys.readouterr()
+        generate_all_visualizations(str(results), output_dir=str(out))
+        assert f"Unchanged: {chart}" in capsys.readouterr().out
+        monkeypatch.setitem(visualize_sensitivity.plt.rcParams, "font.size", 13.0)
+        generate_all_visualizations(str(results), output_dir=str(out))
+        assert f"Saved: {chart}" in capsys.readouterr().out
+
+    def test_svg_format_writes_reproducible_vector_charts(self, tmp_path):
+        results = tmp_path / "results"
+        results.mkdir()
+        _write_results(results)
+        out = tmp_path / "plots"
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1, fmt="svg")
+        charts = sorted(p.suffix for p in out.iterdir() if p.name != ".plotcache.json")
+        assert charts and set(charts) == {".svg"}
+        svg = (out / "tornado_analysis.svg").read_text()
+        assert svg.lstrip().startswith("<?xml")
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1, fmt="svg", force=True)
+        assert (out / "tornado_analysis.svg").read_text() == svg
+
+        generate_all_visualizations(str(results), output_dir=str(out), max_workers=1, fmt="pdf")
+        assert (out / "tornado_analysis.pdf").read_bytes().startswith(b"%PDF")
+
+        with pytest.raises(ValueError):
+            generate_all_visualizations(str(results), output_dir=str(out), fmt="jpg")